@@ -9,11 +9,15 @@ import json
 from pathlib import Path
 from typing import Any
 
-from agno.embedder.google import GeminiEmbedder
+from agno.embedder.base import Embedder
 from agno.knowledge.json import JSONKnowledgeBase
 from agno.vectordb.lancedb import LanceDb, SearchType
 from loguru import logger
 
+from ..knowledge.embedders import create_embedder
+from ..knowledge.embeddings import create_cached_embedder
+from ..knowledge.indexing import create_indexed_lancedb, ensure_indexes
+
 
 class JiraKnowledgeManager:
     """Manages Jira issues for RAG-based triage and retrieval."""
@@ -23,6 +27,7 @@ class JiraKnowledgeManager:
         data_path: Path | None = None,
         vector_db_path: Path | None = None,
         table_name: str = "jira_issues",
+        embedder: Embedder | None = None,
     ):
         """
         Initialize the manager and load/index Jira issues.
@@ -31,6 +36,7 @@ class JiraKnowledgeManager:
             data_path: Path to JSON file with Jira issues
             vector_db_path: Path for LanceDB vector storage
             table_name: Name of the LanceDB table
+            embedder: Embedder for issues and queries (default: knowledge.embedder setting), with embedding cache
         """
         if data_path is None:
             project_root = Path(__file__).parent.parent.parent.parent
@@ -40,6 +46,7 @@ class JiraKnowledgeManager:
         self.data_path = data_path
         self.vector_db_path = vector_db_path
         self.table_name = table_name
+        self.embedder = embedder
         self._issues: list[dict[str, Any]] = []
         self._vector_db: LanceDb | None = None
         self._knowledge: JSONKnowledgeBase | None = None
@@ -64,19 +71,18 @@ class JiraKnowledgeManager:
             self._issues = json.load(f)
         logger.info(f"Loaded {len(self._issues)} Jira issues.")
         # Index issues for semantic search
-        self._vector_db = LanceDb(
-            uri=str(self.vector_db_path),
-            table_name=self.table_name,
-            search_type=SearchType.hybrid,
-            embedder=GeminiEmbedder(),
-        )
+        vector_db = self.get_vector_db()
         self._knowledge = JSONKnowledgeBase(
             path=self.data_path,
-            vector_db=self.get_vector_db(),
+            vector_db=vector_db,
             num_documents=10,
         )
+        rows_before = vector_db.table.count_rows() if vector_db.exists() and vector_db.table is not None else 0
         if self._knowledge is not None:
             self._knowledge.load_document(path=self.data_path, recreate=recreate)
+        # Build or refresh the ANN and full-text indexes if rows were written
+        rows_after = vector_db.table.count_rows() if vector_db.table is not None else 0
+        ensure_indexes(vector_db, changed=recreate or rows_after != rows_before)
         self._loaded = True
         logger.debug("Jira issues indexed for semantic search.")
 
@@ -84,11 +90,13 @@ class JiraKnowledgeManager:
         """Get or create the LanceDB vector database instance."""
         if self._vector_db is None:
             logger.debug("Creating LanceDB vector database")
-            self._vector_db = LanceDb(
+            self._vector_db = create_indexed_lancedb(
                 uri=str(self.vector_db_path),
                 table_name=self.table_name,
                 search_type=SearchType.hybrid,
-                embedder=GeminiEmbedder(),
+                embedder=create_cached_embedder(
+                    self.embedder or create_embedder(gemini_model="gemini-embedding-exp-03-07"), self.vector_db_path
+                ),
             )
             logger.debug(f"LanceDB created: {self.vector_db_path}/{self.table_name}")
         return self._vector_db
@@ -8,25 +8,30 @@ and knowledge-related operations.
 from pathlib import Path
 from typing import Any
 
-from agno.tools.knowledge import KnowledgeTools
 from loguru import logger
 
-from ...knowledge import KnowledgeManager
+from ...knowledge import create_knowledge_manager
+from ...knowledge.search import RetrievalCache
+from ...tools.knowledge import FilteredKnowledgeTools
 
 
 class KnowledgeMixin:
     """Mixin for knowledge base management functionality."""
 
-    def __init__(self, *args, knowledge_path: Path | None = None, **kwargs):
+    def __init__(
+        self, *args, knowledge_path: Path | None = None, knowledge_filters: dict[str, Any] | None = None, **kwargs
+    ):
         """Initialize knowledge mixin.
 
         Args:
             knowledge_path: Path to knowledge documents directory
+            knowledge_filters: Metadata filters applied to every knowledge search (source, version, ...)
             *args: Passed to super().__init__()
             **kwargs: Passed to super().__init__()
         """
         super().__init__(*args, **kwargs)
-        self.knowledge_manager = KnowledgeManager(knowledge_path=knowledge_path)
+        self.knowledge_manager = create_knowledge_manager(knowledge_path=knowledge_path)
+        self.knowledge_filters = knowledge_filters
         self._knowledge: Any = None  # Will be loaded during setup
         logger.debug(f"KnowledgeMixin initialized: knowledge_path={knowledge_path}")
 
@@ -56,14 +61,17 @@ class KnowledgeMixin:
         self._knowledge = self.knowledge_manager.load_knowledge(recreate=recreate)
         return self._knowledge
 
-    def create_knowledge_tools(self, knowledge: Any | None = None) -> KnowledgeTools:
+    def create_knowledge_tools(self, knowledge: Any | None = None) -> FilteredKnowledgeTools:
         """Create and return configured KnowledgeTools.
 
+        The search tool accepts metadata filters and applies knowledge_filters
+        to every search.
+
         Args:
             knowledge: Knowledge base instance to use (uses self._knowledge if None)
 
         Returns:
-            Configured KnowledgeTools instance
+            Configured FilteredKnowledgeTools instance
 
         Raises:
             RuntimeError: If knowledge base is not loaded
@@ -72,8 +80,9 @@ class KnowledgeMixin:
         if knowledge_to_use is None:
             raise RuntimeError("Knowledge base not loaded. Call load_knowledge() first.")
 
-        return KnowledgeTools(
+        return FilteredKnowledgeTools(
             knowledge=knowledge_to_use,
+            default_filters=self.knowledge_filters,
             think=True,
             search=True,
             analyze=True,
@@ -81,6 +90,12 @@ class KnowledgeMixin:
             add_few_shot=True,
         )
 
+    def log_search_cache_stats(self) -> None:
+        """Log the search cache counters of the loaded knowledge base, if it was searched."""
+        cache = getattr(self._knowledge, "cache", None)
+        if isinstance(cache, RetrievalCache) and (cache.stats.hits or cache.stats.misses):
+            logger.info(f"Knowledge search cache: {cache.stats.summary()}")
+
     @property
     def knowledge(self) -> Any:
         """Get the loaded knowledge base.
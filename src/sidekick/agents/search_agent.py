@@ -29,6 +29,7 @@ class SearchAgent(KnowledgeMixin, StorageMixin, WorkspaceMixin, BaseAgentFactory
         workspace_dir: Path | None = None,
         user_id: str | None = None,
         memory: Any = None,
+        knowledge_filters: dict[str, Any] | None = None,
     ):
         """
         Initialize the search agent.
@@ -39,13 +40,18 @@ class SearchAgent(KnowledgeMixin, StorageMixin, WorkspaceMixin, BaseAgentFactory
             workspace_dir: Path to workspace directory for file operations
             user_id: Optional user ID for session management
             memory: Memory instance for user memory management
+            knowledge_filters: Metadata filters applied to every knowledge search (source, version, ...)
         """
         # Default storage path
         if storage_path is None:
             storage_path = self.get_default_storage_path("search")
 
         super().__init__(
-            storage_path=storage_path, workspace_dir=workspace_dir, knowledge_path=knowledge_path, memory=memory
+            storage_path=storage_path,
+            workspace_dir=workspace_dir,
+            knowledge_path=knowledge_path,
+            knowledge_filters=knowledge_filters,
+            memory=memory,
         )
 
         self.user_id = user_id
@@ -108,6 +114,11 @@ class SearchAgent(KnowledgeMixin, StorageMixin, WorkspaceMixin, BaseAgentFactory
         _ = context  # Unused parameter
         pass
 
+    async def cleanup(self) -> None:
+        """Report the knowledge search cache counters of the session and cleanup resources."""
+        self.log_search_cache_stats()
+        await super().cleanup()
+
     def create_agent(self, *args, **kwargs) -> Agent:
         """Create and return a configured Agno Agent with search capabilities.
 
@@ -97,6 +97,9 @@ def search(
         None,
         help="Initial message to send to the search agent",
     ),
+    source: str | None = typer.Option(None, "--source", "-s", help="Only search documents from this source"),
+    version: str | None = typer.Option(None, "--version", help="Only search documents tagged with this version"),
+    file_type: str | None = typer.Option(None, "--file-type", help="Only search documents of this type (md, pdf, csv)"),
 ) -> None:
     """
     Start an interactive chat session with the search agent.
@@ -109,6 +112,7 @@ def search(
         sidekick chat search
         sidekick chat search "Find documentation about API endpoints"
         sidekick chat search "Show me examples of error handling"
+        sidekick chat search --source gdrive --version 1.5 "What is planned for the release?"
     """
     logger.debug(f"Chat search called with message={message}")
 
@@ -117,7 +121,10 @@ def search(
             streaming_enabled = get_streaming_enabled()
             user_id = get_user_id()
             memory = create_memory_instance("search_agent_memory")
-            agent_factory = SearchAgent(memory=memory)
+            filters = {"source": source, "version": version, "file_type": file_type}
+            agent_factory = SearchAgent(
+                memory=memory, knowledge_filters={key: value for key, value in filters.items() if value} or None
+            )
             await run_agent_chat(agent_factory, message, streaming_enabled, user_id)
         except Exception as e:
             logger.error(f"Failed to run search chat: {e}")
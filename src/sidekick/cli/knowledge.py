@@ -1,5 +1,6 @@
 """Knowledge management CLI commands."""
 
+from enum import Enum
 from pathlib import Path
 from typing import Any
 
@@ -7,7 +8,6 @@ import typer
 from rich.console import Console
 
 from ..knowledge.config import KnowledgeConfig
-from ..knowledge.manifest import ManifestManager
 
 console = Console()
 
@@ -27,114 +27,134 @@ download_app = typer.Typer(
 knowledge_app.add_typer(download_app, name="download")
 
 
+class EmbedderBackend(str, Enum):
+    """Embedding backends selectable with --embedder."""
+
+    GEMINI = "gemini"
+    LOCAL = "local"
+    HASHING = "hashing"
+
+
+def _sync_table(statuses: list[Any]) -> Any:
+    """Render the progress of a sync run as a table."""
+    from rich.table import Table
+
+    styles = {"queued": "dim", "running": "cyan", "done": "green", "failed": "red"}
+    table = Table(show_edge=False, box=None, padding=(0, 2))
+    table.add_column("Source")
+    table.add_column("Type")
+    table.add_column("Status")
+    table.add_column("Downloaded", justify="right")
+    table.add_column("Unchanged", justify="right")
+    table.add_column("Removed", justify="right")
+    table.add_column("Time", justify="right")
+    for status in statuses:
+        style = styles[status.state]
+        table.add_row(
+            status.name,
+            status.type,
+            f"[{style}]{status.state}[/{style}]",
+            str(status.files_downloaded) if status.state == "done" else "",
+            str(status.files_unchanged) if status.state == "done" else "",
+            str(status.files_removed) if status.state == "done" else "",
+            f"{status.elapsed_seconds:.1f}s" if status.started_at is not None else "",
+        )
+    return table
+
+
 @knowledge_app.command()
 def sync(
-    source: str | None = typer.Option(None, "--source", "-s", help="Sync specific source by name"),
+    source: list[str] | None = typer.Option(
+        None, "--source", "-s", help="Sync specific source by name (repeat for several)"
+    ),
     config_file: Path = typer.Option(
         Path("knowledge/external/sources.yaml"), "--config", "-c", help="Path to configuration file"
     ),
     base_path: Path = typer.Option(
         Path("knowledge/external"), "--base-path", "-b", help="Base path for knowledge storage"
     ),
+    concurrency: int | None = typer.Option(
+        None,
+        "--concurrency",
+        "-j",
+        min=1,
+        help="Maximum sources of each type synced at once (default: knowledge.sync_concurrency setting)",
+    ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Continue interrupted web crawls from their checkpoints instead of starting over"
+    ),
 ):
     """Sync knowledge sources from configuration file.
 
-    This command reads the configuration file and syncs all configured sources.
+    This command reads the configuration file and syncs all configured sources concurrently,
+    with a limit on how many sources of each type (git, gdrive, web) run at once.
     Files that were previously downloaded but are no longer available will be removed.
 
     Examples:
         # Sync all sources (uses knowledge/external/sources.yaml → knowledge/external/ by default)
         sidekick knowledge sync
 
-        # Sync specific source
-        sidekick knowledge sync --source gdrive
+        # Sync specific sources
+        sidekick knowledge sync --source gdrive --source docs
+
+        # Sync one source at a time
+        sidekick knowledge sync --concurrency 1
+
+        # Continue a web crawl that was interrupted
+        sidekick knowledge sync --source docs --resume
 
         # Use custom config file and output path
         sidekick knowledge sync --config my-sources.yaml --base-path knowledge/my-project
     """
+    import asyncio
+
+    from rich.live import Live
+
+    from ..knowledge.sync import SourceSyncer
+
     try:
         # Load configuration
         config = KnowledgeConfig.load_from_file(config_file)
-        manifest_manager = ManifestManager(base_path)
 
-        # Filter sources if specific source requested
+        # Filter sources if specific sources requested
         sources_to_sync = config.sources
         if source:
-            source_config = config.get_source_by_name(source)
-            if not source_config:
-                console.print(f"[red]✗ Source '{source}' not found in configuration[/red]")
-                raise typer.Exit(1) from None
-            sources_to_sync = [source_config]
+            sources_to_sync = []
+            for name in source:
+                source_config = config.get_source_by_name(name)
+                if not source_config:
+                    console.print(f"[red]✗ Source '{name}' not found in configuration[/red]")
+                    raise typer.Exit(1) from None
+                sources_to_sync.append(source_config)
 
         console.print(f"[bold blue]Syncing {len(sources_to_sync)} source(s)...[/bold blue]")
 
-        # Track results
-        total_downloaded = 0
-        total_removed = 0
-        errors = []
-
-        # Sync each source
-        for source_config in sources_to_sync:
-            console.print(f"\n[cyan]Syncing {source_config.name} ({source_config.type})...[/cyan]")
-
-            try:
-                # Import and create appropriate source handler
-                source_handler: Any
-                if source_config.type == "gdrive":
-                    from ..knowledge.gdrive import GDriveSource
-
-                    source_handler = GDriveSource(source_config, base_path)
-                elif source_config.type == "git":
-                    from ..knowledge.git import GitSource
-
-                    source_handler = GitSource(source_config, base_path)
-                elif source_config.type == "web":
-                    from ..knowledge.web import WebSource
-
-                    source_handler = WebSource(source_config, base_path)
-                else:
-                    console.print(f"[red]✗ Unknown source type: {source_config.type}[/red]")  # type: ignore[unreachable]
-                    continue
-
-                # Get previous manifest
-                manifest = manifest_manager.get_manifest(source_config.name)
-
-                # Sync the source
-                result = source_handler.sync(manifest=manifest.model_dump() if manifest else None)
-
-                if result.success:
-                    # Handle cleanup
-                    removed_files = manifest_manager.sync_and_cleanup(source_config.name, result.files_downloaded)
-
-                    total_downloaded += len(result.files_downloaded)
-                    total_removed += len(removed_files)
-
-                    console.print(
-                        f"[green]✓ {source_config.name}: "
-                        f"{len(result.files_downloaded)} files downloaded, "
-                        f"{len(removed_files)} files removed[/green]"
-                    )
-                else:
-                    errors.extend(result.errors)
-                    console.print(f"[red]✗ {source_config.name}: Failed to sync[/red]")
-                    for error in result.errors:
-                        console.print(f"  [red]{error}[/red]")
-
-            except ImportError:
-                error_msg = f"{source_config.name}: Source type {source_config.type} not implemented yet"
-                errors.append(error_msg)
-                console.print(f"[yellow]⚠ {error_msg}[/yellow]")
-            except Exception as e:
-                error_msg = f"{source_config.name}: {str(e)}"
-                errors.append(error_msg)
-                console.print(f"[red]✗ {error_msg}[/red]")
+        limits: dict[str, int] | None = (
+            None if concurrency is None else {source.type: concurrency for source in sources_to_sync}
+        )
+        statuses: dict[str, Any] = {}
+
+        def track(status: Any) -> None:
+            statuses[status.name] = status
+
+        syncer = SourceSyncer(base_path, limits=limits, on_update=track, resume=resume)
+        with Live(console=console, get_renderable=lambda: _sync_table(list(statuses.values())), refresh_per_second=4):
+            summary = asyncio.run(syncer.sync(sources_to_sync))
+        console.print()
+
+        for status in summary.sources:
+            if status.state == "failed":
+                console.print(f"[red]✗ {status.name}: Failed to sync[/red]")
+            for error in status.errors:
+                console.print(f"  [red]{error}[/red]")
 
         # Summary
-        console.print("\n[bold]Sync Summary:[/bold]")
-        console.print(f"  Total files downloaded: {total_downloaded}")
-        console.print(f"  Total files removed: {total_removed}")
-        if errors:
-            console.print(f"  [red]Errors: {len(errors)}[/red]")
+        console.print(f"\n[bold]Sync Summary:[/bold] [dim]({summary.duration_seconds:.1f}s)[/dim]")
+        console.print(f"  Total files downloaded: {summary.files_downloaded}")
+        console.print(f"  Total files unchanged: {summary.files_unchanged}")
+        console.print(f"  Total files removed: {summary.files_removed}")
+        if summary.errors:
+            console.print(f"  [red]Errors: {len(summary.errors)}[/red]")
         else:
             console.print("  [green]No errors[/green]")
 
@@ -142,6 +162,8 @@ def sync(
         console.print(f"[red]✗ Configuration file not found: {config_file}[/red]")
         console.print("[dim]Create a sources.yaml file with your knowledge sources[/dim]")
         raise typer.Exit(1) from None
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"[red]✗ Sync failed: {e}[/red]")
         raise typer.Exit(1) from None
@@ -292,6 +314,29 @@ def download_web(
         raise typer.Exit(1) from None
 
 
+def _print_reindex_result(result: Any) -> None:
+    """Print the statistics of a reindex run."""
+    console.print(
+        f"[dim]Files: {result.added} added, {result.changed} changed, "
+        f"{result.removed} removed, {result.unchanged} unchanged, {result.failed} failed[/dim]"
+    )
+    console.print(
+        f"[dim]Chunks: {result.chunks_indexed} indexed ({result.chunks_deduplicated} duplicates), "
+        f"{result.chunks_deleted} deleted "
+        f"in {result.duration_seconds:.1f}s[/dim]"
+    )
+    stats = result.embedding
+    console.print(
+        f"[dim]Embedding: {stats.chunks} chunks in {stats.requests} requests ({stats.retries} retries), "
+        f"{stats.chunks_per_second:.1f} chunks/s, {stats.tokens_per_second:.0f} tokens/s[/dim]"
+    )
+    index = result.index
+    console.print(
+        f"[dim]Indexes: vector {index.vector_index}, full-text {index.fts_index} "
+        f"({index.rows} rows, {index.seconds:.1f}s)[/dim]"
+    )
+
+
 @knowledge_app.command()
 def reindex(
     knowledge_path: Path | None = typer.Option(
@@ -299,12 +344,36 @@ def reindex(
     ),
     vector_db_path: Path | None = typer.Option(None, "--vector-db-path", "-v", help="Path for vector database storage"),
     table_name: str = typer.Option("rhdh_docs", "--table-name", "-t", help="Name of the LanceDB table"),
+    full: bool = typer.Option(False, "--full", help="Drop the table and re-embed every document"),
+    batch_size: int = typer.Option(32, "--batch-size", help="Chunks per embedding request"),
+    concurrency: int = typer.Option(4, "--concurrency", help="Concurrent embedding requests"),
+    requests_per_minute: float | None = typer.Option(
+        None, "--requests-per-minute", help="Rate limit for embedding requests"
+    ),
+    workers: int | None = typer.Option(
+        None, "--workers", "-w", help="Worker processes for parsing documents (default: CPU count)"
+    ),
+    max_in_flight_chunks: int = typer.Option(
+        1024, "--max-in-flight-chunks", help="Maximum parsed chunks held in memory before being written"
+    ),
+    index_min_rows: int | None = typer.Option(
+        None, "--index-min-rows", help="Rows from which a vector (ANN) index is built (default: 100000)"
+    ),
+    embedder: EmbedderBackend | None = typer.Option(
+        None, "--embedder", "-e", help="Embedding backend (default: KNOWLEDGE__EMBEDDER setting)"
+    ),
+    sharded: bool | None = typer.Option(
+        None, "--sharded/--single-table", help="One table per source (default: KNOWLEDGE__SHARDING setting)"
+    ),
+    source: list[str] = typer.Option(
+        [], "--source", "-s", help="Reindex only this source shard (repeatable, implies --sharded; 'core' for the rest)"
+    ),
 ):
-    """Reindex the knowledge base by recreating the LanceDB vector database.
+    """Reindex the knowledge base in the LanceDB vector database.
 
-    This command will reload all documents and rebuild the vector embeddings,
-    which can be useful when documents have been updated or the vector database
-    has become corrupted.
+    By default only documents that were added, changed or removed since the last
+    reindex are processed. Use --full to recreate the vector database from scratch,
+    which can be useful when the vector database has become corrupted.
 
     Examples:
         # Reindex with default paths
@@ -315,45 +384,87 @@ def reindex(
 
         # Reindex with custom table name
         sidekick knowledge reindex --table-name my_docs
+
+        # Rebuild all embeddings from scratch
+        sidekick knowledge reindex --full
+
+        # Tune embedding throughput against the API quota
+        sidekick knowledge reindex --batch-size 64 --concurrency 8 --requests-per-minute 300
+
+        # Build the vector index even for a small table
+        sidekick knowledge reindex --index-min-rows 1000
+
+        # Embed with a local model instead of the Gemini API
+        sidekick knowledge reindex --full --embedder local
+
+        # Reindex only the gdrive source's table
+        sidekick knowledge reindex --source gdrive
     """
     try:
-        from ..knowledge import KnowledgeManager
+        from ..knowledge import KnowledgeManager, ShardedKnowledgeManager
+        from ..knowledge.batching import EmbeddingBatchConfig
+        from ..knowledge.embedders import create_embedder
+        from ..settings import settings
+
+        sharded = sharded if sharded is not None else settings.knowledge.sharding
 
         console.print("[blue]🔄 Starting knowledge base reindexing...[/blue]")
 
         # Create knowledge manager with specified paths
-        manager = KnowledgeManager(
+        manager_class = ShardedKnowledgeManager if sharded or source else KnowledgeManager
+        manager = manager_class(
             knowledge_path=knowledge_path,
             vector_db_path=vector_db_path,
             table_name=table_name,
+            embedder=create_embedder(backend=embedder.value) if embedder else None,
+            batch_config=EmbeddingBatchConfig(
+                batch_size=batch_size,
+                max_concurrency=concurrency,
+                requests_per_minute=requests_per_minute,
+            ),
+            parse_workers=workers,
+            max_in_flight_chunks=max_in_flight_chunks,
+            index_min_rows=index_min_rows,
         )
 
         # Display current configuration
         console.print(f"[dim]Knowledge path: {manager.knowledge_path}[/dim]")
         console.print(f"[dim]Vector DB path: {manager.vector_db_path}[/dim]")
         console.print(f"[dim]Table name: {manager.table_name}[/dim]")
+        if isinstance(manager, ShardedKnowledgeManager):
+            console.print(f"[dim]Shards: {', '.join(manager.shards)}[/dim]")
 
         if not manager.knowledge_path.exists():
             console.print(f"[red]✗ Knowledge path not found: {manager.knowledge_path}[/red]")
             raise typer.Exit(1) from None
 
         # Count documents for reference
-        md_files = list(manager.knowledge_path.rglob("*.md"))
-        pdf_files = list(manager.knowledge_path.rglob("*.pdf"))
-        total_files = len(md_files) + len(pdf_files)
+        found = manager.scan_documents()
+        md_files, pdf_files, csv_files = found[".md"], found[".pdf"], found[".csv"]
+        total_files = len(md_files) + len(pdf_files) + len(csv_files)
 
         if total_files == 0:
             console.print(f"[yellow]⚠ No documents found in {manager.knowledge_path}[/yellow]")
             raise typer.Exit(1) from None
 
-        console.print(f"[dim]Found {len(md_files)} markdown and {len(pdf_files)} PDF files[/dim]")
+        console.print(f"[dim]Found {len(md_files)} markdown, {len(pdf_files)} PDF and {len(csv_files)} CSV files[/dim]")
 
         # Perform reindexing
-        console.print("[blue]📚 Reindexing knowledge base (this may take a while)...[/blue]")
-        manager.reindex_sync()
-
-        console.print("[green]✓ Knowledge base reindexed successfully![/green]")
-        console.print(f"[dim]Processed {total_files} documents[/dim]")
+        if full:
+            console.print("[blue]📚 Fully reindexing knowledge base (this may take a while)...[/blue]")
+        else:
+            console.print("[blue]📚 Reindexing changed documents...[/blue]")
+
+        if isinstance(manager, ShardedKnowledgeManager):
+            results = manager.reindex_sync(full=full, sources=source or None)
+            console.print(f"[green]✓ Knowledge base reindexed successfully ({len(results)} shards)![/green]")
+            for name, result in results.items():
+                console.print(f"[cyan]{name}[/cyan] [dim]({manager.shards[name].table_name})[/dim]")
+                _print_reindex_result(result)
+        else:
+            result = manager.reindex_sync(full=full)
+            console.print("[green]✓ Knowledge base reindexed successfully![/green]")
+            _print_reindex_result(result)
 
     except ImportError as e:
         console.print(f"[red]✗ Missing dependencies for knowledge management: {e}[/red]")
@@ -362,3 +473,94 @@ def reindex(
     except Exception as e:
         console.print(f"[red]✗ Reindexing failed: {e}[/red]")
         raise typer.Exit(1) from None
+
+
+@knowledge_app.command()
+def bench(
+    corpus: Path | None = typer.Option(
+        None, "--corpus", "-c", help="Directory with documents to index (default: generated synthetic corpus)"
+    ),
+    queries: Path | None = typer.Option(
+        None, "--queries", "-q", help="JSON file with recorded queries and expected document names"
+    ),
+    documents: int = typer.Option(200, "--documents", "-n", help="Documents in the generated corpus"),
+    k: int = typer.Option(5, "--k", help="Results per query used for recall@k"),
+    workers: int | None = typer.Option(
+        None, "--workers", "-w", help="Worker processes for parsing documents (default: CPU count)"
+    ),
+    index_min_rows: int | None = typer.Option(
+        None, "--index-min-rows", help="Rows from which a vector (ANN) index is built (default: 100000)"
+    ),
+    work_dir: Path | None = typer.Option(
+        None, "--work-dir", help="Directory for the benchmark vector database (default: temporary directory)"
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Print the results as JSON"),
+):
+    """Benchmark knowledge indexing and retrieval offline.
+
+    Indexes a corpus with a deterministic local embedder, so no API key or
+    network access is needed, then runs recorded queries and reports search
+    latency percentiles, throughput, recall@k against the expected documents
+    and ingestion time per MB. Without --corpus a fixed synthetic corpus with
+    matching queries is generated.
+
+    Examples:
+        # Benchmark the generated corpus
+        sidekick knowledge bench
+
+        # Compare against an ANN index on a larger corpus
+        sidekick knowledge bench --documents 2000 --index-min-rows 1000
+
+        # Benchmark your own documents and golden answers
+        sidekick knowledge bench --corpus ./docs --queries ./queries.json
+    """
+    import asyncio
+    import tempfile
+
+    from ..knowledge.bench import generate_corpus, load_queries, run_benchmark
+
+    if corpus is not None and queries is None:
+        console.print("[red]✗ --queries is required together with --corpus[/red]")
+        raise typer.Exit(1) from None
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="sidekick-bench-") as tmp:
+            base = work_dir or Path(tmp)
+            if corpus is None:
+                corpus = base / "corpus"
+                bench_queries = generate_corpus(corpus, num_documents=documents)
+            else:
+                bench_queries = []
+            if queries is not None:
+                bench_queries = load_queries(queries)
+
+            if not json_output:
+                console.print(f"[blue]⏱ Benchmarking {corpus} with {len(bench_queries)} queries...[/blue]")
+            result = asyncio.run(
+                run_benchmark(
+                    corpus,
+                    bench_queries,
+                    base / "lancedb",
+                    k=k,
+                    parse_workers=workers,
+                    index_min_rows=index_min_rows,
+                )
+            )
+    except Exception as e:
+        console.print(f"[red]✗ Benchmark failed: {e}[/red]")
+        raise typer.Exit(1) from None
+
+    if json_output:
+        print(result.model_dump_json(indent=2))
+        return
+
+    console.print("[green]✓ Benchmark complete[/green]")
+    console.print(
+        f"[dim]Ingestion: {result.documents} documents ({result.corpus_mb:.2f} MB), {result.chunks} chunks "
+        f"in {result.ingest_seconds:.2f}s ({result.ingest_seconds_per_mb:.2f} s/MB)[/dim]"
+    )
+    console.print(
+        f"[dim]Latency: p50 {result.latency_p50_ms:.1f} ms, p95 {result.latency_p95_ms:.1f} ms, "
+        f"p99 {result.latency_p99_ms:.1f} ms ({result.queries_per_second:.1f} queries/s)[/dim]"
+    )
+    console.print(f"[dim]Recall@{result.k}: {result.recall_at_k:.3f} over {result.queries} queries[/dim]")
@@ -1,5 +1,6 @@
 """Knowledge management module."""
 
 from .manager import KnowledgeManager
+from .sharding import ShardedKnowledgeManager, create_knowledge_manager
 
-__all__ = ["KnowledgeManager"]
+__all__ = ["KnowledgeManager", "ShardedKnowledgeManager", "create_knowledge_manager"]
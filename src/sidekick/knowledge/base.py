@@ -17,14 +17,37 @@ class KnowledgeSourceConfig(BaseModel):
     name: str = Field(..., description="Source name, becomes the directory name")
 
 
+class ResourceState(BaseModel):
+    """State of a synced resource (document, page, ...) recorded in the manifest to detect changes."""
+
+    modified_time: str | None = None
+    version: str | None = None
+    etag: str | None = None
+    content_hash: str | None = Field(default=None, description="SHA-256 of the fetched content")
+    files: list[str] = Field(default_factory=list, description="Files written for the resource, relative to base path")
+    links: list[str] | None = Field(default=None, description="Resources linked from this one (None if not extracted)")
+
+
 class DownloadResult(BaseModel):
     """Result of a download operation."""
 
     source_name: str
     files_downloaded: list[Path] = Field(default_factory=list)
+    files_unchanged: list[Path] = Field(
+        default_factory=list, description="Files kept from the previous sync because their resource did not change"
+    )
+    resources: dict[str, ResourceState] = Field(default_factory=dict, description="State of every synced resource")
+    cursor: str | None = Field(
+        default=None, description="Source-specific position to detect the next changes from (e.g. a page token)"
+    )
     errors: list[str] = Field(default_factory=list)
     success: bool = True
 
+    @property
+    def current_files(self) -> list[Path]:
+        """All files the source currently provides."""
+        return self.files_downloaded + self.files_unchanged
+
 
 class KnowledgeSource(ABC):
     """Abstract base class for knowledge sources."""
@@ -50,11 +73,12 @@ class KnowledgeSource(ABC):
         pass
 
     @abstractmethod
-    def sync(self, manifest: dict[str, Any] | None = None) -> DownloadResult:
+    def sync(self, manifest: dict[str, Any] | None = None, resume: bool = False) -> DownloadResult:
         """Sync content based on configuration.
 
         Args:
             manifest: Previous manifest for tracking changes
+            resume: Continue an interrupted sync from its checkpoint, for sources that checkpoint their progress
 
         Returns:
             DownloadResult with list of downloaded files
@@ -0,0 +1,281 @@
+"""Batched, concurrent embedding of document chunks with rate limiting."""
+
+import asyncio
+import random
+import time
+from typing import Any
+
+from agno.document.base import Document
+from agno.embedder.base import Embedder
+from agno.embedder.google import GeminiEmbedder
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from .embedders import LocalEmbedder
+from .embeddings import CachedEmbedder
+
+# Rough characters-per-token ratio used for throughput and rate-limit accounting
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a text."""
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+class EmbeddingBatchConfig(BaseModel):
+    """Configuration for the batched embedding stage."""
+
+    batch_size: int = Field(default=32, ge=1, le=100, description="Chunks per embedding request")
+    max_concurrency: int = Field(default=4, ge=1, description="Concurrent embedding requests")
+    requests_per_minute: float | None = Field(default=None, gt=0, description="Request rate limit")
+    tokens_per_minute: float | None = Field(default=None, gt=0, description="Estimated token rate limit")
+    max_retries: int = Field(default=5, ge=0, description="Retries for rate-limited or failed requests")
+    initial_backoff: float = Field(default=1.0, gt=0, description="First retry delay in seconds")
+    max_backoff: float = Field(default=60.0, gt=0, description="Maximum retry delay in seconds")
+
+
+class EmbeddingStats(BaseModel):
+    """Throughput statistics of an embedding run."""
+
+    chunks: int = 0
+    tokens: int = 0
+    requests: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        """Embedded chunks per second."""
+        return self.chunks / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Estimated embedded tokens per second."""
+        return self.tokens / self.seconds if self.seconds > 0 else 0.0
+
+
+class TokenBucket:
+    """Asynchronous token bucket rate limiter."""
+
+    def __init__(self, rate_per_minute: float, capacity: float | None = None):
+        """Initialize token bucket.
+
+        Args:
+            rate_per_minute: Tokens added to the bucket per minute
+            capacity: Maximum burst size (default: one second worth of tokens, at least 1)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until the requested amount of tokens is available and take it.
+
+        Requests larger than the capacity are allowed once the bucket is full,
+        leaving it in debt, so they cannot block forever.
+        """
+        async with self._lock:
+            while True:
+                self._refill()
+                needed = min(amount, self.capacity)
+                if self._tokens >= needed:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((needed - self._tokens) / self.rate)
+
+
+class ChunkBudget:
+    """Bounds the number of chunks held in memory between parsing and writing."""
+
+    def __init__(self, limit: int):
+        """Initialize chunk budget.
+
+        Args:
+            limit: Maximum number of chunks in flight
+        """
+        self.limit = limit
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    def fits(self, amount: int) -> bool:
+        """Check whether the chunks can be reserved without waiting."""
+        return self.in_flight == 0 or self.in_flight + amount <= self.limit
+
+    async def acquire(self, amount: int) -> None:
+        """Wait until the chunks fit into the budget and reserve them.
+
+        A single file larger than the whole budget is admitted once nothing
+        else is in flight, so it cannot block forever.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.fits(amount))
+            self.in_flight += amount
+
+    async def release(self, amount: int) -> None:
+        """Return chunks to the budget once they are written."""
+        async with self._condition:
+            self.in_flight -= amount
+            self._condition.notify_all()
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Check whether an exception signals an HTTP 429 / quota exhaustion."""
+    code = getattr(error, "code", None) or getattr(error, "status_code", None)
+    if code == 429:
+        return True
+    message = str(error)
+    return "429" in message or "RESOURCE_EXHAUSTED" in message
+
+
+def embed_texts(embedder: Embedder, texts: list[str]) -> list[tuple[list[float], dict[str, Any] | None]]:
+    """Embed a batch of texts with as few API requests as the embedder allows.
+
+    Cached texts are served from the embedding cache, Gemini embedders send
+    the whole batch in a single request, local models encode it in batched
+    forward passes and any other embedder falls back to one call per text.
+
+    Args:
+        embedder: Embedder to use
+        texts: Texts to embed
+
+    Returns:
+        (embedding, usage) tuple per text, in input order
+    """
+    if not texts:
+        return []
+
+    if isinstance(embedder, CachedEmbedder):
+        results: list[tuple[list[float], dict[str, Any] | None] | None] = [None] * len(texts)
+        missing: list[int] = []
+        for i, text in enumerate(texts):
+            cached = embedder.cache.get(embedder.id, embedder.dimensions or 0, text) if embedder.cache else None
+            if cached is None:
+                missing.append(i)
+            else:
+                results[i] = (cached, None)
+
+        embedded = embed_texts(embedder.embedder, [texts[i] for i in missing])
+        for i, (embedding, usage) in zip(missing, embedded, strict=True):
+            if embedder.cache is not None:
+                embedder.cache.put(embedder.id, embedder.dimensions or 0, texts[i], embedding)
+            results[i] = (embedding, usage)
+        return [result for result in results if result is not None]
+
+    if isinstance(embedder, GeminiEmbedder):
+        return _embed_texts_gemini(embedder, texts)
+
+    if isinstance(embedder, LocalEmbedder):
+        return [(embedding, None) for embedding in embedder.get_embeddings(texts)]
+
+    return [embedder.get_embedding_and_usage(text) for text in texts]
+
+
+def _embed_texts_gemini(embedder: GeminiEmbedder, texts: list[str]) -> list[tuple[list[float], dict[str, Any] | None]]:
+    """Embed several texts with a single Gemini embed_content request."""
+    model_id = embedder.id.split("/")[-1] if embedder.id.startswith("models/") else embedder.id
+    config: dict[str, Any] = {}
+    if embedder.dimensions:
+        config["output_dimensionality"] = embedder.dimensions
+    if embedder.task_type:
+        config["task_type"] = embedder.task_type
+    if embedder.title:
+        config["title"] = embedder.title
+
+    request_params: dict[str, Any] = {"contents": texts, "model": model_id}
+    if config:
+        request_params["config"] = config
+    if embedder.request_params:
+        request_params.update(embedder.request_params)
+
+    response = embedder.client.models.embed_content(**request_params)
+    embeddings = response.embeddings or []
+    if len(embeddings) != len(texts):
+        raise RuntimeError(f"Gemini returned {len(embeddings)} embeddings for {len(texts)} texts")
+    return [(list(embedding.values or []), None) for embedding in embeddings]
+
+
+class BatchEmbedder:
+    """Embeds document chunks in batches with bounded concurrency and rate limiting."""
+
+    def __init__(self, embedder: Embedder, config: EmbeddingBatchConfig | None = None):
+        """Initialize batch embedder.
+
+        Args:
+            embedder: Embedder doing the actual work
+            config: Batching, concurrency and rate limit settings
+        """
+        self.embedder = embedder
+        self.config = config or EmbeddingBatchConfig()
+        self.stats = EmbeddingStats()
+        self._request_bucket = TokenBucket(self.config.requests_per_minute) if self.config.requests_per_minute else None
+        self._token_bucket = (
+            TokenBucket(self.config.tokens_per_minute, capacity=self.config.tokens_per_minute / 60.0)
+            if self.config.tokens_per_minute
+            else None
+        )
+        self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+    async def embed_documents(self, documents: list[Document]) -> None:
+        """Embed documents in place, setting their embedding and usage.
+
+        Args:
+            documents: Documents to embed
+
+        Raises:
+            Exception: The last error if a batch still fails after all retries
+        """
+        if not documents:
+            return
+
+        start = time.perf_counter()
+        batch_size = self.config.batch_size
+        batches = [documents[i : i + batch_size] for i in range(0, len(documents), batch_size)]
+        try:
+            await asyncio.gather(*(self._embed_batch(batch) for batch in batches))
+        finally:
+            self.stats.seconds += time.perf_counter() - start
+
+    async def _embed_batch(self, batch: list[Document]) -> None:
+        texts = [doc.content for doc in batch]
+        tokens = sum(estimate_tokens(text) for text in texts)
+
+        async with self._semaphore:
+            attempt = 0
+            while True:
+                if self._request_bucket is not None:
+                    await self._request_bucket.acquire()
+                if self._token_bucket is not None:
+                    await self._token_bucket.acquire(tokens)
+
+                try:
+                    self.stats.requests += 1
+                    results = await asyncio.to_thread(embed_texts, self.embedder, texts)
+                    break
+                except Exception as e:
+                    if attempt >= self.config.max_retries:
+                        logger.error(f"Embedding batch of {len(batch)} chunks failed after {attempt} retries: {e}")
+                        raise
+                    delay = min(self.config.max_backoff, self.config.initial_backoff * 2**attempt)
+                    delay *= 1 + random.random() * 0.25
+                    if is_rate_limit_error(e):
+                        logger.warning(f"Embedding rate limited, retrying in {delay:.1f}s")
+                    else:
+                        logger.warning(f"Embedding batch failed ({e}), retrying in {delay:.1f}s")
+                    attempt += 1
+                    self.stats.retries += 1
+                    await asyncio.sleep(delay)
+
+        for doc, (embedding, usage) in zip(batch, results, strict=True):
+            doc.embedding = embedding
+            doc.usage = usage
+
+        self.stats.chunks += len(batch)
+        self.stats.tokens += tokens
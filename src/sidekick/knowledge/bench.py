@@ -0,0 +1,204 @@
+"""Offline retrieval benchmark for the knowledge base.
+
+The benchmark indexes a corpus with a deterministic local embedder, runs a
+recorded query set against the vector database and reports ingestion speed,
+search latency percentiles, throughput and recall@k against golden answers.
+It needs no network access, so it can be used to compare chunking and index
+settings.
+"""
+
+import json
+import math
+import random
+import time
+from pathlib import Path
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from .embedders import HashingEmbedder
+from .embeddings import CachedEmbedder
+from .manager import KnowledgeManager
+
+# Vocabulary shared by every generated document
+_COMMON_WORDS = [
+    "install",
+    "configure",
+    "plugin",
+    "backstage",
+    "catalog",
+    "template",
+    "operator",
+    "helm",
+    "chart",
+    "cluster",
+    "namespace",
+    "authentication",
+    "provider",
+    "permission",
+    "policy",
+    "dynamic",
+    "frontend",
+    "backend",
+    "route",
+    "entity",
+    "upgrade",
+    "release",
+    "documentation",
+    "guide",
+    "example",
+    "setting",
+    "value",
+    "secret",
+    "config",
+    "map",
+    "deployment",
+    "service",
+]
+_SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "ta", "vo", "zi", "pe", "su", "do", "fa", "gu", "hi", "ja", "ko"]
+
+
+class BenchQuery(BaseModel):
+    """Recorded benchmark query with its golden answers."""
+
+    query: str
+    expected: list[str] = Field(description="Names (file stems) of documents that answer the query")
+
+
+class BenchResult(BaseModel):
+    """Benchmark measurements."""
+
+    documents: int
+    corpus_mb: float
+    chunks: int
+    ingest_seconds: float
+    ingest_seconds_per_mb: float
+    queries: int
+    k: int
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+    queries_per_second: float
+    recall_at_k: float
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _pseudo_word(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(4))
+
+
+def generate_corpus(target_dir: Path, num_documents: int = 200, seed: int = 0) -> list[BenchQuery]:
+    """Write a fixed synthetic markdown corpus and return its recorded queries.
+
+    The same seed always produces the same documents and queries. Every
+    document contains a few unique keywords; its query asks for two of them.
+
+    Args:
+        target_dir: Directory to write the markdown files to
+        num_documents: Number of documents to generate
+        seed: Random seed
+
+    Returns:
+        One query per document with that document as golden answer
+    """
+    rng = random.Random(seed)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    queries: list[BenchQuery] = []
+
+    for i in range(num_documents):
+        name = f"component-{i:04d}"
+        keywords = [_pseudo_word(rng) for _ in range(3)]
+        sections = []
+        for heading in ("Overview", "Installation", "Configuration", "Troubleshooting"):
+            sentences = []
+            for _ in range(rng.randint(4, 8)):
+                words = rng.sample(_COMMON_WORDS, 8) + [rng.choice(keywords)]
+                rng.shuffle(words)
+                sentences.append(" ".join(words).capitalize() + ".")
+            sections.append(f"## {heading}\n\n" + " ".join(sentences))
+        content = f"# {keywords[0].capitalize()} component\n\n" + "\n\n".join(sections) + "\n"
+        (target_dir / f"{name}.md").write_text(content, encoding="utf-8")
+        queries.append(BenchQuery(query=f"how do I configure {keywords[0]} with {keywords[1]}", expected=[name]))
+
+    return queries
+
+
+def load_queries(queries_file: Path) -> list[BenchQuery]:
+    """Load recorded queries from a JSON list of {"query": ..., "expected": [...]} objects."""
+    with open(queries_file, encoding="utf-8") as f:
+        return [BenchQuery(**entry) for entry in json.load(f)]
+
+
+async def run_benchmark(
+    corpus_path: Path,
+    queries: list[BenchQuery],
+    work_dir: Path,
+    k: int = 5,
+    parse_workers: int | None = None,
+    index_min_rows: int | None = None,
+) -> BenchResult:
+    """Index a corpus with the hashing embedder and measure retrieval.
+
+    Args:
+        corpus_path: Directory with the documents to index
+        queries: Recorded queries with golden answers
+        work_dir: Empty directory for the benchmark vector database
+        k: Number of results per query
+        parse_workers: Worker processes for parsing (default: CPU count)
+        index_min_rows: Rows from which a vector index is built (default: knowledge setting)
+
+    Returns:
+        BenchResult with ingestion, latency and recall figures
+    """
+    # No embedding caches, so every run measures the same work
+    embedder = CachedEmbedder(embedder=HashingEmbedder())
+    manager = KnowledgeManager(
+        knowledge_path=corpus_path,
+        vector_db_path=work_dir,
+        table_name="bench",
+        embedder=embedder,
+        parse_workers=parse_workers,
+        index_min_rows=index_min_rows,
+    )
+
+    files = [path for paths in manager.scan_documents().values() for path in paths]
+    corpus_mb = sum(path.stat().st_size for path in files) / (1024 * 1024)
+
+    logger.info(f"Indexing {len(files)} benchmark documents ({corpus_mb:.2f} MB)")
+    reindex = await manager.reindex(full=True)
+
+    vector_db = manager.get_vector_db()
+    latencies: list[float] = []
+    recalls: list[float] = []
+    for query in queries:
+        start = time.perf_counter()
+        documents = vector_db.search(query.query, limit=k)
+        latencies.append(time.perf_counter() - start)
+
+        found = {doc.name for doc in documents}
+        expected = set(query.expected)
+        recalls.append(len(found & expected) / len(expected) if expected else 1.0)
+
+    total_seconds = sum(latencies)
+    return BenchResult(
+        documents=len(files),
+        corpus_mb=corpus_mb,
+        chunks=reindex.chunks_indexed,
+        ingest_seconds=reindex.duration_seconds,
+        ingest_seconds_per_mb=reindex.duration_seconds / corpus_mb if corpus_mb > 0 else 0.0,
+        queries=len(queries),
+        k=k,
+        latency_p50_ms=percentile(latencies, 50) * 1000,
+        latency_p95_ms=percentile(latencies, 95) * 1000,
+        latency_p99_ms=percentile(latencies, 99) * 1000,
+        queries_per_second=len(queries) / total_seconds if total_seconds > 0 else 0.0,
+        recall_at_k=sum(recalls) / len(recalls) if recalls else 0.0,
+    )
@@ -1,8 +1,40 @@
-"""Fixed size chunking strategy for knowledge documents."""
+"""Chunking strategies for knowledge documents."""
+
+import re
+from bisect import bisect_right
+from collections.abc import Callable, Iterator
 
 from agno.document.base import Document
 from agno.document.chunking.strategy import ChunkingStrategy
 
+from ..settings import settings
+
+_WHITESPACE_RUN = re.compile(r"\s+")
+_SPACE = re.compile(" ")
+
+# Word pieces and single punctuation characters, roughly how subword tokenizers split text
+_TOKEN_PIECE = re.compile(r"\w+|[^\w\s]")
+_HEADING = re.compile(r"#{1,6}\s")
+_CODE_FENCE = re.compile(r"\s*(```|~~~)")
+_PARAGRAPH_END = re.compile(r"(?<=\n\n)")
+_WORD = re.compile(r"\S*\s*")
+
+
+def approximate_tokens(text: str) -> int:
+    """Approximate the number of embedding model tokens in a text.
+
+    Every punctuation character counts as one token and words as one token
+    per four characters. The estimate is additive over text split at
+    whitespace, so section counts can be summed.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate token count
+    """
+    return sum((len(piece) + 3) // 4 for piece in _TOKEN_PIECE.findall(text))
+
 
 class FixedSizeChunking(ChunkingStrategy):
     """Chunking strategy that splits text into fixed-size chunks with optional overlap"""
@@ -55,3 +87,180 @@ class FixedSizeChunking(ChunkingStrategy):
             chunk_number += 1
             start = end - self.overlap
         return chunked_documents
+
+
+class FastFixedSizeChunking(FixedSizeChunking):
+    """FixedSizeChunking with precomputed split points.
+
+    Text is cleaned in one regex pass, whitespace offsets are collected with a
+    single scan and every chunk boundary is found by binary search instead of
+    walking back one character at a time. Chunks are produced lazily by
+    iter_chunks; the output is identical to FixedSizeChunking.
+    """
+
+    def clean_text(self, text: str) -> str:
+        """Collapse whitespace runs into a single space.
+
+        Equivalent to the base implementation, whose passes after the
+        whitespace collapse never match anything.
+        """
+        return _WHITESPACE_RUN.sub(" ", text)
+
+    def iter_chunks(self, document: Document) -> Iterator[Document]:
+        """Yield fixed-size chunks of a document one at a time."""
+        content = self.clean_text(document.content)
+        content_length = len(content)
+        # After cleaning, single spaces are the only whitespace left to split on
+        whitespace = [match.start() for match in _SPACE.finditer(content)]
+        base_id = document.id or document.name
+        chunk_number = 1
+        start = 0
+        while start + self.overlap < content_length:
+            end = min(start + self.chunk_size, content_length)
+
+            # Split at the last whitespace after start, or at chunk_size if the entire chunk is a word
+            if end < content_length:
+                index = bisect_right(whitespace, end) - 1
+                end = whitespace[index] if index >= 0 and whitespace[index] > start else start + self.chunk_size
+
+            chunk = content[start:end]
+            yield Document(
+                id=f"{base_id}_{chunk_number}" if base_id else None,
+                name=document.name,
+                meta_data={**document.meta_data, "chunk": chunk_number, "chunk_size": len(chunk)},
+                content=chunk,
+            )
+            chunk_number += 1
+            start = end - self.overlap
+
+    def chunk(self, document: Document) -> list[Document]:
+        """Split document into fixed-size chunks with optional overlap"""
+        return list(self.iter_chunks(document))
+
+
+class TokenChunking(ChunkingStrategy):
+    """Chunking strategy that packs markdown sections into chunks of a token budget.
+
+    Text is split at markdown headings (outside code fences) and consecutive
+    sections are packed together while they fit the budget. A section that
+    is too large on its own is split at paragraphs, then at words, and a
+    single over-long word is cut as a last resort.
+    """
+
+    def __init__(self, target_tokens: int = 1500):
+        """Initialize token chunking.
+
+        Args:
+            target_tokens: Maximum approximate tokens per chunk
+        """
+        if target_tokens < 1:
+            raise ValueError(f"Invalid parameters: target_tokens ({target_tokens}) must be positive.")
+        self.target_tokens = target_tokens
+        self._splitters: list[Callable[[str], list[str]]] = [
+            self._split_sections,
+            self._split_paragraphs,
+            self._split_words,
+        ]
+
+    @staticmethod
+    def _split_sections(text: str) -> list[str]:
+        sections: list[str] = []
+        current: list[str] = []
+        in_code = False
+        for line in text.splitlines(keepends=True):
+            if _CODE_FENCE.match(line):
+                in_code = not in_code
+            elif not in_code and _HEADING.match(line) and current:
+                sections.append("".join(current))
+                current = []
+            current.append(line)
+        if current:
+            sections.append("".join(current))
+        return sections
+
+    @staticmethod
+    def _split_paragraphs(text: str) -> list[str]:
+        return [paragraph for paragraph in _PARAGRAPH_END.split(text) if paragraph]
+
+    @staticmethod
+    def _split_words(text: str) -> list[str]:
+        return [word for word in _WORD.findall(text) if word]
+
+    def _pieces(self, text: str, level: int) -> list[str]:
+        """Split text into pieces of at most target_tokens, using finer splitters only where needed."""
+        if level == len(self._splitters):
+            # One character is never more than one token
+            return [text[i : i + self.target_tokens] for i in range(0, len(text), self.target_tokens)]
+
+        pieces: list[str] = []
+        for piece in self._splitters[level](text):
+            if approximate_tokens(piece) > self.target_tokens:
+                pieces.extend(self._pieces(piece, level + 1))
+            else:
+                pieces.append(piece)
+        return pieces
+
+    def _pack(self, pieces: list[str]) -> list[str]:
+        """Greedily join consecutive pieces while they fit into target_tokens."""
+        chunks: list[str] = []
+        current: list[str] = []
+        current_tokens = 0
+        for piece in pieces:
+            tokens = approximate_tokens(piece)
+            if current and current_tokens + tokens > self.target_tokens:
+                chunks.append("".join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += tokens
+        if current:
+            chunks.append("".join(current))
+        return chunks
+
+    def _split(self, text: str) -> list[str]:
+        """Split text into chunks of at most target_tokens that start at section boundaries where possible."""
+        chunks: list[str] = []
+        sections: list[str] = []
+        for section in self._split_sections(text):
+            if approximate_tokens(section) > self.target_tokens:
+                # Oversized sections are chunked on their own, never merged with other sections
+                chunks.extend(self._pack(sections))
+                chunks.extend(self._pack(self._pieces(section, 1)))
+                sections = []
+            else:
+                sections.append(section)
+        chunks.extend(self._pack(sections))
+        return chunks
+
+    def chunk(self, document: Document) -> list[Document]:
+        """Split document into heading-aligned chunks within the token budget"""
+        base_id = document.id or document.name
+        chunked_documents: list[Document] = []
+        for text in self._split(document.content):
+            chunk = text.strip()
+            if not chunk:
+                continue
+            chunk_number = len(chunked_documents) + 1
+            chunked_documents.append(
+                Document(
+                    id=f"{base_id}_{chunk_number}" if base_id else None,
+                    name=document.name,
+                    meta_data={**document.meta_data, "chunk": chunk_number, "chunk_size": len(chunk)},
+                    content=chunk,
+                )
+            )
+        return chunked_documents
+
+
+def create_fixed_size_chunking(chunk_size: int = 5000, overlap: int = 0) -> FixedSizeChunking:
+    """Create the fixed size chunking strategy selected in the knowledge settings.
+
+    Args:
+        chunk_size: Maximum characters per chunk
+        overlap: Characters shared by consecutive chunks
+
+    Returns:
+        FastFixedSizeChunking if knowledge.fast_chunking is enabled, else FixedSizeChunking
+    """
+    if settings.knowledge.fast_chunking:
+        return FastFixedSizeChunking(chunk_size=chunk_size, overlap=overlap)
+    return FixedSizeChunking(chunk_size=chunk_size, overlap=overlap)
@@ -15,6 +15,11 @@ class GDriveSourceConfig(BaseModel):
     name: str
     documents: list[dict[str, Any]] = Field(default_factory=list)
     export_format: str = "md"
+    use_changes_api: bool = Field(
+        default=False,
+        description="Ask the Drive Changes API which documents changed instead of fetching each one's metadata",
+    )
+    max_workers: int = Field(default=4, ge=1, le=32, description="Maximum number of documents exported concurrently")
 
     @field_validator("documents", mode="before")
     @classmethod
@@ -48,7 +53,18 @@ class WebSourceConfig(BaseModel):
     urls: list[str] = Field(default_factory=list)
     depth: int = Field(default=1, ge=0, le=5)
     patterns: list[str] = Field(default_factory=list)
+    exclude_patterns: list[str] = Field(
+        default_factory=list, description="Glob patterns of links that are not followed, even if they match patterns"
+    )
     export_format: str = "md"
+    concurrency_per_host: int = Field(default=4, ge=1, le=32, description="Maximum concurrent page fetches per host")
+    batch_size: int = Field(default=50, ge=1, description="Pages handed to the crawler at once per host")
+    static_fetch: bool = Field(
+        default=True, description="Fetch static pages over HTTP and convert them in-process instead of in a browser"
+    )
+    js_patterns: list[str] = Field(
+        default_factory=list, description="Glob patterns of URLs that need JavaScript and are always rendered"
+    )
 
 
 class KnowledgeConfig(BaseModel):
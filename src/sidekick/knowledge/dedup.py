@@ -0,0 +1,215 @@
+"""Duplicate and near-duplicate chunk detection for knowledge base indexing.
+
+Synced sources overlap: the same upstream page is mirrored from git and by the
+web crawler, and Google Docs are exported in several formats. Chunks are
+compared before embedding by the hash of their normalized text (exact
+duplicates) and by a 64-bit SimHash of their word shingles (near duplicates).
+Only the first chunk of a group, the canonical chunk, is embedded and stored;
+the other copies reference its row. The canonical row carries the metadata of
+a single file, so chunks are only merged within a scope of files that the
+metadata filters cannot tell apart (the same source, file type and versions).
+"""
+
+import hashlib
+import json
+import re
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+from pydantic import BaseModel
+
+SIMHASH_BITS = 64
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class ChunkSignature(BaseModel):
+    """Signatures of a canonical chunk."""
+
+    chunk_id: str
+    content_hash: str
+    simhash: int | None = None
+    scope: str = ""
+
+
+def normalize_tokens(text: str) -> list[str]:
+    """Split text into case-folded words, dropping whitespace, punctuation and markup."""
+    return _WORD_PATTERN.findall(text.casefold())
+
+
+def content_hash(tokens: list[str]) -> str:
+    """Hash normalized text, so copies differing only in formatting hash identically."""
+    return hashlib.sha256(" ".join(tokens).encode()).hexdigest()
+
+
+def simhash(tokens: list[str], shingle_size: int = 3) -> int:
+    """Compute the 64-bit SimHash of the word shingles of a text.
+
+    Similar texts get fingerprints that differ in few bits.
+
+    Args:
+        tokens: Normalized words of the text
+        shingle_size: Number of consecutive words per shingle
+
+    Returns:
+        SimHash fingerprint as an unsigned 64-bit integer
+    """
+    count = max(len(tokens) - shingle_size + 1, 1)
+    shingles = (" ".join(tokens[i : i + shingle_size]) for i in range(count))
+    digests = b"".join(hashlib.blake2b(shingle.encode(), digest_size=8).digest() for shingle in shingles)
+    hashes = np.frombuffer(digests, dtype=">u8")
+
+    bits = (hashes[:, None] >> np.arange(SIMHASH_BITS, dtype=np.uint64)) & np.uint64(1)
+    majority = np.flatnonzero(bits.sum(axis=0) * 2 > len(hashes))
+    return sum(1 << int(bit) for bit in majority)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return (a ^ b).bit_count()
+
+
+class DedupIndex:
+    """Persistent index of the canonical chunks stored in a single vector table.
+
+    Near duplicates are looked up by splitting each SimHash into
+    max_distance + 1 bands: two fingerprints within max_distance bits of each
+    other agree on at least one whole band, so only chunks sharing a band are
+    compared. Texts shorter than min_tokens words are too short for a stable
+    SimHash and are only matched exactly. Chunks only match chunks of the same
+    scope.
+    """
+
+    def __init__(self, store_path: Path, max_distance: int = 4, min_tokens: int = 24):
+        """Initialize dedup index.
+
+        Args:
+            store_path: JSON file holding the signatures
+            max_distance: Maximum number of differing SimHash bits between near duplicates (0: exact hash only)
+            min_tokens: Minimum number of words for near-duplicate matching
+        """
+        self.store_path = store_path
+        self.max_distance = max_distance
+        self.min_tokens = min_tokens
+        self.signatures: dict[str, ChunkSignature] = {}
+        self._by_hash: dict[tuple[str, str], str] = {}
+        self._by_band: dict[tuple[str, int, int], set[str]] = {}
+
+        bands = max_distance + 1
+        width = SIMHASH_BITS // bands
+        self._bands = [(i * width, SIMHASH_BITS if i == bands - 1 else (i + 1) * width) for i in range(bands)]
+
+    @classmethod
+    def for_table(cls, vector_db_path: Path, table_name: str, **kwargs) -> "DedupIndex":
+        """Load the dedup index belonging to a LanceDB table.
+
+        Args:
+            vector_db_path: LanceDB storage directory
+            table_name: Name of the LanceDB table
+            **kwargs: Passed to DedupIndex
+
+        Returns:
+            DedupIndex instance (empty if nothing was stored yet)
+        """
+        index = cls(vector_db_path / f"{table_name}.dedup.json", **kwargs)
+        index.load()
+        return index
+
+    def _band_keys(self, fingerprint: int, scope: str) -> list[tuple[str, int, int]]:
+        return [(scope, start, (fingerprint >> start) & ((1 << (end - start)) - 1)) for start, end in self._bands]
+
+    def _register(self, signature: ChunkSignature) -> None:
+        self.signatures[signature.chunk_id] = signature
+        self._by_hash.setdefault((signature.scope, signature.content_hash), signature.chunk_id)
+        if signature.simhash is not None:
+            for key in self._band_keys(signature.simhash, signature.scope):
+                self._by_band.setdefault(key, set()).add(signature.chunk_id)
+
+    def load(self) -> None:
+        """Load signatures from disk, starting empty if the file is missing or invalid."""
+        self.signatures, self._by_hash, self._by_band = {}, {}, {}
+        if not self.store_path.exists():
+            logger.debug(f"No dedup index found at {self.store_path}")
+            return
+
+        try:
+            with open(self.store_path, encoding="utf-8") as f:
+                data = json.load(f)
+            for entry in data.get("chunks", []):
+                self._register(ChunkSignature(**entry))
+            logger.debug(f"Loaded {len(self.signatures)} chunk signatures from {self.store_path}")
+        except Exception as e:
+            logger.error(f"Failed to load dedup index {self.store_path}: {e}")
+            self.signatures, self._by_hash, self._by_band = {}, {}, {}
+
+    def save(self) -> None:
+        """Save signatures to disk."""
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"chunks": [signature.model_dump(mode="json") for signature in self.signatures.values()]}
+
+        tmp_path = self.store_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        tmp_path.replace(self.store_path)
+
+        logger.debug(f"Saved {len(self.signatures)} chunk signatures to {self.store_path}")
+
+    def clear(self) -> None:
+        """Forget all signatures and remove the index file."""
+        self.signatures, self._by_hash, self._by_band = {}, {}, {}
+        if self.store_path.exists():
+            self.store_path.unlink()
+
+    def add(self, chunk_id: str, text: str, scope: str = "") -> str | None:
+        """Find the canonical chunk a chunk duplicates, or register it as canonical.
+
+        Args:
+            chunk_id: Row id of the chunk
+            text: Chunk content
+            scope: Group of chunks that may be merged, e.g. the source of the chunk's file
+
+        Returns:
+            Row id of the canonical chunk (chunk_id itself if that row is already known),
+            or None if the chunk is new and now canonical
+        """
+        if chunk_id in self.signatures:
+            return chunk_id
+
+        tokens = normalize_tokens(text)
+        digest = content_hash(tokens)
+        if (scope, digest) in self._by_hash:
+            return self._by_hash[scope, digest]
+
+        fingerprint = None
+        if self.max_distance > 0 and len(tokens) >= self.min_tokens:
+            fingerprint = simhash(tokens)
+            for key in self._band_keys(fingerprint, scope):
+                for candidate in self._by_band.get(key, ()):
+                    other = self.signatures[candidate].simhash
+                    if other is not None and hamming_distance(fingerprint, other) <= self.max_distance:
+                        return candidate
+
+        self._register(ChunkSignature(chunk_id=chunk_id, content_hash=digest, simhash=fingerprint, scope=scope))
+        return None
+
+    def forget(self, chunk_ids: Iterable[str]) -> None:
+        """Remove chunks whose rows were deleted, so they no longer absorb new copies.
+
+        Args:
+            chunk_ids: Row ids to remove
+        """
+        for chunk_id in chunk_ids:
+            signature = self.signatures.pop(chunk_id, None)
+            if signature is None:
+                continue
+            if self._by_hash.get((signature.scope, signature.content_hash)) == chunk_id:
+                del self._by_hash[signature.scope, signature.content_hash]
+            if signature.simhash is not None:
+                for key in self._band_keys(signature.simhash, signature.scope):
+                    members = self._by_band.get(key)
+                    if members is not None:
+                        members.discard(chunk_id)
+                        if not members:
+                            del self._by_band[key]
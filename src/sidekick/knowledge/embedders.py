@@ -0,0 +1,171 @@
+"""Embedding backends for the knowledge vector databases.
+
+The backend is selected with the knowledge.embedder setting:
+
+- gemini: Google Gemini embedding API (default)
+- local: a sentence-transformers model running on the CPU, optionally through ONNX Runtime
+- hashing: deterministic feature hashing of words, for tests and offline benchmarks
+
+Changing the backend or model changes the vector space, so tables have to be
+rebuilt with a full reindex afterwards.
+"""
+
+import hashlib
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+import numpy as np
+from agno.embedder.base import Embedder
+from agno.embedder.google import GeminiEmbedder
+from loguru import logger
+
+from ..settings import settings
+
+DEFAULT_LOCAL_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Output dimensions of common local models, so tables can be created without loading the model
+_LOCAL_MODEL_DIMENSIONS = {
+    "sentence-transformers/all-MiniLM-L6-v2": 384,
+    "sentence-transformers/all-MiniLM-L12-v2": 384,
+    "sentence-transformers/all-mpnet-base-v2": 768,
+    "BAAI/bge-small-en-v1.5": 384,
+    "BAAI/bge-base-en-v1.5": 768,
+}
+
+_WORD = re.compile(r"\w+")
+
+
+@dataclass
+class LocalEmbedder(Embedder):
+    """Embedder running a sentence-transformers model in-process on the CPU.
+
+    The model is loaded on first use. get_embeddings encodes a whole batch in
+    one forward pass per batch_size texts and returns normalized float32
+    vectors, which is what embed_texts uses during indexing.
+    """
+
+    id: str = DEFAULT_LOCAL_MODEL
+    dimensions: int | None = None
+    batch_size: int = 64
+    runtime: Literal["torch", "onnx"] = "torch"
+    device: str = "cpu"
+    normalize: bool = True
+    _model: Any = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.dimensions is None:
+            self.dimensions = _LOCAL_MODEL_DIMENSIONS.get(self.id)
+        if self.dimensions is None:
+            self.dimensions = self.model.get_sentence_embedding_dimension()
+
+    @property
+    def model(self) -> Any:
+        """The loaded SentenceTransformer model."""
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                raise ImportError(
+                    "`sentence-transformers` not installed, please run `uv add sentence-transformers` "
+                    "(and `optimum[onnxruntime]` for the onnx runtime)"
+                ) from None
+
+            logger.info(f"Loading local embedding model {self.id} ({self.runtime} on {self.device})")
+            self._model = SentenceTransformer(self.id, device=self.device, backend=self.runtime)
+        return self._model
+
+    def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Embed several texts in batches.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding per text, in input order
+        """
+        if not texts:
+            return []
+        # The model already uses every core for a batch; concurrent calls would only contend
+        with self._lock:
+            vectors = self.model.encode(
+                texts,
+                batch_size=self.batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=self.normalize,
+                show_progress_bar=False,
+            )
+        embeddings: list[list[float]] = np.asarray(vectors, dtype=np.float32).tolist()
+        return embeddings
+
+    def get_embedding(self, text: str) -> list[float]:
+        return self.get_embeddings([text])[0]
+
+    def get_embedding_and_usage(self, text: str) -> tuple[list[float], dict | None]:
+        return self.get_embedding(text), None
+
+
+@dataclass
+class HashingEmbedder(Embedder):
+    """Deterministic local embedder based on feature hashing of words.
+
+    Texts sharing words get similar vectors, which is enough to make
+    retrieval meaningful without a model or an embedding API.
+    """
+
+    id: str = "hashing"
+    dimensions: int = 256
+
+    def get_embedding(self, text: str) -> list[float]:
+        vector = [0.0] * (self.dimensions or 256)
+        for word in _WORD.findall(text.lower()):
+            digest = hashlib.md5(word.encode("utf-8")).digest()
+            bucket = int.from_bytes(digest[:4], "little") % len(vector)
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+    def get_embedding_and_usage(self, text: str) -> tuple[list[float], dict | None]:
+        return self.get_embedding(text), None
+
+
+def create_embedder(
+    backend: Literal["gemini", "local", "hashing"] | None = None,
+    model: str | None = None,
+    dimensions: int | None = None,
+    gemini_model: str = "gemini-embedding-001",
+) -> Embedder:
+    """Create the embedder selected in the knowledge settings.
+
+    Args:
+        backend: Embedding backend (default: knowledge.embedder setting)
+        model: Model id (default: knowledge.embedding_model setting, then the backend default)
+        dimensions: Embedding dimensions (default: knowledge.embedding_dimensions setting, then the model default)
+        gemini_model: Gemini model used when neither model nor the setting is given
+
+    Returns:
+        Embedder instance
+    """
+    config = settings.knowledge
+    backend = backend or config.embedder
+    model = model or config.embedding_model
+    dimensions = dimensions or config.embedding_dimensions
+
+    if backend == "local":
+        return LocalEmbedder(
+            id=model or DEFAULT_LOCAL_MODEL,
+            dimensions=dimensions,
+            batch_size=config.local_batch_size,
+            runtime=config.local_runtime,
+        )
+    if backend == "hashing":
+        return HashingEmbedder(dimensions=dimensions or 256)
+    if backend == "gemini":
+        embedder = GeminiEmbedder(id=model or gemini_model)
+        if dimensions:
+            embedder.dimensions = dimensions
+        return embedder
+    raise ValueError(f"Unknown embedder backend: {backend}")
@@ -0,0 +1,247 @@
+"""Embedding helpers for the knowledge vector databases."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from agno.embedder.base import Embedder
+from loguru import logger
+
+from ..settings import settings
+
+EMBEDDING_CACHE_FILE = "embedding_cache.sqlite"
+
+
+class EmbeddingCache:
+    """On-disk embedding cache keyed by (embedder id, dimensions, sha256 of text).
+
+    Vectors are stored as float32 blobs in SQLite, which matches the precision
+    LanceDB stores them with. The cache is safe to share between threads.
+    """
+
+    def __init__(self, cache_path: Path):
+        """Initialize embedding cache.
+
+        Args:
+            cache_path: SQLite database file
+        """
+        self.cache_path = cache_path
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(cache_path), check_same_thread=False, timeout=30)
+        self._create_schema()
+        self._connection.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def _create_schema(self) -> None:
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, dimensions INTEGER NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, "
+            "PRIMARY KEY (model, dimensions, text_hash))"
+        )
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """Return the cache key hash for a text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, model: str, dimensions: int, text: str) -> list[float] | None:
+        """Look up a cached embedding.
+
+        Args:
+            model: Embedder id
+            dimensions: Embedding dimensions
+            text: Embedded text
+
+        Returns:
+            The cached embedding or None on a miss
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT vector FROM embeddings WHERE model = ? AND dimensions = ? AND text_hash = ?",
+                (model, dimensions, self.text_hash(text)),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return array("f", row[0]).tolist()
+
+    def put(self, model: str, dimensions: int, text: str, embedding: list[float]) -> None:
+        """Store an embedding.
+
+        Args:
+            model: Embedder id
+            dimensions: Embedding dimensions
+            text: Embedded text
+            embedding: Embedding vector
+        """
+        if not embedding:
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO embeddings (model, dimensions, text_hash, vector) VALUES (?, ?, ?, ?)",
+                (model, dimensions, self.text_hash(text), array("f", embedding).tobytes()),
+            )
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class QueryEmbeddingCache(EmbeddingCache):
+    """Small LRU-bounded embedding cache for search queries.
+
+    The database can be shared by several processes; SQLite serializes the
+    writes. Entries record when they were last used and the least recently
+    used ones are evicted once the cache grows past max_entries.
+    """
+
+    def __init__(self, cache_path: Path, max_entries: int = 2048):
+        """Initialize query embedding cache.
+
+        Args:
+            cache_path: SQLite database file
+            max_entries: Maximum number of cached query embeddings
+        """
+        self.max_entries = max_entries
+        super().__init__(cache_path)
+
+    def _create_schema(self) -> None:
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS query_embeddings ("
+            "model TEXT NOT NULL, dimensions INTEGER NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, "
+            "last_used REAL NOT NULL, PRIMARY KEY (model, dimensions, text_hash))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS query_embeddings_last_used ON query_embeddings (last_used)"
+        )
+
+    def get(self, model: str, dimensions: int, text: str) -> list[float] | None:
+        key = (model, dimensions, self.text_hash(text))
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT vector FROM query_embeddings WHERE model = ? AND dimensions = ? AND text_hash = ?", key
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE query_embeddings SET last_used = ? WHERE model = ? AND dimensions = ? AND text_hash = ?",
+                (time.time(), *key),
+            )
+            self._connection.commit()
+            self.hits += 1
+        return array("f", row[0]).tolist()
+
+    def put(self, model: str, dimensions: int, text: str, embedding: list[float]) -> None:
+        if not embedding:
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO query_embeddings (model, dimensions, text_hash, vector, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (model, dimensions, self.text_hash(text), array("f", embedding).tobytes(), time.time()),
+            )
+            self._connection.execute(
+                "DELETE FROM query_embeddings WHERE rowid IN "
+                "(SELECT rowid FROM query_embeddings ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._connection.commit()
+
+
+# Query caches are shared by every embedder in the process that uses the same file
+_query_caches: dict[Path, QueryEmbeddingCache] = {}
+_query_caches_lock = threading.Lock()
+
+
+def get_query_cache(cache_path: Path | None = None, max_entries: int | None = None) -> QueryEmbeddingCache:
+    """Return the process-wide query embedding cache for a database file.
+
+    Args:
+        cache_path: SQLite database file (default: knowledge.query_cache_path setting)
+        max_entries: Maximum number of cached queries (default: knowledge.query_cache_size setting)
+
+    Returns:
+        QueryEmbeddingCache shared by all callers using the same file
+    """
+    cache_path = (cache_path or settings.knowledge.query_cache_path).resolve()
+    with _query_caches_lock:
+        cache = _query_caches.get(cache_path)
+        if cache is None:
+            cache = QueryEmbeddingCache(cache_path, max_entries or settings.knowledge.query_cache_size)
+            _query_caches[cache_path] = cache
+        return cache
+
+
+@dataclass
+class CachedEmbedder(Embedder):
+    """Embedder wrapper that serves repeated texts from an EmbeddingCache.
+
+    Document chunks are embedded through get_embedding_and_usage and use
+    cache; vector database searches embed their query through get_embedding,
+    which uses query_cache when one is set.
+    """
+
+    embedder: Embedder = field(default_factory=Embedder)
+    cache: EmbeddingCache | None = None
+    query_cache: EmbeddingCache | None = None
+
+    def __post_init__(self) -> None:
+        self.dimensions = self.embedder.dimensions
+
+    @property
+    def id(self) -> str:
+        """Identifier of the wrapped embedder, used as part of the cache key."""
+        return str(getattr(self.embedder, "id", type(self.embedder).__name__))
+
+    def _cached_embedding(self, cache: EmbeddingCache | None, text: str) -> tuple[list[float], dict[str, Any] | None]:
+        if cache is not None:
+            cached = cache.get(self.id, self.dimensions or 0, text)
+            if cached is not None:
+                return cached, None
+
+        embedding, usage = self.embedder.get_embedding_and_usage(text)
+        if cache is not None:
+            cache.put(self.id, self.dimensions or 0, text, embedding)
+        return embedding, usage
+
+    def get_embedding(self, text: str) -> list[float]:
+        return self._cached_embedding(self.query_cache or self.cache, text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> tuple[list[float], dict[str, Any] | None]:
+        return self._cached_embedding(self.cache, text)
+
+
+def create_cached_embedder(
+    embedder: Embedder, cache_dir: Path, query_cache: EmbeddingCache | None = None
+) -> CachedEmbedder:
+    """Wrap an embedder with the shared on-disk embedding caches.
+
+    Args:
+        embedder: Embedder doing the actual work
+        cache_dir: Directory holding the chunk cache database (usually the LanceDB directory)
+        query_cache: Cache for query embeddings (default: the process-wide cache from get_query_cache)
+
+    Returns:
+        CachedEmbedder backed by the chunk cache in cache_dir and the query cache
+    """
+    if isinstance(embedder, CachedEmbedder):
+        return embedder
+    cache = EmbeddingCache(cache_dir / EMBEDDING_CACHE_FILE)
+    query_cache = query_cache or get_query_cache()
+    logger.debug(
+        f"Using embedding caches {cache.cache_path} and {query_cache.cache_path} "
+        f"for {getattr(embedder, 'id', embedder)}"
+    )
+    return CachedEmbedder(embedder=embedder, cache=cache, query_cache=query_cache)
@@ -0,0 +1,200 @@
+"""Per-file fingerprint tracking for incremental knowledge base indexing."""
+
+import hashlib
+import json
+from pathlib import Path
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+
+class FileFingerprint(BaseModel):
+    """Fingerprint of an indexed file and the vector rows produced from it."""
+
+    path: str
+    size: int
+    mtime: float
+    content_hash: str
+    chunk_ids: list[str] = Field(default_factory=list)
+
+
+class FileChangeSet(BaseModel):
+    """Difference between the files on disk and the last indexed state."""
+
+    added: list[Path] = Field(default_factory=list)
+    changed: list[Path] = Field(default_factory=list)
+    removed: list[str] = Field(default_factory=list)
+    unchanged: list[Path] = Field(default_factory=list)
+
+    @property
+    def to_index(self) -> list[Path]:
+        """Files that need to be (re)chunked and embedded."""
+        return self.added + self.changed
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any file was added, changed or removed."""
+        return bool(self.added or self.changed or self.removed)
+
+
+def hash_file(file_path: Path, block_size: int = 1024 * 1024) -> str:
+    """Compute the SHA-256 hash of a file's content.
+
+    Args:
+        file_path: File to hash
+        block_size: Number of bytes read per iteration
+
+    Returns:
+        Hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while block := f.read(block_size):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class FingerprintStore:
+    """Persistent store of file fingerprints for a single vector table.
+
+    The store lives next to the LanceDB data so that it always describes the
+    table it belongs to. Files whose size and mtime are unchanged are assumed
+    unchanged; otherwise the content hash decides.
+    """
+
+    def __init__(self, store_path: Path):
+        """Initialize fingerprint store.
+
+        Args:
+            store_path: JSON file holding the fingerprints
+        """
+        self.store_path = store_path
+        self.fingerprints: dict[str, FileFingerprint] = {}
+
+    @classmethod
+    def for_table(cls, vector_db_path: Path, table_name: str) -> "FingerprintStore":
+        """Load the fingerprint store belonging to a LanceDB table.
+
+        Args:
+            vector_db_path: LanceDB storage directory
+            table_name: Name of the LanceDB table
+
+        Returns:
+            FingerprintStore instance (empty if nothing was stored yet)
+        """
+        store = cls(vector_db_path / f"{table_name}.fingerprints.json")
+        store.load()
+        return store
+
+    def load(self) -> None:
+        """Load fingerprints from disk, starting empty if the file is missing or invalid."""
+        self.fingerprints = {}
+        if not self.store_path.exists():
+            logger.debug(f"No fingerprint store found at {self.store_path}")
+            return
+
+        try:
+            with open(self.store_path, encoding="utf-8") as f:
+                data = json.load(f)
+            for entry in data.get("files", []):
+                fingerprint = FileFingerprint(**entry)
+                self.fingerprints[fingerprint.path] = fingerprint
+            logger.debug(f"Loaded {len(self.fingerprints)} fingerprints from {self.store_path}")
+        except Exception as e:
+            logger.error(f"Failed to load fingerprint store {self.store_path}: {e}")
+            self.fingerprints = {}
+
+    def save(self) -> None:
+        """Save fingerprints to disk."""
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"files": [fp.model_dump(mode="json") for fp in self.fingerprints.values()]}
+
+        tmp_path = self.store_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        tmp_path.replace(self.store_path)
+
+        logger.debug(f"Saved {len(self.fingerprints)} fingerprints to {self.store_path}")
+
+    def clear(self) -> None:
+        """Forget all fingerprints and remove the store file."""
+        self.fingerprints = {}
+        if self.store_path.exists():
+            self.store_path.unlink()
+
+    def diff(self, files: list[Path]) -> FileChangeSet:
+        """Compare files on disk against the stored fingerprints.
+
+        Args:
+            files: Files currently present in the knowledge directory
+
+        Returns:
+            FileChangeSet describing added, changed, removed and unchanged files
+        """
+        changes = FileChangeSet()
+        seen: set[str] = set()
+
+        for file_path in files:
+            key = str(file_path)
+            seen.add(key)
+            previous = self.fingerprints.get(key)
+
+            if previous is None:
+                changes.added.append(file_path)
+                continue
+
+            try:
+                stat = file_path.stat()
+            except OSError as e:
+                logger.debug(f"Cannot stat {file_path}, treating as removed: {e}")
+                seen.discard(key)
+                continue
+
+            if stat.st_size == previous.size and stat.st_mtime == previous.mtime:
+                changes.unchanged.append(file_path)
+            elif hash_file(file_path) == previous.content_hash:
+                # Rewritten with identical content (e.g. re-synced): refresh stat info only
+                previous.size = stat.st_size
+                previous.mtime = stat.st_mtime
+                changes.unchanged.append(file_path)
+            else:
+                changes.changed.append(file_path)
+
+        changes.removed = [path for path in self.fingerprints if path not in seen]
+        return changes
+
+    def record(self, file_path: Path, chunk_ids: list[str]) -> FileFingerprint:
+        """Record the fingerprint of a freshly indexed file.
+
+        Args:
+            file_path: Indexed file
+            chunk_ids: Vector row ids produced from the file
+
+        Returns:
+            The stored FileFingerprint
+        """
+        stat = file_path.stat()
+        fingerprint = FileFingerprint(
+            path=str(file_path),
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            content_hash=hash_file(file_path),
+            chunk_ids=chunk_ids,
+        )
+        self.fingerprints[fingerprint.path] = fingerprint
+        return fingerprint
+
+    def forget(self, path: str) -> FileFingerprint | None:
+        """Remove a file from the store.
+
+        Args:
+            path: Stored file path
+
+        Returns:
+            The removed fingerprint, or None if the path was unknown
+        """
+        return self.fingerprints.pop(path, None)
+
+    def referenced_chunk_ids(self) -> set[str]:
+        """Return all chunk ids referenced by any stored file."""
+        return {chunk_id for fp in self.fingerprints.values() for chunk_id in fp.chunk_ids}
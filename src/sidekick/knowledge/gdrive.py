@@ -5,9 +5,10 @@ from typing import Any
 
 from loguru import logger
 
-from ..utils.gdrive import GoogleDriveExporter, GoogleDriveExporterConfig
-from .base import DownloadResult, KnowledgeSource
+from ..utils.gdrive import ExportedDocument, GoogleDriveExporter, GoogleDriveExporterConfig
+from .base import DownloadResult, KnowledgeSource, ResourceState
 from .config import GDriveSourceConfig
+from .manifest import Manifest
 
 
 class GDriveSource(KnowledgeSource):
@@ -27,6 +28,7 @@ class GDriveSource(KnowledgeSource):
         self.exporter_config = GoogleDriveExporterConfig(
             target_directory=self.output_dir,
             export_format=config.export_format,  # type: ignore[arg-type]
+            max_workers=config.max_workers,
         )
 
     def download(self, **kwargs) -> DownloadResult:
@@ -52,7 +54,7 @@ class GDriveSource(KnowledgeSource):
             self.exporter_config.link_depth = depth
             self.exporter_config.follow_links = depth > 0
 
-            # Callback to track all downloaded files (including linked documents)
+            # Callback to track all downloaded files (including linked documents), called from export threads
             def download_callback(document_id: str, format_key: str, output_path: Path, success: bool):
                 if success and output_path.exists():
                     result.files_downloaded.append(output_path)
@@ -74,64 +76,99 @@ class GDriveSource(KnowledgeSource):
 
         return result
 
-    def sync(self, manifest: dict[str, Any] | None = None) -> DownloadResult:
+    def _previous_documents(self, manifest: Manifest | None) -> dict[str, ExportedDocument]:
+        """Convert the documents recorded in the previous manifest for the exporter."""
+        if manifest is None:
+            return {}
+        return {
+            document_id: ExportedDocument(
+                document_id=document_id,
+                modified_time=state.modified_time,
+                version=state.version,
+                files=[self.base_path / file for file in state.files],
+                links=state.links,
+            )
+            for document_id, state in manifest.resources.items()
+        }
+
+    def _detect_changes(self, exporter: GoogleDriveExporter, cursor: str | None) -> tuple[set[str] | None, str | None]:
+        """Ask the Drive Changes API which files changed since the previous sync.
+
+        Args:
+            exporter: Exporter with the authenticated Drive service
+            cursor: Page token stored by the previous sync
+
+        Returns:
+            IDs of the changed files (None if unknown) and the page token for the next sync
+        """
+        try:
+            if cursor is None:
+                # First sync: every document is exported, remember where the changes start
+                return None, exporter.get_start_page_token()
+            changed_ids, next_cursor = exporter.list_changed_ids(cursor)
+            logger.info(f"Drive reports {len(changed_ids)} changed files since the last sync")
+            return changed_ids, next_cursor
+        except Exception as e:
+            logger.warning(f"Drive Changes API unavailable, comparing document metadata instead: {e}")
+            return None, None
+
+    def sync(self, manifest: dict[str, Any] | None = None, resume: bool = False) -> DownloadResult:
         """Sync Google Drive documents based on configuration.
 
+        Documents whose modifiedTime and version are unchanged since the previous
+        sync are not exported again; their files are kept and their recorded
+        links are still followed.
+
         Args:
-            manifest: Previous manifest (not used for Google Drive)
+            manifest: Previous manifest, with the state of every exported document
+            resume: Not used, syncs always start over
 
         Returns:
-            DownloadResult with downloaded files
+            DownloadResult with downloaded files, unchanged files and the state of every document
         """
         result = DownloadResult(source_name=self.config.name)
+        previous_manifest = Manifest(**manifest) if manifest else None
 
         try:
-            # Update exporter config for each document's depth settings
-            max_depth = max((doc.get("depth", 0) for doc in self.config.documents), default=0)
-            self.exporter_config.link_depth = max_depth
-            self.exporter_config.follow_links = max_depth > 0
-
-            # Callback to track all downloaded files (including linked documents)
+            # Callback to track all downloaded files (including linked documents), called from export threads
             def download_callback(document_id: str, format_key: str, output_path: Path, success: bool):
                 if success and output_path.exists():
                     result.files_downloaded.append(output_path)
                     logger.debug(f"Tracked download: {output_path.name} (doc: {document_id}, format: {format_key})")
 
-            # Create exporter with callback
-            exporter = GoogleDriveExporter(self.exporter_config, download_callback=download_callback)
-
-            # Process each document with its specific settings
-            for doc_config in self.config.documents:
-                url = doc_config["url"]
-                depth = doc_config.get("depth", 0)
-
-                logger.debug(f"Processing document: {url} (depth={depth})")
-
-                # Extract document ID
-                doc_id = exporter.extract_document_id(url)
-
-                # Set depth for this specific document
-                self.exporter_config.link_depth = depth
-                self.exporter_config.follow_links = depth > 0
-
-                # Re-create exporter with updated config and same callback
-                exporter = GoogleDriveExporter(self.exporter_config, download_callback=download_callback)
-
-                # Export this document (callback will track all downloads)
-                try:
-                    exporter.export_multiple([doc_id])
-                    files_count = len([f for f in result.files_downloaded])
-                    logger.debug(f"Export completed for {url}, tracked {files_count} total files so far")
-
-                except Exception as e:
-                    error_msg = f"Failed to export {url}: {e}"
-                    logger.error(error_msg)
-                    result.errors.append(error_msg)
-
-            logger.info(f"Synced {len(result.files_downloaded)} files from Google Drive")
+            # One exporter for all documents, so documents reached from several roots are exported once
+            exporter = GoogleDriveExporter(
+                self.exporter_config,
+                download_callback=download_callback,
+                previous=self._previous_documents(previous_manifest),
+            )
+            if self.config.use_changes_api:
+                exporter.changed_ids, result.cursor = self._detect_changes(
+                    exporter, previous_manifest.cursor if previous_manifest else None
+                )
+
+            # Export all documents together, each following links up to its own depth
+            roots = [(doc_config["url"], doc_config.get("depth", 0)) for doc_config in self.config.documents]
+            exporter.export_documents(roots)
+            result.errors.extend(exporter.errors)
+
+            for document in exporter.documents.values():
+                result.resources[document.document_id] = ResourceState(
+                    modified_time=document.modified_time,
+                    version=document.version,
+                    files=[str(path.relative_to(self.base_path)) for path in document.files],
+                    links=document.links,
+                )
+                if document.unchanged:
+                    result.files_unchanged.extend(document.files)
+
+            logger.info(
+                f"Synced {len(result.files_downloaded)} files from Google Drive "
+                f"({len(result.files_unchanged)} files of unchanged documents kept)"
+            )
 
             # Set success based on whether we got any files and no critical errors
-            result.success = len(result.files_downloaded) > 0 or len(self.config.documents) == 0
+            result.success = bool(result.current_files) or len(self.config.documents) == 0
 
         except Exception as e:
             logger.error(f"Failed to sync Google Drive: {e}")
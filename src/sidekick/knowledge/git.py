@@ -43,11 +43,12 @@ class GitSource(KnowledgeSource):
 
         return self._clone_and_copy(url, branch, files)
 
-    def sync(self, manifest: dict[str, Any] | None = None) -> DownloadResult:
+    def sync(self, manifest: dict[str, Any] | None = None, resume: bool = False) -> DownloadResult:
         """Sync git repository based on configuration.
 
         Args:
             manifest: Previous manifest (not used for Git)
+            resume: Not used, syncs always start over
 
         Returns:
             DownloadResult with downloaded files
@@ -0,0 +1,351 @@
+"""ANN and full-text index management for the knowledge LanceDB tables."""
+
+import math
+import time
+from typing import Any, Literal
+
+import pyarrow as pa
+from agno.document.base import Document
+from agno.vectordb.distance import Distance
+from agno.vectordb.lancedb import LanceDb, SearchType
+from loguru import logger
+from pydantic import BaseModel
+
+from ..settings import settings
+
+# Column holding the serialized document, searched by the full-text index
+FTS_COLUMN = "payload"
+
+# IVF training needs enough rows per partition to be meaningful
+MIN_ROWS_PER_PARTITION = 256
+
+# Metadata columns stored next to agno's id, vector and payload columns; all are nullable
+METADATA_COLUMNS = (
+    pa.field("source", pa.string()),
+    pa.field("file_type", pa.string()),
+    pa.field("path", pa.string()),
+    pa.field("synced_at", pa.string()),
+    pa.field("versions", pa.list_(pa.string())),
+)
+
+# Filter keys compared against synced_at (ISO 8601 UTC timestamps compare as strings)
+_RANGE_FILTERS = {"synced_after": ">=", "synced_before": "<"}
+
+_MISSING = object()
+
+# Score columns of hybrid, full-text and vector results, with the sign that makes higher better
+_SCORE_COLUMNS = (("_relevance_score", 1.0), ("_score", 1.0), ("_distance", -1.0))
+
+
+class IndexResult(BaseModel):
+    """Outcome of an index maintenance run."""
+
+    rows: int = 0
+    vector_index: Literal["created", "updated", "none"] = "none"
+    fts_index: Literal["created", "updated", "none"] = "none"
+    seconds: float = 0.0
+
+
+def _sql_literal(value: Any) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _like_pattern(value: str) -> str:
+    """Turn a "*" wildcard pattern into a LIKE pattern, escaping the LIKE wildcards "%" and "_"."""
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped.replace("*", "%")
+
+
+def build_prefilter(filters: dict[str, Any] | None) -> tuple[str | None, dict[str, Any] | None]:
+    """Translate search filters into a LanceDB SQL prefilter.
+
+    Supported keys:
+
+    - source, file_type, path: a value or a list of values; values containing
+      "*" are matched as wildcards (e.g. path "gdrive/*"), "*" being the only
+      wildcard character
+    - version (or versions): a version tag or list of tags, matching rows tagged with any of them
+    - synced_after, synced_before: ISO 8601 timestamps bounding synced_at
+
+    Args:
+        filters: Search filters
+
+    Returns:
+        (SQL where clause or None, remaining filters to match against document metadata or None)
+    """
+    if not filters:
+        return None, None
+
+    clauses: list[str] = []
+    remaining: dict[str, Any] = {}
+    columns = {column.name for column in METADATA_COLUMNS}
+    for key, value in filters.items():
+        if value is None:
+            continue
+        values = list(value) if isinstance(value, list | tuple | set) else [value]
+        if key in ("version", "versions"):
+            clauses.append(f"array_has_any(versions, [{', '.join(_sql_literal(v) for v in values)}])")
+        elif key in _RANGE_FILTERS:
+            clauses.append(f"synced_at {_RANGE_FILTERS[key]} {_sql_literal(value)}")
+        elif key in columns and key != "versions":
+            exact = [v for v in values if "*" not in str(v)]
+            conditions = [
+                f"{key} LIKE {_sql_literal(_like_pattern(str(v)))} ESCAPE '\\'" for v in values if v not in exact
+            ]
+            if len(exact) == 1:
+                conditions.append(f"{key} = {_sql_literal(exact[0])}")
+            elif exact:
+                conditions.append(f"{key} IN ({', '.join(_sql_literal(v) for v in exact)})")
+            clauses.append(conditions[0] if len(conditions) == 1 else "(" + " OR ".join(conditions) + ")")
+        else:
+            remaining[key] = value
+
+    return (" AND ".join(clauses) or None), (remaining or None)
+
+
+def _indexed_columns(table: Any) -> dict[str, str]:
+    """Map indexed column names to their index type."""
+    return {column: str(index.index_type) for index in table.list_indices() for column in index.columns}
+
+
+class IndexedLanceDb(LanceDb):
+    """LanceDb with metadata columns, filter pushdown, query tuning and persisted full-text indexes.
+
+    agno's LanceDb builds a tantivy full-text index on the first keyword or
+    hybrid search of every process. This subclass uses LanceDB's native
+    full-text index, which is stored with the table and kept up to date by
+    ensure_indexes, and only builds it when the table has none. Vector
+    queries use nprobes and refine_factor when the table has an IVF index.
+
+    Tables get the METADATA_COLUMNS next to agno's id, vector and payload
+    columns (existing tables are migrated with empty columns). Search filters
+    on these columns are applied by LanceDB as a prefilter, see
+    build_prefilter; other filter keys are matched against the document
+    metadata after the search, as in LanceDb.
+    """
+
+    def __init__(self, *args, refine_factor: int | None = None, **kwargs):
+        """Initialize indexed LanceDb.
+
+        Args:
+            *args: Passed to LanceDb
+            refine_factor: Re-rank refine_factor * limit ANN candidates with exact distances
+            **kwargs: Passed to LanceDb (nprobes sets the IVF partitions probed per query)
+        """
+        kwargs.setdefault("use_tantivy", False)
+        super().__init__(*args, **kwargs)
+        self.refine_factor = refine_factor
+        self.vector_index_exists = False
+        if self.table is not None:
+            try:
+                indexed = _indexed_columns(self.table)
+                self.fts_index_exists = FTS_COLUMN in indexed
+                self.vector_index_exists = self._vector_col in indexed
+                self._add_metadata_columns()
+            except Exception as e:
+                logger.debug(f"Could not inspect table {self.table_name}: {e}")
+
+    def _base_schema(self) -> pa.Schema:
+        schema = super()._base_schema()
+        for column in METADATA_COLUMNS:
+            schema = schema.append(column)
+        return schema
+
+    def _add_metadata_columns(self) -> None:
+        """Add metadata columns missing from a table created by an older version."""
+        missing = [column for column in METADATA_COLUMNS if column.name not in self.table.schema.names]  # type: ignore[union-attr]
+        if missing:
+            logger.info(f"Adding metadata columns {', '.join(c.name for c in missing)} to {self.table_name}")
+            self.table.add_columns(pa.schema(missing))  # type: ignore[union-attr]
+
+    def _tune(self, query: Any, where: str | None = None) -> Any:
+        if where:
+            query = query.where(where, prefilter=True)
+        if not self.vector_index_exists:
+            # Without an index the search is exhaustive and exact, there is nothing to tune
+            return query
+        if self.nprobes:
+            query = query.nprobes(self.nprobes)
+        if self.refine_factor:
+            query = query.refine_factor(self.refine_factor)
+        return query
+
+    def vector_search(self, query: str, limit: int = 5, where: str | None = None) -> Any:
+        query_embedding = self.embedder.get_embedding(query)
+        if not query_embedding:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return None
+
+        if self.table is None:
+            logger.error("Table not initialized. Please create the table first")
+            return None
+
+        results = self.table.search(query=query_embedding, vector_column_name=self._vector_col).limit(limit)
+        return self._tune(results, where).to_pandas()
+
+    def hybrid_search(self, query: str, limit: int = 5, where: str | None = None) -> Any:
+        query_embedding = self.embedder.get_embedding(query)
+        if not query_embedding:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        if self.table is None:
+            logger.error("Table not initialized. Please create the table first")
+            return []
+
+        if not self.fts_index_exists:
+            self.table.create_fts_index(FTS_COLUMN, use_tantivy=self.use_tantivy, replace=True)
+            self.fts_index_exists = True
+
+        results = (
+            self.table.search(vector_column_name=self._vector_col, query_type="hybrid")
+            .vector(query_embedding)
+            .text(query)
+            .limit(limit)
+        )
+        return self._tune(results, where).to_pandas()
+
+    def keyword_search(self, query: str, limit: int = 5, where: str | None = None) -> Any:
+        if self.table is None:
+            logger.error("Table not initialized. Please create the table first")
+            return []
+
+        if not self.fts_index_exists:
+            self.table.create_fts_index(FTS_COLUMN, use_tantivy=self.use_tantivy, replace=True)
+            self.fts_index_exists = True
+
+        results = self.table.search(query=query, query_type="fts").limit(limit)
+        if where:
+            results = results.where(where, prefilter=True)
+        return results.to_pandas()
+
+    def search(self, query: str, limit: int = 5, filters: dict[str, Any] | None = None) -> list[Document]:
+        """Search for documents, pushing filters on metadata columns down into the LanceDB query.
+
+        Args:
+            query: Query string to search for
+            limit: Maximum number of results to return
+            filters: Column filters (see build_prefilter) and document metadata filters
+
+        Returns:
+            Matching documents, best first
+        """
+        if self.connection:
+            self.table = self.connection.open_table(name=self.table_name)
+
+        where, meta_filters = build_prefilter(filters)
+        if where:
+            logger.debug(f"Searching {self.table_name} with prefilter: {where}")
+
+        if self.search_type == SearchType.vector:
+            results = self.vector_search(query, limit, where)
+        elif self.search_type == SearchType.keyword:
+            results = self.keyword_search(query, limit, where)
+        else:
+            results = self.hybrid_search(query, limit, where)
+
+        if results is None or len(results) == 0:
+            return []
+
+        documents = self._build_search_results(results)
+        if meta_filters:
+            documents = [
+                doc
+                for doc in documents
+                if all((doc.meta_data or {}).get(key, _MISSING) == value for key, value in meta_filters.items())
+            ]
+        if self.reranker and documents:
+            documents = self.reranker.rerank(query=query, documents=documents)
+        return documents
+
+    async def async_search(self, query: str, limit: int = 5, filters: dict[str, Any] | None = None) -> list[Document]:
+        # LanceDB has no async search yet, LanceDb.async_search runs the search synchronously as well
+        return self.search(query, limit=limit, filters=filters)
+
+    def _build_search_results(self, results: Any) -> list[Document]:
+        """Build documents and keep the search score as reranking_score (higher is better)."""
+        documents = super()._build_search_results(results)
+        for column, sign in _SCORE_COLUMNS:
+            if column in results.columns:
+                for document, value in zip(documents, results[column], strict=False):
+                    document.reranking_score = sign * float(value)
+                break
+        return documents
+
+
+def create_indexed_lancedb(**kwargs) -> IndexedLanceDb:
+    """Create an IndexedLanceDb with query tuning from the knowledge settings.
+
+    Args:
+        **kwargs: Passed to IndexedLanceDb (uri, table_name, embedder, search_type, ...)
+
+    Returns:
+        IndexedLanceDb instance
+    """
+    kwargs.setdefault("nprobes", settings.knowledge.nprobes)
+    kwargs.setdefault("refine_factor", settings.knowledge.refine_factor)
+    return IndexedLanceDb(**kwargs)
+
+
+def ensure_indexes(vector_db: LanceDb, min_rows: int | None = None, changed: bool = True) -> IndexResult:
+    """Build or refresh the vector and full-text indexes of a knowledge table.
+
+    A vector index is created once the table has at least min_rows rows (and
+    enough rows to train one); a full-text index on the payload is created
+    whenever it is missing. Existing indexes are brought up to date with rows
+    written since they were built by optimizing the table, which also
+    compacts small data files.
+
+    Args:
+        vector_db: Vector database whose table to index
+        min_rows: Row count from which a vector index is built (default: knowledge.index_min_rows setting)
+        changed: Whether rows were written or deleted since the last run
+
+    Returns:
+        IndexResult describing what was done
+    """
+    start = time.perf_counter()
+    table = vector_db.table
+    result = IndexResult()
+    if table is None:
+        return result
+
+    min_rows = settings.knowledge.index_min_rows if min_rows is None else min_rows
+    result.rows = table.count_rows()
+    indexed = _indexed_columns(table)
+    vector_column = getattr(vector_db, "_vector_col", "vector")
+
+    if vector_column not in indexed and result.rows >= max(min_rows, MIN_ROWS_PER_PARTITION):
+        index_type = settings.knowledge.index_type
+        num_partitions = max(1, min(int(math.sqrt(result.rows)), result.rows // MIN_ROWS_PER_PARTITION))
+        logger.info(
+            f"Building {index_type} index on {vector_db.table_name} ({result.rows} rows, {num_partitions} partitions)"
+        )
+        table.create_index(
+            metric="dot" if vector_db.distance == Distance.max_inner_product else vector_db.distance.value,
+            num_partitions=num_partitions,
+            vector_column_name=vector_column,
+            index_type=index_type,
+            replace=True,
+        )
+        if isinstance(vector_db, IndexedLanceDb):
+            vector_db.vector_index_exists = True
+        result.vector_index = "created"
+
+    if FTS_COLUMN not in indexed and result.rows > 0:
+        logger.info(f"Building full-text index on {vector_db.table_name}.{FTS_COLUMN}")
+        table.create_fts_index(FTS_COLUMN, use_tantivy=False, replace=True)
+        vector_db.fts_index_exists = True
+        result.fts_index = "created"
+
+    if changed and (vector_column in indexed or FTS_COLUMN in indexed):
+        # Adds rows written since the indexes were built to them and compacts fragments
+        table.optimize()
+        if vector_column in indexed:
+            result.vector_index = "updated"
+        if FTS_COLUMN in indexed:
+            result.fts_index = "updated"
+
+    result.seconds = time.perf_counter() - start
+    logger.debug(f"Index maintenance for {vector_db.table_name}: {result}")
+    return result
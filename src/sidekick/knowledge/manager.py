@@ -1,18 +1,29 @@
 """
 Knowledge base management for RHDH documentation.
 
-This module provides functionality to manage and load the Red Hat Developer Hub
-documentation knowledge base using the Agno framework with LanceDB vector storage.
-Supports both markdown and PDF documents.
+This module manages the Red Hat Developer Hub documentation knowledge base,
+stored in a LanceDB table and searched through the Agno framework. Markdown,
+PDF and CSV documents are indexed incrementally: a fingerprint store remembers
+the size, mtime, content hash and row ids of every indexed file, so a reindex
+only chunks and embeds added or changed files and deletes the rows of changed
+and removed ones. Each run returns a ReindexResult with the file and chunk
+counts, embedding throughput and index maintenance. Chunks are stored with the
+metadata columns source, file_type, path, synced_at and versions, which search
+filters are pushed down to.
 """
 
 import asyncio
+import json
+import re
+import time
+from datetime import UTC, datetime
+from hashlib import md5
 from pathlib import Path
+from typing import Any
 
-from agno.document.chunking.markdown import MarkdownChunking
-from agno.document.reader.markdown_reader import MarkdownReader
-from agno.document.reader.pdf_reader import PDFReader
-from agno.embedder.google import GeminiEmbedder
+import pyarrow as pa
+from agno.document.base import Document
+from agno.embedder.base import Embedder
 from agno.knowledge import AgentKnowledge
 from agno.knowledge.combined import CombinedKnowledgeBase
 from agno.knowledge.csv import CSVKnowledgeBase
@@ -20,8 +31,47 @@ from agno.knowledge.markdown import MarkdownKnowledgeBase
 from agno.knowledge.pdf import PDFKnowledgeBase
 from agno.vectordb.lancedb import LanceDb, SearchType
 from loguru import logger
-
-from .chunking import FixedSizeChunking
+from pydantic import BaseModel, Field
+
+from ..settings import settings
+from .batching import BatchEmbedder, ChunkBudget, EmbeddingBatchConfig, EmbeddingStats
+from .chunking import create_fixed_size_chunking
+from .dedup import DedupIndex
+from .embedders import create_embedder
+from .embeddings import create_cached_embedder
+from .fingerprints import FingerprintStore
+from .indexing import METADATA_COLUMNS, IndexResult, create_indexed_lancedb, ensure_indexes
+from .parsing import DocumentParser, create_readers
+from .scanner import DocumentScanner
+from .search import SearchKnowledgeBase
+
+# Source name of documents that are not below a source directory
+DEFAULT_SOURCE = "core"
+
+# Version tags in file paths, e.g. "1.5" for "rhdh-1.5/release-notes.md" or "RHDH 1.5.2 Release Plan.md"
+_VERSION_PATTERN = re.compile(r"(?<![\w.])v?(\d+\.\d+)((?:\.\d+)?)(?![\w.]*\d)")
+
+
+class ReindexResult(BaseModel):
+    """Summary of a (re)indexing run."""
+
+    full: bool = False
+    added: int = 0
+    changed: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    chunks_indexed: int = 0
+    chunks_deleted: int = 0
+    chunks_deduplicated: int = 0
+    duration_seconds: float = 0.0
+    embedding: EmbeddingStats = Field(default_factory=EmbeddingStats)
+    index: IndexResult = Field(default_factory=IndexResult)
+
+    @property
+    def files_indexed(self) -> int:
+        """Number of files that were chunked and embedded."""
+        return self.added + self.changed - self.failed
 
 
 class KnowledgeManager:
@@ -32,6 +82,14 @@ class KnowledgeManager:
         knowledge_path: Path | None = None,
         vector_db_path: Path | None = None,
         table_name: str = "rhdh_docs",
+        embedder: Embedder | None = None,
+        batch_config: EmbeddingBatchConfig | None = None,
+        parse_workers: int | None = None,
+        max_in_flight_chunks: int = 1024,
+        index_min_rows: int | None = None,
+        exclude_paths: list[Path] | None = None,
+        source_name: str | None = None,
+        dedup: bool | None = None,
     ):
         """
         Initialize knowledge manager.
@@ -40,6 +98,14 @@ class KnowledgeManager:
             knowledge_path: Path to knowledge documents directory
             vector_db_path: Path for vector database storage
             table_name: Name of the LanceDB table
+            embedder: Embedder for documents and queries (default: knowledge.embedder setting), with embedding cache
+            batch_config: Batching, concurrency and rate limit settings for embedding during indexing
+            parse_workers: Worker processes for parsing and chunking files (default: CPU count)
+            max_in_flight_chunks: Maximum number of parsed chunks held in memory before they are written
+            index_min_rows: Rows from which a vector index is built (default: knowledge.index_min_rows setting)
+            exclude_paths: Directories below knowledge_path that are not indexed
+            source_name: Source name stored with every chunk (default: derived from each file's path)
+            dedup: Store one canonical chunk for near-identical chunks (default: knowledge.dedup setting)
         """
         # Default paths relative to project root - use entire knowledge directory
         if knowledge_path is None:
@@ -52,8 +118,18 @@ class KnowledgeManager:
         self.knowledge_path = knowledge_path
         self.vector_db_path = vector_db_path
         self.table_name = table_name
+        self.embedder = embedder
+        self.batch_config = batch_config or EmbeddingBatchConfig()
+        self.parse_workers = parse_workers
+        self.max_in_flight_chunks = max_in_flight_chunks
+        self.index_min_rows = index_min_rows
+        self.exclude_paths = exclude_paths or []
+        self.source_name = source_name
+        self.dedup = settings.knowledge.dedup if dedup is None else dedup
         self._knowledge: AgentKnowledge | None = None
         self._vector_db: LanceDb | None = None
+        self._fingerprints: FingerprintStore | None = None
+        self._dedup_index: DedupIndex | None = None
 
         logger.debug(
             f"KnowledgeManager initialized: knowledge_path={knowledge_path}, "
@@ -64,15 +140,30 @@ class KnowledgeManager:
         """Get or create the LanceDB vector database instance."""
         if self._vector_db is None:
             logger.debug("Creating LanceDB vector database")
-            self._vector_db = LanceDb(
+            embedder = self.embedder or create_embedder(gemini_model="gemini-embedding-001")
+            self._vector_db = create_indexed_lancedb(
                 uri=str(self.vector_db_path),
                 table_name=self.table_name,
                 search_type=SearchType.hybrid,
-                embedder=GeminiEmbedder(id="gemini-embedding-001"),
+                embedder=create_cached_embedder(embedder, self.vector_db_path),
             )
             logger.debug(f"LanceDB created: {self.vector_db_path}/{self.table_name}")
         return self._vector_db
 
+    def get_fingerprint_store(self) -> FingerprintStore:
+        """Get the fingerprint store tracking which files are indexed in the table."""
+        if self._fingerprints is None:
+            self._fingerprints = FingerprintStore.for_table(self.vector_db_path, self.table_name)
+        return self._fingerprints
+
+    def get_dedup_index(self) -> DedupIndex:
+        """Get the index of canonical chunks used to detect duplicates in the table."""
+        if self._dedup_index is None:
+            self._dedup_index = DedupIndex.for_table(
+                self.vector_db_path, self.table_name, max_distance=settings.knowledge.dedup_max_distance
+            )
+        return self._dedup_index
+
     def check_table_exists(self) -> bool:
         """
         Check if the LanceDB table exists and has data.
@@ -92,57 +183,89 @@ class KnowledgeManager:
             logger.debug(f"Table check failed: {e}")
             return False
 
-    async def reindex(self) -> None:
+    async def reindex(self, full: bool = False) -> ReindexResult:
         """
-        Reindex the knowledge base by recreating the vector database.
+        Reindex the knowledge base.
+
+        By default only files that were added, changed or removed since the last
+        indexing run are processed. A full reindex drops the table and re-embeds
+        every document.
+
+        Args:
+            full: If True, recreate the vector database from scratch
 
-        This will reload all documents and rebuild the vector embeddings.
+        Returns:
+            ReindexResult summarizing the work done
         """
-        logger.info("Starting knowledge base reindexing...")
+        logger.info(f"Starting knowledge base reindexing (full={full})...")
 
         try:
-            # Force reload the knowledge base
-            await self.aload_knowledge(recreate=True, force_reload=True)
+            result = await self.aupdate_index(full=full)
+            self._knowledge = None
             logger.info("Knowledge base reindexing completed successfully")
+            return result
         except Exception as e:
             logger.error(f"Failed to reindex knowledge base: {e}")
             raise RuntimeError(f"Reindexing failed: {e}") from e
 
-    def reindex_sync(self) -> None:
+    def reindex_sync(self, full: bool = False) -> ReindexResult:
         """
         Reindex the knowledge base synchronously.
 
         This is a synchronous wrapper around the async reindex method.
+
+        Args:
+            full: If True, recreate the vector database from scratch
+
+        Returns:
+            ReindexResult summarizing the work done
+        """
+        return asyncio.run(self.reindex(full=full))
+
+    def scan_documents(self, min_size_bytes: int = 50) -> dict[str, list[Path]]:
+        """Find supported documents in the knowledge path, excluding small/empty files.
+
+        Directory listings are cached next to the vector database, so repeated
+        scans only re-list directories whose mtime changed.
+
+        Args:
+            min_size_bytes: Files smaller than this are skipped
+
+        Returns:
+            Mapping of file extension (".md", ".pdf", ".csv") to matching files
         """
-        asyncio.run(self.reindex())
+        scanner = DocumentScanner(
+            self.knowledge_path,
+            cache_path=self.vector_db_path / f"{self.table_name}.scan.json",
+            min_size_bytes=min_size_bytes,
+            exclude=self.exclude_paths,
+        )
+        return scanner.scan()
 
     def _count_documents(self, min_size_bytes: int = 50) -> tuple[list[Path], list[Path], list[Path]]:
         """Count and return markdown, PDF, and CSV files in the knowledge path, excluding small/empty files."""
+        found = self.scan_documents(min_size_bytes)
+        return found[".md"], found[".pdf"], found[".csv"]
+
+    def _create_search_knowledge_base(self, vector_db: LanceDb) -> AgentKnowledge:
+        """Create a knowledge base that searches the existing table.
 
-        def filter_by_size(files: list[Path]) -> list[Path]:
-            """Filter files by minimum size to exclude empty or very small files."""
-            filtered = []
-            for file_path in files:
-                try:
-                    if file_path.stat().st_size >= min_size_bytes:
-                        filtered.append(file_path)
-                    else:
-                        logger.debug(f"Skipping small file ({file_path.stat().st_size} bytes): {file_path}")
-                except (OSError, FileNotFoundError) as e:
-                    logger.debug(f"Error checking file size for {file_path}: {e}")
-            return filtered
-
-        md_files = filter_by_size(list(self.knowledge_path.rglob("*.md")))
-        pdf_files = filter_by_size(list(self.knowledge_path.rglob("*.pdf")))
-        csv_files = filter_by_size(list(self.knowledge_path.rglob("*.csv")))
-        return md_files, pdf_files, csv_files
+        Files are enumerated and readers constructed only when the returned
+        knowledge base is asked for its documents, not for searching.
+        """
+
+        def create_sources() -> AgentKnowledge:
+            md_files, pdf_files, csv_files = self._count_documents()
+            return self._create_knowledge_base(vector_db, md_files, pdf_files, csv_files)
+
+        return SearchKnowledgeBase(source_factory=create_sources, vector_db=vector_db, num_documents=5)
 
     def _create_knowledge_base(
         self, vector_db: LanceDb, md_files: list[Path], pdf_files: list[Path], csv_files: list[Path]
     ) -> AgentKnowledge:
         """Create appropriate knowledge base instance based on available files."""
-        # Create chunking strategy with 20,000 character chunks
-        chunking_strategy = FixedSizeChunking(chunk_size=20000, overlap=200)
+        chunking_strategy = create_fixed_size_chunking(chunk_size=20000, overlap=200)
+        readers = create_readers()
 
         sources: list[AgentKnowledge] = []
 
@@ -154,7 +277,7 @@ class KnowledgeManager:
                 vector_db=vector_db,
                 chunking_strategy=chunking_strategy,
                 num_documents=5,
-                reader=MarkdownReader(chunking_strategy=MarkdownChunking(chunk_size=1000000, overlap=200)),
+                reader=readers.md,
             )
             sources.append(md_kb)
 
@@ -164,7 +287,7 @@ class KnowledgeManager:
             pdf_kb = PDFKnowledgeBase(
                 path=[{"path": str(f)} for f in pdf_files],  # Pass filtered file list as dict format
                 vector_db=vector_db,
-                reader=PDFReader(chunk=True),
+                reader=readers.pdf,
                 chunking_strategy=chunking_strategy,
             )
             sources.append(pdf_kb)
@@ -175,6 +298,7 @@ class KnowledgeManager:
             csv_kb = CSVKnowledgeBase(
                 path=[{"path": str(f)} for f in csv_files],  # Pass filtered file list as dict format
                 vector_db=vector_db,
+                reader=readers.csv,
             )
             sources.append(csv_kb)
 
@@ -185,6 +309,431 @@ class KnowledgeManager:
             num_documents=5,
         )
 
+    def _file_metadata(self, file_path: Path) -> dict[str, Any]:
+        """Return the metadata columns stored with every chunk of a file.
+
+        The source is the source_name of this manager, or else the synced
+        source directory (external/<source>/...) or top-level directory the
+        file is in. synced_at is the file's modification time, i.e. when its
+        content was last written by a sync.
+        """
+        try:
+            relative = file_path.relative_to(self.knowledge_path)
+        except ValueError:
+            relative = Path(file_path.name)
+        parts = relative.parts
+
+        source = self.source_name
+        if source is None:
+            if len(parts) > 2 and parts[0] == "external":
+                source = parts[1]
+            elif len(parts) > 1:
+                source = parts[0]
+            else:
+                source = DEFAULT_SOURCE
+
+        versions: list[str] = []
+        for match in _VERSION_PATTERN.finditer(relative.as_posix()):
+            for tag in (match.group(1), match.group(1) + match.group(2)):
+                if tag not in versions:
+                    versions.append(tag)
+
+        try:
+            synced_at = datetime.fromtimestamp(file_path.stat().st_mtime, UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        except OSError:
+            synced_at = None
+
+        return {
+            "source": source,
+            "file_type": file_path.suffix.lstrip(".").lower(),
+            "path": relative.as_posix(),
+            "synced_at": synced_at,
+            "versions": versions,
+        }
+
+    @staticmethod
+    def _has_content(file_path: Path) -> bool:
+        """Return whether a file exists and is not empty."""
+        try:
+            return file_path.stat().st_size > 0
+        except OSError:
+            return False
+
+    @staticmethod
+    def _chunk_id(document: Document) -> str:
+        """Return the LanceDB row id for a chunk (matches agno's LanceDb id scheme)."""
+        cleaned_content = document.content.replace("\x00", "\ufffd")
+        return md5(cleaned_content.encode()).hexdigest()
+
+    def _delete_rows(self, vector_db: LanceDb, chunk_ids: set[str], batch_size: int = 500) -> int:
+        """Delete rows with the given ids from the vector table."""
+        if not chunk_ids or vector_db.table is None:
+            return 0
+
+        ids = sorted(chunk_ids)
+        for i in range(0, len(ids), batch_size):
+            id_list = ", ".join(f"'{chunk_id}'" for chunk_id in ids[i : i + batch_size])
+            vector_db.table.delete(f"id IN ({id_list})")
+        logger.debug(f"Deleted {len(ids)} stale rows from {self.table_name}")
+        return len(ids)
+
+    def _existing_ids(self, vector_db: LanceDb, chunk_ids: list[str], batch_size: int = 500) -> set[str]:
+        """Return which of the given row ids are already present in the vector table."""
+        if not chunk_ids or vector_db.table is None:
+            return set()
+
+        existing: set[str] = set()
+        for i in range(0, len(chunk_ids), batch_size):
+            batch = chunk_ids[i : i + batch_size]
+            id_list = ", ".join(f"'{chunk_id}'" for chunk_id in batch)
+            rows = vector_db.table.search().where(f"id IN ({id_list})").select(["id"]).limit(len(batch)).to_arrow()
+            existing.update(rows.column("id").to_pylist())
+        return existing
+
+    def _write_rows(self, vector_db: LanceDb, documents: list[Document]) -> int:
+        """Write embedded chunks to the vector table using agno's LanceDb row layout."""
+        data = []
+        for document in documents:
+            if not document.embedding:
+                logger.warning(f"Skipping chunk of {document.name} without embedding")
+                continue
+            cleaned_content = document.content.replace("\x00", "\ufffd")
+            payload = {
+                "name": document.name,
+                "meta_data": document.meta_data,
+                "content": cleaned_content,
+                "usage": document.usage,
+            }
+            row: dict[str, Any] = {
+                "id": self._chunk_id(document),
+                "vector": document.embedding,
+                "payload": json.dumps(payload),
+            }
+            for column in METADATA_COLUMNS:
+                row[column.name] = document.meta_data.get(column.name)
+            data.append(row)
+
+        if data and vector_db.table is not None:
+            vector_db.table.add(data)
+        return len(data)
+
+    def _update_references(
+        self,
+        vector_db: LanceDb,
+        store: FingerprintStore,
+        chunk_ids: set[str],
+        dedup: DedupIndex | None = None,
+        batch_size: int = 500,
+    ) -> None:
+        """Record in shared rows which other files contain the chunk or a near-identical copy of it.
+
+        The references are stored in the row's meta_data and rebuilt from the
+        fingerprint store, so files that were changed or removed drop out. A row
+        whose own file no longer contains the chunk is handed over to a file that
+        still references it, so its metadata columns match a file it belongs to.
+
+        Args:
+            vector_db: Vector database holding the rows
+            store: Fingerprint store with the chunk ids of every indexed file
+            chunk_ids: Ids of the rows to update
+            dedup: Index to drop handed-over rows from if their scope changed
+            batch_size: Rows per read and merge
+        """
+        if not chunk_ids or vector_db.table is None:
+            return
+
+        referencing: dict[str, list[dict[str, Any]]] = {}
+        for path, fingerprint in store.fingerprints.items():
+            shared = chunk_ids.intersection(fingerprint.chunk_ids)
+            if not shared:
+                continue
+            metadata = self._file_metadata(Path(path))
+            for chunk_id in shared:
+                referencing.setdefault(chunk_id, []).append(metadata)
+
+        ids = sorted(chunk_ids)
+        columns = vector_db.table.schema.names
+        rescoped: list[str] = []
+        for i in range(0, len(ids), batch_size):
+            batch = ids[i : i + batch_size]
+            id_list = ", ".join(f"'{chunk_id}'" for chunk_id in batch)
+            rows = vector_db.table.search().where(f"id IN ({id_list})").limit(len(batch)).to_arrow().select(columns)
+            if rows.num_rows == 0:
+                continue
+
+            updated: dict[str, list[Any]] = {name: rows.column(name).to_pylist() for name in columns}
+            for row, (chunk_id, payload) in enumerate(zip(updated["id"], updated["payload"], strict=True)):
+                data = json.loads(payload)
+                meta_data = data.get("meta_data") or {}
+                files = sorted(referencing.get(chunk_id, []), key=lambda metadata: metadata["path"])
+                if files and all(metadata["path"] != meta_data.get("path") for metadata in files):
+                    owner = files[0]
+                    if self._dedup_scope(owner) != self._dedup_scope(meta_data):
+                        rescoped.append(chunk_id)
+                    meta_data.update(owner)
+                    for column in METADATA_COLUMNS:
+                        if column.name in updated:
+                            updated[column.name][row] = owner.get(column.name)
+
+                references = [
+                    {"source": metadata["source"], "path": metadata["path"]}
+                    for metadata in files
+                    if metadata["path"] != meta_data.get("path")
+                ]
+                if references:
+                    meta_data["references"] = references
+                else:
+                    meta_data.pop("references", None)
+                data["meta_data"] = meta_data
+                updated["payload"][row] = json.dumps(data)
+
+            table = pa.Table.from_pydict(updated, schema=rows.schema)
+            vector_db.table.merge_insert("id").when_matched_update_all().execute(table)
+
+        if dedup is not None:
+            # A handed-over row must not absorb copies of its former scope
+            dedup.forget(rescoped)
+        logger.debug(f"Updated owners and source references of {len(ids)} shared rows in {self.table_name}")
+
+    @staticmethod
+    def _dedup_scope(metadata: dict[str, Any]) -> str:
+        """Return the scope of chunks that may be merged: files the metadata filters cannot tell apart."""
+        versions = ",".join(metadata.get("versions") or [])
+        return f"{metadata.get('source')}|{metadata.get('file_type')}|{versions}"
+
+    async def _embed_and_write(
+        self, vector_db: LanceDb, batch_embedder: BatchEmbedder, documents: dict[str, Document]
+    ) -> int:
+        """Embed chunks that are not stored yet and write them to the vector table.
+
+        Args:
+            vector_db: Target vector database
+            batch_embedder: Embedding stage
+            documents: Chunks keyed by row id
+
+        Returns:
+            Number of rows written
+        """
+        if not documents:
+            return 0
+
+        existing_ids = await asyncio.to_thread(self._existing_ids, vector_db, list(documents))
+        new_documents = [doc for chunk_id, doc in documents.items() if chunk_id not in existing_ids]
+        logger.debug(f"Embedding {len(new_documents)} new chunks ({len(existing_ids)} already stored)")
+
+        await batch_embedder.embed_documents(new_documents)
+        return await asyncio.to_thread(self._write_rows, vector_db, new_documents)
+
+    async def _ingest(
+        self,
+        vector_db: LanceDb,
+        store: FingerprintStore,
+        files: list[Path],
+        result: ReindexResult,
+        dedup: DedupIndex | None = None,
+        shared_ids: set[str] | None = None,
+    ) -> EmbeddingStats:
+        """Stream files through parsing, embedding and writing with a bounded chunk budget.
+
+        Parsing runs concurrently with embedding. Parsed chunks reserve room in the
+        in-flight budget and release it once written, so memory use does not grow
+        with the size of the corpus. Chunks that duplicate a canonical chunk are
+        not embedded; their file references the canonical row instead.
+
+        Args:
+            vector_db: Target vector database
+            store: Fingerprint store to record indexed files in
+            files: Files to index
+            result: Result to update with chunk counts
+            dedup: Index of canonical chunks (default: only identical chunks share a row)
+            shared_ids: Set to add the ids of canonical rows that gained a duplicate to
+
+        Returns:
+            Throughput statistics of the embedding stage
+        """
+        parser = DocumentParser(max_workers=self.parse_workers)
+        batch_embedder = BatchEmbedder(vector_db.embedder, self.batch_config)
+        budget = ChunkBudget(self.max_in_flight_chunks)
+        window_size = min(self.batch_config.batch_size * self.batch_config.max_concurrency, self.max_in_flight_chunks)
+        # None ends the stream, an empty list asks the consumer to flush so the producer can continue
+        queue: asyncio.Queue[list[tuple[str, Document]] | None] = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                async for file_path, documents in parser.parse(files):
+                    if not documents and self._has_content(file_path):
+                        # Readers return no documents when they fail; leave the file to be retried next run
+                        logger.warning(f"No chunks read from {file_path}, not recording it as indexed")
+                        result.failed += 1
+                        continue
+                    try:
+                        # Chunk ids are filled in below; a file removed since the scan (e.g. by a sync) is skipped
+                        fingerprint = store.record(file_path, [])
+                    except OSError as e:
+                        logger.warning(f"Skipping {file_path}, it cannot be read anymore: {e}")
+                        result.failed += 1
+                        continue
+                    metadata = self._file_metadata(file_path)
+                    for doc in documents:
+                        doc.meta_data.update(metadata)
+                    chunk_ids = [self._chunk_id(doc) for doc in documents]
+                    chunks = list(zip(chunk_ids, documents, strict=True))
+                    if dedup is not None:
+                        scope = self._dedup_scope(metadata)
+                        chunks = []
+                        for i, doc in enumerate(documents):
+                            canonical_id = dedup.add(chunk_ids[i], doc.content, scope)
+                            if canonical_id is None:
+                                chunks.append((chunk_ids[i], doc))
+                                continue
+                            chunk_ids[i] = canonical_id
+                            result.chunks_deduplicated += 1
+                            if shared_ids is not None:
+                                shared_ids.add(canonical_id)
+                    fingerprint.chunk_ids = chunk_ids
+                    result.chunks_indexed += len(chunk_ids)
+                    if not chunks:
+                        continue
+                    if not budget.fits(len(chunks)):
+                        await queue.put([])
+                    await budget.acquire(len(chunks))
+                    await queue.put(chunks)
+            finally:
+                await queue.put(None)
+
+        async def consume() -> None:
+            window: dict[str, Document] = {}
+            held = 0
+            seen_ids: set[str] = set()
+            while True:
+                item = await queue.get()
+                if item is not None:
+                    held += len(item)
+                    for chunk_id, doc in item:
+                        if chunk_id not in seen_ids:
+                            seen_ids.add(chunk_id)
+                            window[chunk_id] = doc
+
+                if item is None or not item or held >= window_size:
+                    await self._embed_and_write(vector_db, batch_embedder, window)
+                    await budget.release(held)
+                    window, held = {}, 0
+                if item is None:
+                    return
+
+        async with asyncio.TaskGroup() as group:
+            group.create_task(produce())
+            group.create_task(consume())
+
+        return batch_embedder.stats
+
+    async def aupdate_index(self, full: bool = False) -> ReindexResult:
+        """
+        Bring the vector table in line with the knowledge directory.
+
+        Only files that were added or changed since the last run are chunked and
+        embedded; rows belonging to changed or removed files are deleted.
+
+        Args:
+            full: If True, drop the table and index every file from scratch
+
+        Returns:
+            ReindexResult summarizing the work done
+
+        Raises:
+            FileNotFoundError: If knowledge path doesn't exist
+            RuntimeError: If no supported documents are found
+        """
+        if not self.knowledge_path.exists():
+            raise FileNotFoundError(f"Knowledge path not found: {self.knowledge_path}")
+
+        start_time = time.perf_counter()
+        vector_db = self.get_vector_db()
+        store = self.get_fingerprint_store()
+        dedup = self.get_dedup_index()
+
+        if full:
+            logger.info(f"Dropping LanceDB table '{self.table_name}' for full reindex")
+            vector_db.drop()
+            store.clear()
+            dedup.clear()
+        elif not vector_db.exists():
+            # Fingerprints without a table are meaningless
+            store.clear()
+            dedup.clear()
+        elif not self.dedup:
+            # Signatures would go stale while deduplication is off
+            dedup.clear()
+
+        if not vector_db.exists():
+            vector_db.create()
+
+        md_files, pdf_files, csv_files = self._count_documents()
+        if not md_files and not pdf_files and not csv_files:
+            raise RuntimeError(f"No supported documents found in {self.knowledge_path}")
+
+        changes = store.diff(md_files + pdf_files + csv_files)
+        result = ReindexResult(
+            full=full,
+            added=len(changes.added),
+            changed=len(changes.changed),
+            removed=len(changes.removed),
+            unchanged=len(changes.unchanged),
+        )
+        logger.info(
+            f"Index changes: {result.added} added, {result.changed} changed, "
+            f"{result.removed} removed, {result.unchanged} unchanged"
+        )
+
+        # Rows of changed and removed files become stale once their new content is indexed
+        stale_ids: set[str] = set()
+        for path in changes.removed + [str(p) for p in changes.changed]:
+            previous = store.fingerprints.get(path)
+            if previous is not None:
+                stale_ids.update(previous.chunk_ids)
+
+        if self.dedup:
+            # Rows of changed files must not absorb the new content of their own file as a near duplicate
+            outdated = set(changes.removed) | {str(path) for path in changes.changed}
+            kept = {
+                chunk_id
+                for path, fingerprint in store.fingerprints.items()
+                if path not in outdated
+                for chunk_id in fingerprint.chunk_ids
+            }
+            dedup.forget(stale_ids - kept)
+
+        shared_ids: set[str] = set()
+        result.embedding = await self._ingest(
+            vector_db, store, changes.to_index, result, dedup if self.dedup else None, shared_ids
+        )
+
+        for path in changes.removed:
+            store.forget(path)
+
+        # Chunks may be shared between files, so only drop unreferenced rows
+        referenced = store.referenced_chunk_ids()
+        deleted = stale_ids - referenced
+        result.chunks_deleted = self._delete_rows(vector_db, deleted)
+        # Rows of changed files may still be referenced by other files and need a new owner
+        self._update_references(vector_db, store, shared_ids | (stale_ids & referenced), dedup if self.dedup else None)
+        if self.dedup:
+            dedup.forget(deleted)
+            dedup.save()
+        store.save()
+
+        changed = full or bool(result.chunks_indexed or result.chunks_deleted)
+        result.index = await asyncio.to_thread(ensure_indexes, vector_db, self.index_min_rows, changed)
+
+        result.duration_seconds = time.perf_counter() - start_time
+        logger.info(
+            f"Indexed {result.chunks_indexed} chunks ({result.chunks_deduplicated} duplicates) from "
+            f"{result.files_indexed} files ({result.failed} failed) and deleted {result.chunks_deleted} stale rows "
+            f"in {result.duration_seconds:.1f}s "
+            f"({result.embedding.chunks_per_second:.1f} chunks/s, {result.embedding.tokens_per_second:.0f} tokens/s)"
+        )
+        return result
+
     async def aload_knowledge(self, recreate: bool = False, force_reload: bool = False) -> AgentKnowledge:
         """
         Load or create the knowledge base asynchronously.
@@ -208,15 +757,8 @@ class KnowledgeManager:
             raise FileNotFoundError(f"Knowledge path not found: {self.knowledge_path}")
 
         try:
-            # Get the shared vector database instance
+            # Opening the table is all that is needed to answer searches
             vector_db = self.get_vector_db()
-            self._vector_db = vector_db
-
-            # Count documents for reference
-            md_files, pdf_files, csv_files = self._count_documents()
-
-            if not md_files and not pdf_files and not csv_files:
-                raise RuntimeError(f"No supported documents found in {self.knowledge_path}")
 
             # Check if table exists and has data
             table_exists = self.check_table_exists()
@@ -226,33 +768,20 @@ class KnowledgeManager:
                     f"LanceDB table '{self.table_name}' already exists with data. "
                     "Skipping document loading for faster startup."
                 )
-
-                # Create knowledge base object without loading documents
-                self._knowledge = self._create_knowledge_base(vector_db, md_files, pdf_files, csv_files)
-
-                logger.info(
-                    f"Knowledge base ready (using existing data). "
-                    f"Available: {len(md_files)} markdown, {len(pdf_files)} PDF, and {len(csv_files)} CSV files"
-                )
-
+                self._knowledge = self._create_search_knowledge_base(vector_db)
+                logger.info("Knowledge base ready (using existing data)")
                 return self._knowledge
 
-            # Table doesn't exist or force_reload requested - load documents
+            # Table doesn't exist, recreate or force_reload requested - (re)index changed documents
             logger.info(f"Loading knowledge base from {self.knowledge_path}")
-            logger.debug(f"Found {len(md_files)} markdown, {len(pdf_files)} PDF, and {len(csv_files)} CSV files")
-
-            # Create and load knowledge base
-            self._knowledge = self._create_knowledge_base(vector_db, md_files, pdf_files, csv_files)
-
-            logger.info("Using CombinedKnowledgeBase to process document types")
+            logger.debug(f"Updating knowledge index (recreate={recreate})")
+            result = await self.aupdate_index(full=recreate)
 
-            # Load the knowledge base asynchronously
-            logger.debug(f"Loading knowledge base asynchronously (recreate={recreate})")
-            await self._knowledge.aload(recreate=recreate)
+            self._knowledge = self._create_search_knowledge_base(vector_db)
 
             logger.info(
-                f"Knowledge base loaded successfully with {len(md_files)} markdown, "
-                f"{len(pdf_files)} PDF, and {len(csv_files)} CSV files available"
+                f"Knowledge base loaded successfully with "
+                f"{result.added + result.changed + result.unchanged} documents available"
             )
 
             return self._knowledge
@@ -7,6 +7,8 @@ from pathlib import Path
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from .base import ResourceState
+
 
 class Manifest(BaseModel):
     """Manifest for tracking downloaded files."""
@@ -14,6 +16,8 @@ class Manifest(BaseModel):
     source: str
     last_sync: datetime = Field(default_factory=datetime.now)
     files: list[str] = Field(default_factory=list)
+    resources: dict[str, ResourceState] = Field(default_factory=dict)
+    cursor: str | None = None
 
     def save(self, manifest_dir: Path) -> None:
         """Save manifest to JSON file.
@@ -112,25 +116,43 @@ class ManifestManager:
         """Get manifest for a source."""
         return Manifest.load(source, self.manifest_dir)
 
-    def save_manifest(self, source: str, files: list[Path]) -> None:
+    def save_manifest(
+        self,
+        source: str,
+        files: list[Path],
+        resources: dict[str, ResourceState] | None = None,
+        cursor: str | None = None,
+    ) -> None:
         """Save manifest for a source.
 
         Args:
             source: Source name
             files: List of downloaded files
+            resources: State of the synced resources, used by the next sync to skip unchanged ones
+            cursor: Source-specific position to detect the next changes from
         """
         manifest = Manifest(
             source=source,
             files=[str(f.relative_to(self.base_path)) for f in files],
+            resources=resources or {},
+            cursor=cursor,
         )
         manifest.save(self.manifest_dir)
 
-    def sync_and_cleanup(self, source: str, current_files: list[Path]) -> list[Path]:
+    def sync_and_cleanup(
+        self,
+        source: str,
+        current_files: list[Path],
+        resources: dict[str, ResourceState] | None = None,
+        cursor: str | None = None,
+    ) -> list[Path]:
         """Sync manifest and cleanup removed files.
 
         Args:
             source: Source name
-            current_files: List of files from current download
+            current_files: List of files from current download, including files kept unchanged
+            resources: State of the synced resources
+            cursor: Source-specific position to detect the next changes from
 
         Returns:
             List of removed files
@@ -141,5 +163,5 @@ class ManifestManager:
         if manifest:
             removed_files = manifest.cleanup_removed_files(current_files, self.base_path)
 
-        self.save_manifest(source, current_files)
+        self.save_manifest(source, current_files, resources, cursor)
         return removed_files
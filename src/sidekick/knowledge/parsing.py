@@ -0,0 +1,143 @@
+"""Parallel document parsing for knowledge base indexing."""
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from agno.document.base import Document
+from agno.document.chunking.markdown import MarkdownChunking
+from agno.document.chunking.strategy import ChunkingStrategy
+from agno.document.reader.base import Reader
+from agno.document.reader.csv_reader import CSVReader
+from agno.document.reader.markdown_reader import MarkdownReader
+from agno.document.reader.pdf_reader import PDFReader
+from loguru import logger
+
+from ..settings import settings
+from .chunking import TokenChunking, create_fixed_size_chunking
+
+
+@dataclass
+class DocumentReaders:
+    """Document reader of each supported file type."""
+
+    md: MarkdownReader
+    pdf: PDFReader
+    csv: CSVReader
+
+    def for_file(self, file_path: Path) -> Reader | None:
+        """Return the reader for a file's extension, or None if the file type is not supported."""
+        return {".md": self.md, ".pdf": self.pdf, ".csv": self.csv}.get(file_path.suffix)
+
+
+# Readers are created once per worker process
+_readers: DocumentReaders | None = None
+
+
+def create_readers() -> DocumentReaders:
+    """Create the document reader used for each supported file extension."""
+    md_chunking: ChunkingStrategy
+    pdf_chunking: ChunkingStrategy
+    if settings.knowledge.chunking == "token":
+        md_chunking = pdf_chunking = TokenChunking(target_tokens=settings.knowledge.chunk_tokens)
+    else:
+        # Whole markdown files and 20,000 character PDF chunks
+        md_chunking = MarkdownChunking(chunk_size=1000000, overlap=200)
+        pdf_chunking = create_fixed_size_chunking(chunk_size=20000, overlap=200)
+
+    return DocumentReaders(
+        md=MarkdownReader(chunking_strategy=md_chunking),
+        pdf=PDFReader(chunk=True, chunking_strategy=pdf_chunking),
+        csv=CSVReader(),
+    )
+
+
+def parse_file(file_path: Path) -> list[Document]:
+    """Read and chunk a single file.
+
+    This is a module-level function so it can run in a worker process.
+
+    Args:
+        file_path: File to parse
+
+    Returns:
+        Chunked documents (empty if the file could not be read)
+    """
+    global _readers
+    if _readers is None:
+        _readers = create_readers()
+
+    reader = _readers.for_file(file_path)
+    if reader is None:
+        logger.warning(f"No reader for {file_path}")
+        return []
+    return reader.read(file_path)
+
+
+class DocumentParser:
+    """Fans file parsing out to a process pool and streams results as they complete."""
+
+    def __init__(self, max_workers: int | None = None, min_pool_files: int = 16):
+        """Initialize document parser.
+
+        Args:
+            max_workers: Worker processes (default: CPU count, 1 parses in a thread)
+            min_pool_files: Below this many files parsing stays in a thread
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_pool_files = min_pool_files
+
+    async def parse(self, files: list[Path]) -> AsyncIterator[tuple[Path, list[Document]]]:
+        """Parse files and yield (file, chunks) pairs in completion order.
+
+        At most two files per worker are parsed ahead of the consumer, so a
+        slow consumer applies backpressure to parsing.
+
+        Args:
+            files: Files to parse
+
+        Yields:
+            Tuple of the parsed file and its chunked documents
+        """
+        workers = min(self.max_workers, len(files))
+
+        # Spinning up worker processes is not worth it for a handful of files
+        if workers <= 1 or len(files) < self.min_pool_files:
+            for file_path in files:
+                yield file_path, await asyncio.to_thread(parse_file, file_path)
+            return
+
+        logger.debug(f"Parsing {len(files)} files with {workers} worker processes")
+        loop = asyncio.get_running_loop()
+        # spawn avoids forking a process that already runs threads (LanceDB, asyncio executors)
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            # Keep a bounded number of files in flight so parsed chunks cannot pile up in memory
+            remaining = iter(files)
+            pending: set[asyncio.Future[list[Document]]] = set()
+            future_files: dict[asyncio.Future[list[Document]], Path] = {}
+
+            def submit_next() -> None:
+                file_path = next(remaining, None)
+                if file_path is not None:
+                    future = loop.run_in_executor(executor, parse_file, file_path)
+                    future_files[future] = file_path
+                    pending.add(future)
+
+            for _ in range(workers * 2):
+                submit_next()
+
+            try:
+                while pending:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        pending.discard(future)
+                        submit_next()
+                        yield future_files.pop(future), future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
@@ -0,0 +1,62 @@
+"""Compiled glob pattern sets for matching URLs.
+
+Web sources match every discovered link against their include, exclude and
+js patterns. Calling fnmatch per link and pattern translates the globs again
+and again and scales with links x patterns. A URLPatternSet compiles its
+patterns once: literal prefixes ("https://docs.example.com/guide/*") are
+checked with a single str.startswith, all other globs with one combined
+regular expression.
+"""
+
+import fnmatch
+import re
+from collections.abc import Iterable
+
+# Characters with a special meaning in glob patterns
+GLOB_CHARS = frozenset("*?[")
+
+
+class URLPatternSet:
+    """Set of glob patterns (fnmatch syntax, case-sensitive) matched against URLs."""
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        """Initialize pattern set.
+
+        Args:
+            patterns: Glob patterns, e.g. "*/docs/*"
+        """
+        self.patterns = tuple(dict.fromkeys(patterns))
+
+        prefixes = []
+        globs = []
+        for pattern in self.patterns:
+            # "literal*" matches exactly the URLs starting with the literal
+            if pattern.endswith("*") and not GLOB_CHARS.intersection(pattern[:-1]):
+                prefixes.append(pattern[:-1])
+            else:
+                globs.append(pattern)
+
+        self.prefixes = tuple(prefixes)
+        self._regex = re.compile("|".join(fnmatch.translate(pattern) for pattern in globs)) if globs else None
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def __repr__(self) -> str:
+        return f"URLPatternSet({list(self.patterns)!r})"
+
+    def matches(self, url: str) -> bool:
+        """Whether the URL matches any pattern of the set.
+
+        Args:
+            url: URL to match
+
+        Returns:
+            True if a pattern matches the whole URL
+        """
+        if self.prefixes and url.startswith(self.prefixes):
+            return True
+        return self._regex is not None and self._regex.match(url) is not None
@@ -0,0 +1,171 @@
+"""Fast discovery of knowledge documents on disk."""
+
+import json
+import os
+from pathlib import Path
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+SUPPORTED_EXTENSIONS = (".md", ".pdf", ".csv")
+
+# Version of the scan cache layout; caches of other versions are discarded
+SCAN_CACHE_VERSION = 2
+
+
+class DirectoryEntry(BaseModel):
+    """Cached listing of a single directory."""
+
+    mtime: float
+    files: list[tuple[str, int]] = Field(default_factory=list)
+    subdirs: list[str] = Field(default_factory=list)
+
+
+class ScanCache(BaseModel):
+    """Persisted directory listings of a knowledge tree."""
+
+    version: int = 1
+    root: str
+    extensions: list[str]
+    directories: dict[str, DirectoryEntry] = Field(default_factory=dict)
+
+
+class DocumentScanner:
+    """Single-pass, cached scanner for supported documents in a knowledge directory.
+
+    Each directory is listed once with os.scandir and every matching file is
+    stat'ed once. Listings are cached together with the directory mtime, so
+    directories whose entries did not change are not listed again on the next
+    scan; only their mtime is checked. Listings keep every matching file with
+    its size and the size filter is applied when they are read. Size changes of
+    existing files do not touch the directory mtime, so files that were too
+    small are stat'ed again on every scan and picked up once they grew.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        cache_path: Path | None = None,
+        extensions: tuple[str, ...] = SUPPORTED_EXTENSIONS,
+        min_size_bytes: int = 50,
+        exclude: list[Path] | None = None,
+    ):
+        """Initialize document scanner.
+
+        Args:
+            root: Knowledge directory to scan
+            cache_path: JSON file for cached directory listings (None disables caching)
+            extensions: File extensions to collect
+            min_size_bytes: Files smaller than this are skipped as empty
+            exclude: Directories below root that are not scanned
+        """
+        self.root = root
+        self.cache_path = cache_path
+        self.extensions = extensions
+        self.min_size_bytes = min_size_bytes
+        self.exclude = {os.path.normpath(path) for path in exclude or []}
+
+    def _load_cache(self) -> dict[str, DirectoryEntry]:
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cache = ScanCache(**json.load(f))
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable scan cache {self.cache_path}: {e}")
+            return {}
+
+        if (
+            cache.version != SCAN_CACHE_VERSION
+            or cache.root != str(self.root)
+            or cache.extensions != list(self.extensions)
+        ):
+            return {}
+        return cache.directories
+
+    def _save_cache(self, directories: dict[str, DirectoryEntry]) -> None:
+        if self.cache_path is None:
+            return
+        cache = ScanCache(
+            version=SCAN_CACHE_VERSION,
+            root=str(self.root),
+            extensions=list(self.extensions),
+            directories=directories,
+        )
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache.model_dump(mode="json"), f)
+            tmp_path.replace(self.cache_path)
+        except OSError as e:
+            logger.debug(f"Failed to save scan cache {self.cache_path}: {e}")
+
+    def _list_directory(self, directory: str, mtime: float) -> DirectoryEntry:
+        entry = DirectoryEntry(mtime=mtime)
+        try:
+            with os.scandir(directory) as it:
+                for item in it:
+                    try:
+                        if item.is_dir(follow_symlinks=False):
+                            entry.subdirs.append(item.name)
+                        elif item.name.endswith(self.extensions) and item.is_file():
+                            entry.files.append((item.name, item.stat().st_size))
+                    except OSError as e:
+                        logger.debug(f"Error checking {item.path}: {e}")
+        except OSError as e:
+            logger.debug(f"Cannot list {directory}: {e}")
+        return entry
+
+    def scan(self) -> dict[str, list[Path]]:
+        """Find supported documents below the root directory.
+
+        Returns:
+            Mapping of extension to sorted list of matching files
+        """
+        cached = self._load_cache()
+        directories: dict[str, DirectoryEntry] = {}
+        found: dict[str, list[Path]] = {ext: [] for ext in self.extensions}
+        listed = 0
+        resized = False
+
+        stack = [str(self.root)]
+        while stack:
+            directory = stack.pop()
+            try:
+                mtime = os.stat(directory).st_mtime
+            except OSError:
+                continue
+
+            entry = cached.get(directory)
+            if entry is None or entry.mtime != mtime:
+                entry = self._list_directory(directory, mtime)
+                listed += 1
+            directories[directory] = entry
+
+            for i, (name, size) in enumerate(entry.files):
+                path = os.path.join(directory, name)
+                if size < self.min_size_bytes:
+                    # Writing to a file does not change its directory's mtime, so small files are checked again
+                    try:
+                        current = os.stat(path).st_size
+                    except OSError:
+                        continue
+                    if current != size:
+                        entry.files[i], size, resized = (name, current), current, True
+                    if size < self.min_size_bytes:
+                        logger.debug(f"Skipping small file ({size} bytes): {path}")
+                        continue
+                found[name[name.rfind(".") :]].append(Path(path))
+            for subdir in entry.subdirs:
+                path = os.path.join(directory, subdir)
+                if os.path.normpath(path) not in self.exclude:
+                    stack.append(path)
+
+        logger.debug(f"Scanned {len(directories)} directories under {self.root} ({listed} listed from disk)")
+        if listed or resized or len(directories) != len(cached):
+            self._save_cache(directories)
+
+        for files in found.values():
+            files.sort()
+        return found
@@ -0,0 +1,241 @@
+"""Search-only knowledge base attached to an existing vector table."""
+
+import dataclasses
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any
+
+from agno.document.base import Document
+from agno.knowledge import AgentKnowledge
+from loguru import logger
+from pydantic import BaseModel, PrivateAttr
+
+from ..settings import settings
+
+
+def _copy_documents(documents: list[Document]) -> list[Document]:
+    """Copy documents so callers cannot modify cached results (the embedder is shared)."""
+    return [dataclasses.replace(doc, meta_data=dict(doc.meta_data)) for doc in documents]
+
+
+class RetrievalCacheStats(BaseModel):
+    """Hit/miss counters of a retrieval cache."""
+
+    hits: int = 0
+    misses: int = 0
+    entries: int = 0
+    saved_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        """One-line description of the counters for logs and reports."""
+        return f"{self.hits} hits, {self.misses} misses ({self.hit_rate:.0%} hit rate), {self.saved_seconds:.2f}s saved"
+
+
+class RetrievalCache:
+    """LRU + TTL cache of knowledge search results.
+
+    Entries are keyed on the normalized query, search type, number of
+    documents and filters, and remember the table version they were read
+    from, so results from before a reindex are never returned. Each entry
+    also remembers how long the search took, which is counted as saved time
+    on every hit.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 600.0):
+        """Initialize retrieval cache.
+
+        Args:
+            max_entries: Maximum number of cached searches (0 disables caching)
+            ttl_seconds: Seconds after which a cached result expires
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = RetrievalCacheStats()
+        self._entries: OrderedDict[tuple, tuple[Any, float, float, list[Document]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(query: str, search_type: str, num_documents: int, filters: dict[str, Any] | None) -> tuple:
+        """Build the cache key for a search.
+
+        Queries differing only in case or whitespace share an entry.
+        """
+        normalized = " ".join(query.lower().split())
+        return normalized, search_type, num_documents, json.dumps(filters, sort_keys=True, default=str)
+
+    def get(self, key: tuple, version: Any) -> list[Document] | None:
+        """Look up a cached search result.
+
+        Args:
+            key: Key from make_key
+            version: Current version of the searched table
+
+        Returns:
+            Copy of the cached documents, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry_version, expires_at, seconds, documents = entry
+                if entry_version == version and expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    self.stats.saved_seconds += seconds
+                    return _copy_documents(documents)
+                del self._entries[key]
+                self.stats.entries = len(self._entries)
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: tuple, version: Any, documents: list[Document], seconds: float) -> None:
+        """Store a search result.
+
+        Args:
+            key: Key from make_key
+            version: Version of the table the documents were read from
+            documents: Search result
+            seconds: Time the search took
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (version, time.monotonic() + self.ttl_seconds, seconds, _copy_documents(documents))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self.stats.entries = len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self.stats.entries = 0
+
+
+class SearchKnowledgeBase(AgentKnowledge):
+    """Knowledge base that answers searches straight from the vector database.
+
+    Searching only needs the vector database, so creating this object does not
+    enumerate files or construct readers. The document-backed knowledge base is
+    built by the given factory the first time documents are requested, i.e.
+    when the knowledge base is actually (re)loaded.
+    """
+
+    _source_factory: Callable[[], AgentKnowledge] | None = PrivateAttr(default=None)
+    _source: AgentKnowledge | None = PrivateAttr(default=None)
+    _cache: RetrievalCache = PrivateAttr()
+
+    def __init__(
+        self,
+        source_factory: Callable[[], AgentKnowledge] | None = None,
+        cache: RetrievalCache | None = None,
+        **data,
+    ):
+        """Initialize search knowledge base.
+
+        Args:
+            source_factory: Builds the document-backed knowledge base on first load
+            cache: Search result cache (default: sized by the knowledge settings)
+            **data: AgentKnowledge fields (vector_db, num_documents, ...)
+        """
+        super().__init__(**data)
+        self._source_factory = source_factory
+        self._cache = cache or RetrievalCache(
+            max_entries=settings.knowledge.search_cache_size, ttl_seconds=settings.knowledge.search_cache_ttl
+        )
+
+    @property
+    def cache(self) -> RetrievalCache:
+        """Search result cache."""
+        return self._cache
+
+    def _table_version(self) -> Any:
+        """Latest version of the searched table, or None if it cannot be determined.
+
+        An open table handle keeps reading the version it was opened at, so it is
+        moved to the latest version first; writes of another process (e.g. a
+        reindex) then invalidate the cached results and are searched.
+        """
+        try:
+            table = self.vector_db.table  # type: ignore[union-attr]
+            table.checkout_latest()
+            return table.version
+        except Exception:
+            return None
+
+    def _cache_key(self, query: str, num_documents: int | None, filters: dict[str, Any] | None) -> tuple:
+        search_type = str(getattr(self.vector_db, "search_type", ""))
+        return RetrievalCache.make_key(query, search_type, num_documents or self.num_documents, filters)
+
+    def search(
+        self, query: str, num_documents: int | None = None, filters: dict[str, Any] | None = None
+    ) -> list[Document]:
+        """Return relevant documents for a query, served from the cache when possible."""
+        version = self._table_version()
+        if version is None:
+            return super().search(query, num_documents=num_documents, filters=filters)
+
+        key = self._cache_key(query, num_documents, filters)
+        cached = self._cache.get(key, version)
+        if cached is not None:
+            logger.debug(f"Knowledge search cache hit for '{query}' ({self._cache.stats.summary()})")
+            return cached
+
+        start = time.perf_counter()
+        documents = super().search(query, num_documents=num_documents, filters=filters)
+        if documents:
+            self._cache.put(key, version, documents, time.perf_counter() - start)
+        return documents
+
+    async def async_search(
+        self, query: str, num_documents: int | None = None, filters: dict[str, Any] | None = None
+    ) -> list[Document]:
+        """Return relevant documents for a query, served from the cache when possible."""
+        version = self._table_version()
+        if version is None:
+            return await super().async_search(query, num_documents=num_documents, filters=filters)
+
+        key = self._cache_key(query, num_documents, filters)
+        cached = self._cache.get(key, version)
+        if cached is not None:
+            logger.debug(f"Knowledge search cache hit for '{query}' ({self._cache.stats.summary()})")
+            return cached
+
+        start = time.perf_counter()
+        documents = await super().async_search(query, num_documents=num_documents, filters=filters)
+        if documents:
+            self._cache.put(key, version, documents, time.perf_counter() - start)
+        return documents
+
+    @property
+    def source(self) -> AgentKnowledge | None:
+        """Document-backed knowledge base, built on first access."""
+        if self._source is None and self._source_factory is not None:
+            logger.debug("Building document readers for knowledge base load")
+            self._source = self._source_factory()
+        return self._source
+
+    @property
+    def document_lists(self) -> Iterator[list[Document]]:
+        """Documents of the underlying sources (builds them on first use)."""
+        if self.source is None:
+            return iter(())
+        return self.source.document_lists
+
+    # AgentKnowledge declares a coroutine, but agno iterates the property with "async for" and its own
+    # knowledge bases implement it as an async generator
+    @property
+    async def async_document_lists(self) -> AsyncIterator[list[Document]]:  # type: ignore[override]
+        """Documents of the underlying sources (builds them on first use)."""
+        if self.source is not None:
+            async for documents in self.source.async_document_lists:  # type: ignore[attr-defined]
+                yield documents
@@ -0,0 +1,349 @@
+"""Knowledge base split into one LanceDB table per configured source.
+
+Each source from the knowledge sources configuration (sources.yaml) is
+indexed into its own table by its own KnowledgeManager, and everything else
+in the knowledge directory goes to a core table. Reindexing one source
+therefore never touches the tables of the others, and searches fan out to
+the shards concurrently and merge the results by score.
+"""
+
+import asyncio
+import math
+import re
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from agno.document.base import Document
+from agno.knowledge import AgentKnowledge
+from loguru import logger
+from pydantic import PrivateAttr
+
+from ..settings import settings
+from .config import KnowledgeConfig
+from .manager import DEFAULT_SOURCE, KnowledgeManager, ReindexResult
+from .scanner import SUPPORTED_EXTENSIONS
+
+# Shard holding the documents that do not belong to a configured source
+CORE_SHARD = DEFAULT_SOURCE
+
+# Filter key selecting the shards to search
+SOURCE_FILTER = "source"
+
+
+def shard_table_name(table_name: str, source_name: str) -> str:
+    """Return the LanceDB table name of a source shard."""
+    return f"{table_name}_{re.sub(r'[^A-Za-z0-9_]', '_', source_name)}"
+
+
+class ShardedKnowledgeBase(AgentKnowledge):
+    """Knowledge base searching several shard knowledge bases concurrently.
+
+    Every shard returns its best matches; these are merged by their search
+    score (reranking_score, higher is better) and cut to num_documents. A
+    "source" filter (a source name or list of names) restricts the search to
+    those shards; all other filters are passed on to the shards.
+    """
+
+    _shards: dict[str, AgentKnowledge] = PrivateAttr(default_factory=dict)
+
+    def __init__(self, shards: dict[str, AgentKnowledge] | None = None, **data):
+        """Initialize sharded knowledge base.
+
+        Args:
+            shards: Knowledge base per shard name
+            **data: AgentKnowledge fields (num_documents, ...)
+        """
+        super().__init__(**data)
+        self._shards = shards or {}
+
+    @property
+    def shards(self) -> dict[str, AgentKnowledge]:
+        """Knowledge base per shard name."""
+        return self._shards
+
+    def _route(self, filters: dict[str, Any] | None) -> list[tuple[AgentKnowledge, dict[str, Any] | None]]:
+        """Select the shards to search and the filters to pass on to each of them.
+
+        Source names that are not shards (directories indexed by the core
+        shard) are passed on to the core shard as a source filter.
+        """
+        if not filters or SOURCE_FILTER not in filters:
+            return [(kb, filters) for kb in self._shards.values()]
+        selected = filters[SOURCE_FILTER]
+        names = [selected] if isinstance(selected, str) else list(selected)
+        remaining = {key: value for key, value in filters.items() if key != SOURCE_FILTER} or None
+
+        routes = [(kb, remaining) for name, kb in self._shards.items() if name in names]
+        other = [name for name in names if name not in self._shards]
+        if other and CORE_SHARD in self._shards and CORE_SHARD not in names:
+            routes.append((self._shards[CORE_SHARD], {**(remaining or {}), SOURCE_FILTER: other}))
+        return routes
+
+    def _merge(self, results: list[list[Document]], limit: int) -> list[Document]:
+        documents = [doc for docs in results for doc in docs]
+        documents.sort(key=lambda doc: -math.inf if doc.reranking_score is None else doc.reranking_score, reverse=True)
+        return documents[:limit]
+
+    def search(
+        self, query: str, num_documents: int | None = None, filters: dict[str, Any] | None = None
+    ) -> list[Document]:
+        """Search all selected shards concurrently and merge their results by score."""
+        limit = num_documents or self.num_documents
+        routes = self._route(filters)
+        if not routes:
+            return []
+
+        with ThreadPoolExecutor(max_workers=len(routes), thread_name_prefix="knowledge-shard") as executor:
+            futures = [executor.submit(kb.search, query, limit, shard_filters) for kb, shard_filters in routes]
+            results = [future.result() for future in futures]
+        return self._merge(results, limit)
+
+    async def async_search(
+        self, query: str, num_documents: int | None = None, filters: dict[str, Any] | None = None
+    ) -> list[Document]:
+        """Search all selected shards concurrently and merge their results by score."""
+        limit = num_documents or self.num_documents
+        routes = self._route(filters)
+        if not routes:
+            return []
+
+        # LanceDB searches are blocking, so each shard is searched in its own thread
+        results = await asyncio.gather(
+            *(asyncio.to_thread(kb.search, query, limit, shard_filters) for kb, shard_filters in routes)
+        )
+        return self._merge(list(results), limit)
+
+    @property
+    def document_lists(self) -> Iterator[list[Document]]:
+        """Documents of all shards."""
+        for kb in self._shards.values():
+            yield from kb.document_lists
+
+    # AgentKnowledge declares a coroutine, but agno iterates the property with "async for" and its own
+    # knowledge bases implement it as an async generator
+    @property
+    async def async_document_lists(self) -> AsyncIterator[list[Document]]:  # type: ignore[override]
+        """Documents of all shards."""
+        for kb in self._shards.values():
+            async for documents in kb.async_document_lists:  # type: ignore[attr-defined]
+                yield documents
+
+
+class ShardedKnowledgeManager:
+    """Manages a knowledge base with one LanceDB table per configured source.
+
+    Source shards index the directories that `knowledge sync` writes to
+    (<sources_path>/<source name>) into tables named <table_name>_<source name>.
+    The core shard indexes the rest of the knowledge directory into table_name.
+    """
+
+    def __init__(
+        self,
+        knowledge_path: Path | None = None,
+        vector_db_path: Path | None = None,
+        table_name: str = "rhdh_docs",
+        sources_config: Path | KnowledgeConfig | None = None,
+        sources_path: Path | None = None,
+        **manager_kwargs: Any,
+    ):
+        """
+        Initialize sharded knowledge manager.
+
+        Args:
+            knowledge_path: Path to knowledge documents directory
+            vector_db_path: Path for vector database storage
+            table_name: Name of the core table and prefix of the source tables
+            sources_config: Sources configuration or its YAML file (default: <knowledge_path>/external/sources.yaml)
+            sources_path: Directory the sources are synced to (default: directory of the configuration file)
+            **manager_kwargs: Passed to every shard's KnowledgeManager (embedder, batch_config, ...)
+
+        Raises:
+            ValueError: If a source is named like the core shard or two sources map to the same table
+        """
+        if knowledge_path is None:
+            project_root = Path(__file__).parent.parent.parent.parent
+            knowledge_path = project_root / "knowledge"
+        if vector_db_path is None:
+            vector_db_path = Path("tmp/lancedb")
+        if sources_config is None:
+            sources_config = knowledge_path / "external" / "sources.yaml"
+
+        config = KnowledgeConfig()
+        if isinstance(sources_config, KnowledgeConfig):
+            config = sources_config
+        else:
+            sources_path = sources_path or sources_config.parent
+            if sources_config.exists():
+                config = KnowledgeConfig.load_from_file(sources_config)
+            else:
+                logger.warning(f"Sources configuration {sources_config} not found, using a single core shard")
+        sources_path = sources_path or knowledge_path / "external"
+
+        self.knowledge_path = knowledge_path
+        self.vector_db_path = vector_db_path
+        self.table_name = table_name
+        self.sources_path = sources_path
+
+        source_dirs = {source.name: sources_path / source.name for source in config.sources}
+        tables: dict[str, str] = {}
+        for name in source_dirs:
+            if name == CORE_SHARD:
+                raise ValueError(f"Source name '{name}' is reserved for the core knowledge shard")
+            shard_table = shard_table_name(table_name, name)
+            if shard_table in tables:
+                raise ValueError(f"Sources '{tables[shard_table]}' and '{name}' would share the table '{shard_table}'")
+            tables[shard_table] = name
+
+        self.shards: dict[str, KnowledgeManager] = {
+            CORE_SHARD: KnowledgeManager(
+                knowledge_path=knowledge_path,
+                vector_db_path=vector_db_path,
+                table_name=table_name,
+                exclude_paths=list(source_dirs.values()),
+                **manager_kwargs,
+            )
+        }
+        for name, path in source_dirs.items():
+            self.shards[name] = KnowledgeManager(
+                knowledge_path=path,
+                vector_db_path=vector_db_path,
+                table_name=shard_table_name(table_name, name),
+                source_name=name,
+                **manager_kwargs,
+            )
+        self._knowledge: ShardedKnowledgeBase | None = None
+
+        logger.debug(f"ShardedKnowledgeManager initialized with shards: {', '.join(self.shards)}")
+
+    def _select(self, sources: list[str] | None) -> dict[str, KnowledgeManager]:
+        if not sources:
+            return self.shards
+        unknown = set(sources) - set(self.shards)
+        if unknown:
+            raise ValueError(f"Unknown knowledge shard(s): {', '.join(sorted(unknown))}")
+        return {name: shard for name, shard in self.shards.items() if name in sources}
+
+    def scan_documents(self, min_size_bytes: int = 50) -> dict[str, list[Path]]:
+        """Find supported documents of all shards.
+
+        Args:
+            min_size_bytes: Files smaller than this are skipped
+
+        Returns:
+            Mapping of file extension (".md", ".pdf", ".csv") to matching files
+        """
+        found: dict[str, list[Path]] = {ext: [] for ext in SUPPORTED_EXTENSIONS}
+        for shard in self.shards.values():
+            if not shard.knowledge_path.exists():
+                continue
+            for ext, files in shard.scan_documents(min_size_bytes).items():
+                found[ext].extend(files)
+        return found
+
+    async def reindex(self, full: bool = False, sources: list[str] | None = None) -> dict[str, ReindexResult]:
+        """
+        Reindex the selected shards one after another.
+
+        Shards without a knowledge directory or without documents are skipped.
+
+        Args:
+            full: If True, recreate the selected tables from scratch
+            sources: Shard names to reindex (default: all)
+
+        Returns:
+            ReindexResult per reindexed shard
+        """
+        results: dict[str, ReindexResult] = {}
+        for name, shard in self._select(sources).items():
+            if not shard.knowledge_path.exists() or not any(shard.scan_documents().values()):
+                logger.info(f"Skipping knowledge shard {name}: no documents in {shard.knowledge_path}")
+                continue
+            logger.info(f"Reindexing knowledge shard {name} ({shard.table_name})")
+            results[name] = await shard.reindex(full=full)
+        self._knowledge = None
+        return results
+
+    def reindex_sync(self, full: bool = False, sources: list[str] | None = None) -> dict[str, ReindexResult]:
+        """
+        Reindex the selected shards synchronously.
+
+        Args:
+            full: If True, recreate the selected tables from scratch
+            sources: Shard names to reindex (default: all)
+
+        Returns:
+            ReindexResult per reindexed shard
+        """
+        return asyncio.run(self.reindex(full=full, sources=sources))
+
+    async def _aload_shard(
+        self, name: str, shard: KnowledgeManager, recreate: bool, force_reload: bool
+    ) -> AgentKnowledge | None:
+        if not shard.knowledge_path.exists():
+            logger.debug(f"Knowledge shard {name} has no directory {shard.knowledge_path}")
+            return None
+        if not shard.check_table_exists() and not any(shard.scan_documents().values()):
+            logger.debug(f"Knowledge shard {name} has no documents yet")
+            return None
+        return await shard.aload_knowledge(recreate=recreate, force_reload=force_reload)
+
+    async def aload_knowledge(self, recreate: bool = False, force_reload: bool = False) -> AgentKnowledge:
+        """
+        Load or create all shards concurrently.
+
+        Args:
+            recreate: If True, recreate the shard tables
+            force_reload: If True, reload documents even if the tables exist
+
+        Returns:
+            ShardedKnowledgeBase searching every shard with documents
+
+        Raises:
+            RuntimeError: If no shard has documents
+        """
+        if self._knowledge is not None and not recreate:
+            logger.debug("Returning existing sharded knowledge base")
+            return self._knowledge
+
+        loaded = await asyncio.gather(
+            *(self._aload_shard(name, shard, recreate, force_reload) for name, shard in self.shards.items())
+        )
+        shards = {name: kb for name, kb in zip(self.shards, loaded, strict=True) if kb is not None}
+        if not shards:
+            raise RuntimeError(f"Knowledge loading failed: no documents found in {self.knowledge_path}")
+
+        logger.info(f"Knowledge base ready with {len(shards)} shards: {', '.join(shards)}")
+        self._knowledge = ShardedKnowledgeBase(shards=shards, num_documents=5)
+        return self._knowledge
+
+    def load_knowledge(self, recreate: bool = False, force_reload: bool = False) -> AgentKnowledge:
+        """
+        Load or create all shards (synchronous wrapper for async method).
+
+        Args:
+            recreate: If True, recreate the shard tables
+            force_reload: If True, reload documents even if the tables exist
+
+        Returns:
+            ShardedKnowledgeBase searching every shard with documents
+        """
+        return asyncio.run(self.aload_knowledge(recreate=recreate, force_reload=force_reload))
+
+
+def create_knowledge_manager(
+    knowledge_path: Path | None = None, **kwargs: Any
+) -> KnowledgeManager | ShardedKnowledgeManager:
+    """Create the knowledge manager matching the knowledge.sharding setting.
+
+    Args:
+        knowledge_path: Path to knowledge documents directory
+        **kwargs: Passed to the manager
+
+    Returns:
+        ShardedKnowledgeManager if sharding is enabled, otherwise KnowledgeManager
+    """
+    if settings.knowledge.sharding:
+        return ShardedKnowledgeManager(knowledge_path=knowledge_path, **kwargs)
+    return KnowledgeManager(knowledge_path=knowledge_path, **kwargs)
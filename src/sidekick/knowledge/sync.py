@@ -0,0 +1,215 @@
+"""Concurrent syncing of the configured knowledge sources.
+
+Every source runs in its own task, so a slow web crawl no longer holds up the
+git and Google Drive sources behind it. A semaphore per source type bounds how
+many sources of that type sync at once (e.g. to stay within the Drive API
+quota). Source handlers are blocking, so each sync runs in a worker thread.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Literal
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from ..settings import settings
+from .base import KnowledgeSource
+from .config import GDriveSourceConfig, GitSourceConfig, WebSourceConfig
+from .manifest import ManifestManager
+
+SourceConfig = GDriveSourceConfig | GitSourceConfig | WebSourceConfig
+
+
+class SourceSyncStatus(BaseModel):
+    """Progress and outcome of syncing one source."""
+
+    name: str
+    type: str
+    state: Literal["queued", "running", "done", "failed"] = "queued"
+    files_downloaded: int = 0
+    files_unchanged: int = 0
+    files_removed: int = 0
+    errors: list[str] = Field(default_factory=list)
+    started_at: float | None = None
+    duration_seconds: float = 0.0
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Seconds spent on the source so far."""
+        if self.state == "running" and self.started_at is not None:
+            return time.perf_counter() - self.started_at
+        return self.duration_seconds
+
+
+class SyncSummary(BaseModel):
+    """Combined result of syncing several sources."""
+
+    sources: list[SourceSyncStatus] = Field(default_factory=list)
+    duration_seconds: float = 0.0
+
+    @property
+    def files_downloaded(self) -> int:
+        """Files downloaded by all sources."""
+        return sum(status.files_downloaded for status in self.sources)
+
+    @property
+    def files_unchanged(self) -> int:
+        """Files kept unchanged by all sources."""
+        return sum(status.files_unchanged for status in self.sources)
+
+    @property
+    def files_removed(self) -> int:
+        """Files removed by all sources."""
+        return sum(status.files_removed for status in self.sources)
+
+    @property
+    def errors(self) -> list[str]:
+        """Errors of all sources, prefixed with the source name."""
+        return [f"{status.name}: {error}" for status in self.sources for error in status.errors]
+
+
+def create_source(config: SourceConfig, base_path: Path) -> KnowledgeSource:
+    """Create the source handler for a source configuration.
+
+    Handlers are imported lazily, so a missing optional dependency (e.g.
+    crawl4ai) only affects sources of that type.
+
+    Args:
+        config: Source configuration
+        base_path: Base path for knowledge storage
+
+    Returns:
+        Source handler
+
+    Raises:
+        ImportError: If the handler's dependencies are not installed
+        ValueError: If the source type is unknown
+    """
+    if config.type == "gdrive":
+        from .gdrive import GDriveSource
+
+        return GDriveSource(config, base_path)
+    if config.type == "git":
+        from .git import GitSource
+
+        return GitSource(config, base_path)
+    if config.type == "web":
+        from .web import WebSource
+
+        return WebSource(config, base_path)
+    raise ValueError(f"Unknown source type: {config.type}")
+
+
+class SourceSyncer:
+    """Syncs knowledge sources concurrently with a concurrency limit per source type."""
+
+    def __init__(
+        self,
+        base_path: Path,
+        limits: dict[str, int] | None = None,
+        source_factory: Callable[[SourceConfig, Path], KnowledgeSource] = create_source,
+        on_update: Callable[[SourceSyncStatus], None] | None = None,
+        resume: bool = False,
+    ):
+        """Initialize source syncer.
+
+        Args:
+            base_path: Base path for knowledge storage
+            limits: Maximum concurrently syncing sources per source type (default: knowledge.sync_concurrency
+                setting, 1 for types without a limit)
+            source_factory: Creates the handler of a source
+            on_update: Called whenever the status of a source changes
+            resume: Continue interrupted syncs from their checkpoints (web crawls)
+        """
+        self.base_path = base_path
+        self.limits = settings.knowledge.sync_concurrency if limits is None else limits
+        self.source_factory = source_factory
+        self.on_update = on_update
+        self.resume = resume
+        self.manifest_manager = ManifestManager(base_path)
+
+    def _update(self, status: SourceSyncStatus) -> None:
+        if self.on_update is not None:
+            self.on_update(status)
+
+    def _sync_blocking(self, config: SourceConfig, status: SourceSyncStatus) -> bool:
+        """Sync one source and clean up the files it no longer provides.
+
+        Returns:
+            Whether the source synced successfully
+        """
+        try:
+            handler = self.source_factory(config, self.base_path)
+        except ImportError:
+            status.errors.append(f"Source type {config.type} not implemented yet")
+            return False
+
+        manifest = self.manifest_manager.get_manifest(config.name)
+        result = handler.sync(manifest=manifest.model_dump() if manifest else None, resume=self.resume)
+        status.errors.extend(result.errors)
+        if not result.success:
+            if not result.errors:
+                status.errors.append("No files downloaded")
+            return False
+
+        removed_files = self.manifest_manager.sync_and_cleanup(
+            config.name, result.current_files, result.resources, result.cursor
+        )
+        status.files_downloaded = len(result.files_downloaded)
+        status.files_unchanged = len(result.files_unchanged)
+        status.files_removed = len(removed_files)
+        return True
+
+    async def _sync_source(
+        self, config: SourceConfig, status: SourceSyncStatus, semaphores: dict[str, asyncio.Semaphore]
+    ) -> None:
+        async with semaphores[config.type]:
+            status.state = "running"
+            status.started_at = time.perf_counter()
+            self._update(status)
+            logger.info(f"Syncing {config.name} ({config.type})")
+
+            try:
+                success = await asyncio.to_thread(self._sync_blocking, config, status)
+            except Exception as e:
+                logger.error(f"Failed to sync {config.name}: {e}")
+                status.errors.append(str(e))
+                success = False
+
+            status.duration_seconds = time.perf_counter() - status.started_at
+            status.state = "done" if success else "failed"
+            logger.info(
+                f"Synced {config.name} in {status.duration_seconds:.1f}s: {status.files_downloaded} files downloaded, "
+                f"{status.files_unchanged} unchanged, {status.files_removed} removed, {len(status.errors)} errors"
+            )
+            self._update(status)
+
+    async def sync(self, sources: list[SourceConfig]) -> SyncSummary:
+        """Sync sources concurrently.
+
+        Args:
+            sources: Source configurations to sync
+
+        Returns:
+            SyncSummary with the status of every source, in configuration order
+        """
+        start_time = time.perf_counter()
+        summary = SyncSummary(sources=[SourceSyncStatus(name=config.name, type=config.type) for config in sources])
+        for status in summary.sources:
+            self._update(status)
+
+        semaphores: dict[str, asyncio.Semaphore] = {
+            config.type: asyncio.Semaphore(max(self.limits.get(config.type, 1), 1)) for config in sources
+        }
+        await asyncio.gather(
+            *(
+                self._sync_source(config, status, semaphores)
+                for config, status in zip(sources, summary.sources, strict=True)
+            )
+        )
+
+        summary.duration_seconds = time.perf_counter() - start_time
+        return summary
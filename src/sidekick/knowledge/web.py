@@ -1,21 +1,126 @@
 """Web page knowledge source implementation."""
 
 import asyncio
-import fnmatch
+import hashlib
+import json
 import re
+import time
+from collections.abc import Callable
+from contextlib import AsyncExitStack
 from pathlib import Path
 from typing import Any
-from urllib.parse import urljoin, urlparse
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
 
-from crawl4ai import AsyncWebCrawler
+import httpx
+from bs4 import BeautifulSoup, Tag
+from crawl4ai import AsyncWebCrawler, SemaphoreDispatcher
+from html_to_markdown import convert_to_markdown
 from loguru import logger
+from pydantic import BaseModel, Field
 
-from .base import DownloadResult, KnowledgeSource
+from .base import DownloadResult, KnowledgeSource, ResourceState
 from .config import WebSourceConfig
+from .manifest import Manifest
+from .patterns import URLPatternSet
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Static pages need this much visible text, otherwise they are rendered by the browser
+MIN_STATIC_TEXT_LENGTH = 200
+
+# Element IDs single-page apps mount into; empty in the HTML served before scripts run
+SPA_MOUNT_IDS = ("root", "app", "__next", "__nuxt")
+
+CHECKPOINT_FILENAME = ".crawl-checkpoint.json"
+
+# Minimum seconds between checkpoints written during a level
+CHECKPOINT_INTERVAL_SECONDS = 30.0
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL so that different spellings of the same page compare equal.
+
+    Lowercases the scheme and host, drops default ports and fragments, sorts
+    query parameters and uses "/" for an empty path.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Normalized URL
+    """
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    netloc = (parsed.hostname or "").lower()
+    if parsed.port and parsed.port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{parsed.port}"
+    if parsed.username:
+        credentials = parsed.username + (f":{parsed.password}" if parsed.password else "")
+        netloc = f"{credentials}@{netloc}"
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return urlunparse((scheme, netloc, parsed.path or "/", parsed.params, query, ""))
+
+
+class FetchedPage(BaseModel):
+    """Response to a plain HTTP request for a page, used to detect unchanged and static pages before rendering."""
+
+    url: str | None = None
+    status_code: int
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+    html: str | None = Field(default=None, description="Body of HTML responses eligible for static conversion")
+
+
+class CrawlState(BaseModel):
+    """Progress of a breadth-first crawl, checkpointed to disk so an interrupted crawl can resume."""
+
+    start_urls: list[str]
+    max_depth: int
+    depth: int = 0
+    level: list[str] = Field(default_factory=list, description="Normalized URLs of the level being crawled")
+    done: set[str] = Field(default_factory=set, description="URLs of the level that were crawled")
+    discovered: list[str] = Field(default_factory=list, description="URLs of the next level found so far")
+    visited: set[str] = Field(default_factory=set)
+    result: DownloadResult
+
+    def discover(self, links: list[str]) -> None:
+        """Queue links for the next level, skipping URLs that were already seen."""
+        for link in links:
+            if link not in self.visited:
+                self.visited.add(link)
+                self.discovered.append(link)
+
+    def advance(self) -> None:
+        """Move on to the next level."""
+        self.level, self.discovered, self.done = self.discovered, [], set()
+        self.depth += 1
+
+
+class LazyCrawler:
+    """Starts the browser crawler on first use, so crawls of static sites never launch a browser."""
+
+    def __init__(self, stack: AsyncExitStack):
+        """Initialize lazy crawler.
+
+        Args:
+            stack: Exit stack closing the crawler once it was started
+        """
+        self.stack = stack
+        self.crawler: AsyncWebCrawler | None = None
+        self.lock = asyncio.Lock()
+
+    async def get(self) -> AsyncWebCrawler:
+        """Get the crawler, starting it if needed."""
+        async with self.lock:
+            if self.crawler is None:
+                logger.info("Starting browser crawler for pages that need rendering")
+                self.crawler = await self.stack.enter_async_context(AsyncWebCrawler(verbose=True))
+        return self.crawler
 
 
 class WebSource(KnowledgeSource):
-    """Web page knowledge source using crawl4ai."""
+    """Web page knowledge source fetching static pages over HTTP and rendering the rest with crawl4ai."""
 
     def __init__(self, config: WebSourceConfig, base_path: Path | None = None):
         """Initialize Web source.
@@ -26,6 +131,10 @@ class WebSource(KnowledgeSource):
         """
         super().__init__(config, base_path)
         self.config: WebSourceConfig = config
+        # Compiled once per source, matched against every discovered link
+        self.include_patterns = URLPatternSet(config.patterns)
+        self.exclude_patterns = URLPatternSet(config.exclude_patterns)
+        self.js_patterns = URLPatternSet(config.js_patterns)
 
     def download(self, **kwargs) -> DownloadResult:
         """Download web pages.
@@ -42,121 +151,156 @@ class WebSource(KnowledgeSource):
 
         return asyncio.run(self._crawl_and_download_async(urls, depth))
 
-    def sync(self, manifest: dict[str, Any] | None = None) -> DownloadResult:
+    def sync(self, manifest: dict[str, Any] | None = None, resume: bool = False) -> DownloadResult:
         """Sync web pages based on configuration.
 
+        Pages are revalidated with conditional requests against the ETag and
+        Last-Modified recorded in the manifest. Pages that are not modified, or
+        whose HTML hashes the same as before, are not rendered again; their
+        files are kept and their recorded links are still followed.
+
         Args:
-            manifest: Previous manifest (not used for Web)
+            manifest: Previous manifest, with the state of every crawled page
+            resume: Continue an interrupted crawl from its checkpoint instead of starting over
 
         Returns:
-            DownloadResult with downloaded files
+            DownloadResult with downloaded files, unchanged files and the state of every page
         """
-        return asyncio.run(self._crawl_and_download_async(self.config.urls, self.config.depth))
+        previous = Manifest(**manifest).resources if manifest else {}
+        return asyncio.run(self._crawl_and_download_async(self.config.urls, self.config.depth, previous, resume))
+
+    @property
+    def checkpoint_path(self) -> Path:
+        """Path of the crawl checkpoint in the output directory."""
+        return self.output_dir / CHECKPOINT_FILENAME
+
+    def _load_checkpoint(self, start_urls: list[str], max_depth: int) -> CrawlState | None:
+        """Load the checkpoint of an interrupted crawl with the same start URLs and depth."""
+        if not self.checkpoint_path.exists():
+            logger.info("No crawl checkpoint found, starting from the start URLs")
+            return None
+        try:
+            with open(self.checkpoint_path, encoding="utf-8") as f:
+                state = CrawlState(**json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable crawl checkpoint {self.checkpoint_path}: {e}")
+            return None
+        if state.start_urls != start_urls or state.max_depth != max_depth:
+            logger.info("Crawl checkpoint is for different start URLs or depth, starting over")
+            return None
+        return state
 
-    async def _crawl_and_download_async(self, start_urls: list[str], max_depth: int) -> DownloadResult:
-        """Crawl and download web pages using crawl4ai.
+    def _save_checkpoint(self, state: CrawlState) -> None:
+        """Write the crawl state atomically to the checkpoint file."""
+        try:
+            tmp_path = self.checkpoint_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(state.model_dump_json())
+            tmp_path.replace(self.checkpoint_path)
+        except OSError as e:
+            logger.warning(f"Failed to save crawl checkpoint {self.checkpoint_path}: {e}")
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client used to fetch and revalidate pages."""
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=self.config.concurrency_per_host * 4)
+        return httpx.AsyncClient(
+            follow_redirects=True, timeout=30.0, limits=limits, headers={"User-Agent": "sidekick-knowledge-sync"}
+        )
+
+    async def _crawl_and_download_async(
+        self,
+        start_urls: list[str],
+        max_depth: int,
+        previous: dict[str, ResourceState] | None = None,
+        resume: bool = False,
+    ) -> DownloadResult:
+        """Crawl and download web pages.
+
+        Pages are crawled breadth first: the start URLs, then the pages they
+        link to, and so on up to max_depth. Each URL is fetched once, however
+        many pages link to it, and the pages of a level are fetched in batches
+        with at most config.concurrency_per_host fetches per host.
+
+        The crawl state is checkpointed after every level, at most every
+        CHECKPOINT_INTERVAL_SECONDS during a level and when the crawl is
+        interrupted. The checkpoint is removed once the crawl completes.
 
         Args:
             start_urls: Starting URLs
-            max_depth: Maximum crawling depth
+            max_depth: Maximum crawling depth (0: only the start URLs)
+            previous: State of the pages crawled by the previous sync, by normalized URL
+            resume: Continue from the checkpoint of an interrupted crawl
 
         Returns:
             DownloadResult with downloaded files
         """
-        result = DownloadResult(source_name=self.config.name)
-
         # Ensure output directory exists
         self.ensure_output_dir()
 
-        downloaded_files = []
+        state = self._load_checkpoint(start_urls, max_depth) if resume else None
+        if state is None:
+            level = list(dict.fromkeys(normalize_url(url) for url in start_urls))
+            state = CrawlState(
+                start_urls=start_urls,
+                max_depth=max_depth,
+                level=level,
+                visited=set(level),
+                result=DownloadResult(source_name=self.config.name),
+            )
+        else:
+            logger.info(
+                f"Resuming crawl at depth {state.depth}/{max_depth}: {len(state.level) - len(state.done)} pages left "
+                f"in the level, {len(state.result.current_files)} files from before"
+            )
+        result = state.result
+        completed = False
 
         try:
             logger.info(f"Starting web crawl with max_depth={max_depth}")
             logger.info(f"Start URLs: {start_urls}")
-            if self.config.patterns:
-                logger.info(f"URL patterns for filtering: {self.config.patterns}")
+            if self.include_patterns:
+                logger.info(f"URL patterns for filtering: {list(self.include_patterns.patterns)}")
             else:
                 logger.info("No URL patterns configured - will crawl all discovered links")
+            if self.exclude_patterns:
+                logger.info(f"URL patterns excluded: {list(self.exclude_patterns.patterns)}")
+
+            async with AsyncExitStack() as stack, self._http_client() as client:
+                crawler = LazyCrawler(stack)
+                checkpointed_at = time.monotonic()
+
+                def checkpoint() -> None:
+                    nonlocal checkpointed_at
+                    if time.monotonic() - checkpointed_at >= CHECKPOINT_INTERVAL_SECONDS:
+                        self._save_checkpoint(state)
+                        checkpointed_at = time.monotonic()
+
+                while state.level and state.depth <= max_depth:
+                    pending = [url for url in state.level if url not in state.done]
+                    logger.info(f"Crawling {len(pending)} pages at depth {state.depth}/{max_depth}")
+
+                    # Group the level by host so every host gets its own concurrency limit
+                    hosts: dict[str, list[str]] = {}
+                    for url in pending:
+                        hosts.setdefault(urlparse(url).netloc, []).append(url)
+
+                    await asyncio.gather(
+                        *(
+                            self._crawl_host(crawler, client, urls, state, previous or {}, checkpoint)
+                            for urls in hosts.values()
+                        )
+                    )
 
-            async with AsyncWebCrawler(verbose=True) as crawler:
-                if max_depth == 0:
-                    # Simple crawling - just download the provided URLs
-                    logger.info("Simple crawling mode (depth=0) - downloading only specified URLs")
-                    for url in start_urls:
-                        try:
-                            logger.info(f"Crawling: {url}")
-                            crawler_result = await crawler.arun(url=url)
-
-                            if crawler_result.success:
-                                file_path = await self._save_content(url, crawler_result)
-                                if file_path:
-                                    downloaded_files.append(file_path)
-                                    logger.debug(f"Downloaded: {file_path.name}")
-                            else:
-                                error_message = getattr(crawler_result, "error_message", "Unknown")
-                                error_msg = f"Failed to crawl {url}: {error_message}"
-                                logger.error(error_msg)
-                                result.errors.append(error_msg)
-
-                        except Exception as e:
-                            error_msg = f"Failed to crawl {url}: {e}"
-                            logger.error(error_msg)
-                            result.errors.append(error_msg)
-                else:
-                    # Deep crawling with specified depth
-                    logger.info(f"Deep crawling mode (depth={max_depth}) - downloading URLs and following links")
-                    for url in start_urls:
-                        try:
-                            logger.info(f"Deep crawling: {url}")
-
-                            # For deep crawling, we'll crawl the main URL and then follow links
-                            crawler_result = await crawler.arun(url=url)
-
-                            if crawler_result.success:
-                                file_path = await self._save_content(url, crawler_result)
-                                if file_path:
-                                    downloaded_files.append(file_path)
-                                    logger.info(f"✓ Downloaded main page: {file_path.name}")
-
-                                # Extract and follow links up to max_depth
-                                if max_depth > 0:
-                                    extracted_links = self._extract_links_from_content(url, crawler_result)
-                                    logger.info(f"Found {len(extracted_links)} links on {url}")
-
-                                    filtered_links = self._filter_links(extracted_links)
-                                    logger.info(
-                                        f"After pattern filtering: {len(filtered_links)} links match (downloading all)"
-                                    )
-
-                                    # Process all filtered links
-                                    for i, link in enumerate(filtered_links, 1):
-                                        try:
-                                            logger.info(f"[{i}/{len(filtered_links)}] Crawling linked page: {link}")
-                                            sub_result = await crawler.arun(url=link)
-                                            if sub_result.success:
-                                                sub_file_path = await self._save_content(link, sub_result)
-                                                if sub_file_path:
-                                                    downloaded_files.append(sub_file_path)
-                                                    logger.info(f"✓ Downloaded: {sub_file_path.name}")
-                                            else:
-                                                error_message = getattr(sub_result, "error_message", "Unknown")
-                                                logger.warning(f"✗ Failed to crawl {link}: {error_message}")
-                                        except Exception as e:
-                                            logger.warning(f"✗ Failed to crawl linked page {link}: {e}")
-
-                            else:
-                                error_message = getattr(crawler_result, "error_message", "Unknown")
-                                error_msg = f"Failed to deep crawl {url}: {error_message}"
-                                logger.error(error_msg)
-                                result.errors.append(error_msg)
-
-                        except Exception as e:
-                            error_msg = f"Failed to deep crawl {url}: {e}"
-                            logger.error(error_msg)
-                            result.errors.append(error_msg)
-
-            result.files_downloaded = downloaded_files
-            logger.info(f"Downloaded {len(downloaded_files)} web pages")
+                    state.advance()
+                    self._save_checkpoint(state)
+                    checkpointed_at = time.monotonic()
+
+            completed = True
+            self.checkpoint_path.unlink(missing_ok=True)
+            logger.info(
+                f"Downloaded {len(result.files_downloaded)} web pages, {len(result.files_unchanged)} unchanged "
+                f"({len(state.visited)} URLs discovered)"
+            )
 
         except Exception as e:
             error_msg = f"Web crawling failed: {e}"
@@ -164,21 +308,296 @@ class WebSource(KnowledgeSource):
             result.errors.append(error_msg)
             result.success = False
 
-        # Set success based on whether we downloaded any files
+        finally:
+            if not completed:
+                # Interrupted (error, cancellation, Ctrl-C): keep the progress for --resume
+                self._save_checkpoint(state)
+                logger.info(f"Crawl checkpoint saved to {self.checkpoint_path}")
+
+        # Set success based on whether we downloaded or kept any files
         if result.success:
-            result.success = len(result.files_downloaded) > 0
+            result.success = len(result.current_files) > 0
 
         return result
 
-    async def _save_content(self, url: str, crawler_result) -> Path | None:
-        """Save crawled content to file.
+    async def _crawl_host(
+        self,
+        crawler: LazyCrawler,
+        client: httpx.AsyncClient,
+        urls: list[str],
+        state: CrawlState,
+        previous: dict[str, ResourceState],
+        checkpoint: Callable[[], None],
+    ) -> None:
+        """Crawl pages of one host in batches and save their content.
+
+        Every page is first requested over plain HTTP. Unchanged pages are kept,
+        static pages are converted to markdown in-process, and only the rest is
+        rendered by the browser crawler.
+
+        Args:
+            crawler: Browser crawler, started when a page needs rendering
+            client: HTTP client for fetching and revalidating pages
+            urls: Normalized URLs of the host
+            state: Crawl state, collecting results and the matching links found on the pages
+            previous: State of the pages crawled by the previous sync
+            checkpoint: Called after every batch to checkpoint the crawl state
+        """
+        depth, result = state.depth, state.result
+        follow_links = depth < state.max_depth
+        semaphore = asyncio.Semaphore(self.config.concurrency_per_host)
+        dispatcher = SemaphoreDispatcher(semaphore_count=self.config.concurrency_per_host)
+
+        for start in range(0, len(urls), self.config.batch_size):
+            batch = urls[start : start + self.config.batch_size]
+            links: list[str] = []
+            pages = await asyncio.gather(
+                *(self._fetch_page(client, semaphore, url, previous.get(url)) for url in batch)
+            )
+
+            to_render: dict[str, FetchedPage | None] = {}
+            for url, page in zip(batch, pages, strict=True):
+                known = previous.get(url)
+                if page is not None and known is not None and self._is_unchanged(known, page):
+                    logger.debug(f"Page {url} unchanged, skipping render")
+                    result.files_unchanged.extend(self.base_path / file for file in known.files)
+                    result.resources[url] = known.model_copy(
+                        update={
+                            "modified_time": page.last_modified or known.modified_time,
+                            "etag": page.etag or known.etag,
+                            "content_hash": page.content_hash or known.content_hash,
+                        }
+                    )
+                    if follow_links:
+                        links.extend(self._filter_links(known.links or []))
+                elif (
+                    page is not None
+                    and page.html is not None
+                    and self._is_static(soup := BeautifulSoup(page.html, "lxml"))
+                ):
+                    logger.debug(f"Converting static page {url}")
+                    page_links = self._extract_links_from_html(page.url or url, soup)
+                    markdown = self._html_to_markdown(soup)
+                    links.extend(self._store_page(result, url, markdown, page.html, page, page_links, follow_links))
+                else:
+                    to_render[url] = page
+
+            if to_render:
+                await self._render(crawler, dispatcher, to_render, depth, follow_links, result, links)
+
+            state.done.update(batch)
+            state.discover(links)
+            checkpoint()
+
+    async def _render(
+        self,
+        crawler: LazyCrawler,
+        dispatcher: SemaphoreDispatcher,
+        to_render: dict[str, FetchedPage | None],
+        depth: int,
+        follow_links: bool,
+        result: DownloadResult,
+        links: list[str],
+    ) -> None:
+        """Render pages with the browser crawler and save their content.
+
+        Args:
+            crawler: Browser crawler, started on first use
+            dispatcher: Dispatcher limiting concurrent renders
+            to_render: Pages to render, with their plain HTTP response if any
+            depth: Depth of the pages
+            follow_links: Whether to collect the links of the pages
+            result: DownloadResult collecting downloaded files, errors and page states
+            links: Collects the matching links found on the pages
+        """
+        render_urls = list(to_render)
+        try:
+            browser = await crawler.get()
+            crawler_results = await browser.arun_many(urls=render_urls, dispatcher=dispatcher)
+        except Exception as e:
+            crawler_results = []
+            self._record_failure(
+                result, depth, f"Failed to crawl {len(render_urls)} pages of {urlparse(render_urls[0]).netloc}: {e}"
+            )
+
+        for crawler_result in crawler_results:
+            url = crawler_result.url
+            if not crawler_result.success:
+                error_message = getattr(crawler_result, "error_message", "Unknown")
+                self._record_failure(result, depth, f"Failed to crawl {url}: {error_message}")
+                continue
+
+            page_links = [normalize_url(link) for link in self._extract_links_from_content(url, crawler_result)]
+            markdown = crawler_result.markdown or crawler_result.cleaned_html or ""
+            page = to_render.get(url) or self._page_from_crawl(crawler_result)
+            links.extend(
+                self._store_page(result, url, markdown, crawler_result.html or "", page, page_links, follow_links)
+            )
+
+    def _store_page(
+        self,
+        result: DownloadResult,
+        url: str,
+        markdown: str,
+        html: str,
+        page: FetchedPage,
+        page_links: list[str],
+        follow_links: bool,
+    ) -> list[str]:
+        """Save a fetched page and record its state.
+
+        Returns:
+            Links of the page to follow
+        """
+        saved = self._save_content(url, markdown, html)
+        if saved:
+            file_path, changed = saved
+            (result.files_downloaded if changed else result.files_unchanged).append(file_path)
+            logger.debug(f"{'Downloaded' if changed else 'Unchanged'}: {file_path.name}")
+            result.resources[url] = ResourceState(
+                modified_time=page.last_modified,
+                etag=page.etag,
+                content_hash=page.content_hash,
+                files=[str(file_path.relative_to(self.base_path))],
+                links=list(dict.fromkeys(page_links)),
+            )
+
+        if not follow_links:
+            return []
+        filtered_links = self._filter_links(page_links)
+        logger.debug(f"Found {len(page_links)} links on {url}, {len(filtered_links)} match")
+        return filtered_links
+
+    async def _fetch_page(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str, state: ResourceState | None
+    ) -> FetchedPage | None:
+        """Request a page over plain HTTP, conditionally if its validators are known.
+
+        Args:
+            client: HTTP client
+            semaphore: Limits concurrent requests to the host
+            url: Page URL
+            state: State of the page from the previous sync
+
+        Returns:
+            FetchedPage with the validators, HTML hash and HTML, or None if the page is
+            left to the browser or the request failed
+        """
+        if state is None and (not self.config.static_fetch or self._needs_js(url)):
+            # The browser renders the page anyway
+            return None
+
+        headers = {}
+        if state is not None and state.etag:
+            headers["If-None-Match"] = state.etag
+        if state is not None and state.modified_time:
+            headers["If-Modified-Since"] = state.modified_time
+
+        try:
+            async with semaphore:
+                response = await client.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            logger.debug(f"Could not fetch {url}: {e}")
+            return None
+
+        content_hash = None
+        html = None
+        if response.status_code == 200:
+            content_hash = hashlib.sha256(response.content).hexdigest()
+            content_type = response.headers.get("content-type", "")
+            if self.config.static_fetch and "html" in content_type and not self._needs_js(url):
+                html = response.text
+        return FetchedPage(
+            url=str(response.url),
+            status_code=response.status_code,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            content_hash=content_hash,
+            html=html,
+        )
+
+    def _needs_js(self, url: str) -> bool:
+        """Whether a URL matches the js_patterns of pages that must be rendered by the browser."""
+        return self.js_patterns.matches(url)
+
+    def _is_static(self, soup: BeautifulSoup) -> bool:
+        """Whether fetched HTML carries its content without running scripts.
+
+        Pages with little visible text, an empty single-page-app mount point or
+        a notice asking to enable JavaScript are left to the browser. Scripts,
+        styles and templates are removed from the soup.
+        """
+        for noscript in soup.find_all("noscript"):
+            if "javascript" in noscript.get_text().lower():
+                return False
+        for mount_id in SPA_MOUNT_IDS:
+            mount = soup.find(id=mount_id)
+            if mount is not None and not mount.get_text(strip=True):
+                return False
+        for tag in soup(["script", "style", "template", "noscript"]):
+            tag.decompose()
+        body = soup.body or soup
+        return len(body.get_text(" ", strip=True)) >= MIN_STATIC_TEXT_LENGTH
+
+    def _html_to_markdown(self, soup: BeautifulSoup) -> str:
+        """Convert the main content of a static page to markdown."""
+        content = soup.find("main") or soup.find("article") or soup.body or soup
+        return convert_to_markdown(str(content), heading_style="atx", extract_metadata=False).strip()
+
+    def _extract_links_from_html(self, base_url: str, soup: BeautifulSoup) -> list[str]:
+        """Extract the absolute, normalized links of a static page."""
+        links = []
+        for anchor in soup.find_all("a", href=True):
+            if not isinstance(anchor, Tag):
+                continue
+            href = str(anchor["href"]).strip()
+            if not href or href.startswith("#"):
+                continue
+            absolute_url = urljoin(base_url, href)
+            if absolute_url.startswith(("http://", "https://")):
+                links.append(normalize_url(absolute_url))
+        return links
+
+    def _page_from_crawl(self, crawler_result) -> FetchedPage:
+        """Take the validators of a page the browser fetched without a prior HTTP request."""
+        headers = {
+            key.lower(): value for key, value in (getattr(crawler_result, "response_headers", None) or {}).items()
+        }
+        return FetchedPage(
+            status_code=getattr(crawler_result, "status_code", None) or 200,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+        )
+
+    def _is_unchanged(self, state: ResourceState, page: FetchedPage) -> bool:
+        """Whether a revalidated page can keep the files of the previous sync."""
+        if state.links is None or not state.files or not all((self.base_path / f).exists() for f in state.files):
+            return False
+        if page.status_code == 304:
+            return True
+        return page.content_hash is not None and page.content_hash == state.content_hash
+
+    def _record_failure(self, result: DownloadResult, depth: int, error_msg: str) -> None:
+        """Record a failed fetch: an error for start URLs, a warning for linked pages."""
+        if depth == 0:
+            logger.error(error_msg)
+            result.errors.append(error_msg)
+        else:
+            logger.warning(f"✗ {error_msg}")
+
+    def _save_content(self, url: str, markdown: str, html: str) -> tuple[Path, bool] | None:
+        """Save page content to file.
+
+        The file is only rewritten if its content changed, so its modification
+        time stays the same for unchanged pages.
 
         Args:
             url: Original URL
-            crawler_result: Crawl4ai result object
+            markdown: Markdown of the page
+            html: HTML of the page
 
         Returns:
-            Path to saved file or None if failed
+            Path to saved file and whether it was written, or None if failed
         """
         try:
             # Generate filename from URL
@@ -190,23 +609,20 @@ class WebSource(KnowledgeSource):
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
             if self.config.export_format == "md":
-                # Use crawl4ai's built-in markdown conversion
-                markdown_content = crawler_result.markdown or crawler_result.cleaned_html or ""
-
                 # Add URL as metadata at the top
-                content = f"# {parsed_url.netloc}{parsed_url.path}\n\nSource: {url}\n\n{markdown_content}"
-
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+                content = f"# {parsed_url.netloc}{parsed_url.path}\n\nSource: {url}\n\n{markdown}"
             else:
                 # Save as HTML
-                html_content = crawler_result.html or ""
+                content = html
                 file_path = file_path.with_suffix(".html")
 
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(html_content)
+            if file_path.exists() and file_path.read_text(encoding="utf-8") == content:
+                return file_path, False
 
-            return file_path
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(content)
+
+            return file_path, True
 
         except Exception as e:
             logger.error(f"Failed to save content for {url}: {e}")
@@ -284,24 +700,24 @@ class WebSource(KnowledgeSource):
     def _filter_links(self, links: list[str]) -> list[str]:
         """Filter links based on configuration patterns.
 
+        Links are kept if they match an include pattern (or no include patterns
+        are configured) and no exclude pattern.
+
         Args:
             links: List of URLs to filter
 
         Returns:
             Filtered list of URLs
         """
-        if not self.config.patterns:
+        if not self.include_patterns and not self.exclude_patterns:
             return links
 
-        filtered = []
-        for link in links:
-            # Check if link matches any pattern using glob-style matching
-            for pattern in self.config.patterns:
-                if fnmatch.fnmatch(link, pattern):
-                    filtered.append(link)
-                    break
-
-        return filtered
+        return [
+            link
+            for link in links
+            if (not self.include_patterns or self.include_patterns.matches(link))
+            and not self.exclude_patterns.matches(link)
+        ]
 
     def _url_to_filename(self, parsed_url) -> str:
         """Convert URL to a safe filename.
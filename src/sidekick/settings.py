@@ -8,6 +8,7 @@ environment variables, configuration files, and hierarchical settings.
 import os
 import sys
 from pathlib import Path
+from typing import Literal
 
 from pydantic import BaseModel, Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -59,6 +60,67 @@ class APIConfig(BaseModel):
     timeout: int = 30
 
 
+class KnowledgeConfig(BaseModel):
+    """Knowledge base indexing and search configuration."""
+
+    fast_chunking: bool = Field(
+        default=True, description="Use the precomputed-boundary fixed size chunker (same output, faster)"
+    )
+    chunking: Literal["fixed", "token"] = Field(
+        default="fixed",
+        description="Chunking of markdown and PDF documents: whole markdown files and 20,000 character PDF "
+        "chunks (fixed) or heading-aware chunks packed up to chunk_tokens (token). Run a full reindex after "
+        "changing it",
+    )
+    chunk_tokens: int = Field(default=1500, ge=64, description="Approximate token target per chunk for token chunking")
+    embedder: Literal["gemini", "local", "hashing"] = Field(
+        default="gemini",
+        description="Embedding backend: Gemini API, local sentence-transformers model on the CPU, or deterministic "
+        "hashing (tests and benchmarks only). Run a full reindex after changing it",
+    )
+    embedding_model: str | None = Field(default=None, description="Embedding model id (default: backend default)")
+    embedding_dimensions: int | None = Field(
+        default=None, ge=1, description="Embedding dimensions (default: model default)"
+    )
+    local_runtime: Literal["torch", "onnx"] = Field(
+        default="torch", description="Inference runtime of the local embedding backend"
+    )
+    local_batch_size: int = Field(default=64, ge=1, description="Texts per forward pass of the local embedding model")
+    dedup: bool = Field(
+        default=False,
+        description="Store one canonical chunk for duplicate and near-duplicate chunks instead of embedding every copy",
+    )
+    dedup_max_distance: int = Field(
+        default=4,
+        ge=0,
+        le=16,
+        description="Maximum number of differing SimHash bits (of 64) between near-duplicate chunks (0: exact only)",
+    )
+    sharding: bool = Field(
+        default=False,
+        description="Index every source from knowledge/external/sources.yaml into its own table and search them "
+        "concurrently",
+    )
+    sync_concurrency: dict[str, int] = Field(
+        default_factory=lambda: {"git": 4, "gdrive": 2, "web": 2},
+        description="Maximum number of sources of each type (git, gdrive, web) that `knowledge sync` runs at once",
+    )
+    search_cache_size: int = Field(default=256, ge=0, description="Cached knowledge search results (0 disables)")
+    search_cache_ttl: float = Field(default=600.0, gt=0, description="Seconds a cached search result stays valid")
+    query_cache_path: Path = Field(
+        default=Path("tmp/query_embedding_cache.sqlite"), description="Query embedding cache shared by all agents"
+    )
+    query_cache_size: int = Field(default=2048, ge=1, description="Maximum number of cached query embeddings")
+    index_min_rows: int = Field(default=100_000, ge=1, description="Rows from which a vector (ANN) index is built")
+    index_type: Literal["IVF_PQ", "IVF_HNSW_SQ", "IVF_HNSW_PQ"] = Field(
+        default="IVF_PQ", description="LanceDB vector index type"
+    )
+    nprobes: int = Field(default=20, ge=1, description="IVF partitions searched per query")
+    refine_factor: int | None = Field(
+        default=10, ge=1, description="Re-rank this many times the requested results with exact distances"
+    )
+
+
 class Settings(BaseSettings):
     """Main application settings with environment variable support."""
 
@@ -87,6 +149,7 @@ class Settings(BaseSettings):
     # Component configs
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     api: APIConfig = Field(default_factory=APIConfig)
+    knowledge: KnowledgeConfig = Field(default_factory=KnowledgeConfig)
 
     # CLI settings
     color_output: bool = True
@@ -0,0 +1,87 @@
+"""
+Knowledge search toolkit with metadata filters.
+
+Extends agno's KnowledgeTools so agents can narrow knowledge base searches to
+a source, file type, path, version or sync date. The filters are pushed down
+into the LanceDB query as a prefilter.
+"""
+
+import json
+from typing import Any
+
+from agno.agent import Agent
+from agno.team.team import Team
+from agno.tools.knowledge import KnowledgeTools
+from agno.utils.log import log_debug
+from loguru import logger
+
+from ..knowledge.search import RetrievalCache
+
+
+class FilteredKnowledgeTools(KnowledgeTools):
+    """KnowledgeTools whose search tool accepts metadata filters."""
+
+    FILTER_INSTRUCTIONS = (
+        "\nThe search tool can be narrowed with optional filters: source (e.g. 'gdrive', 'web'), "
+        "file_type ('md', 'pdf', 'csv'), version (e.g. '1.5'), path (a pattern with * wildcards such as "
+        "'*release-notes*') and synced_after (an ISO date such as '2025-01-31'). Only use a filter when the "
+        "question clearly asks for it, and search again without it if nothing relevant is found."
+    )
+
+    def __init__(self, *args, default_filters: dict[str, Any] | None = None, **kwargs):
+        """Initialize filtered knowledge tools.
+
+        Args:
+            *args: Passed to KnowledgeTools
+            default_filters: Filters applied to every search, unless the agent overrides the same key
+            **kwargs: Passed to KnowledgeTools
+        """
+        super().__init__(*args, **kwargs)
+        self.default_filters = default_filters or {}
+        if self.instructions:
+            self.instructions += self.FILTER_INSTRUCTIONS
+
+    def search(
+        self,
+        agent: Agent | Team,
+        query: str,
+        source: str | None = None,
+        file_type: str | None = None,
+        version: str | None = None,
+        path: str | None = None,
+        synced_after: str | None = None,
+    ) -> str:
+        """Use this tool to search the knowledge base for relevant information.
+        After thinking through the question, use this tool as many times as needed to search for relevant information.
+
+        Args:
+            query: The query to search the knowledge base for.
+            source: Only search documents from this source (e.g. gdrive, web, git).
+            file_type: Only search documents of this type (md, pdf or csv).
+            version: Only search documents tagged with this product version (e.g. 1.5).
+            path: Only search documents whose path matches this pattern (use * as wildcard, e.g. *release-notes*).
+            synced_after: Only search documents synced on or after this ISO date (e.g. 2025-01-31).
+
+        Returns:
+            str: A string containing the response from the knowledge base.
+        """
+        requested = {
+            "source": source,
+            "file_type": file_type,
+            "version": version,
+            "path": path,
+            "synced_after": synced_after,
+        }
+        filters = {**self.default_filters, **{key: value for key, value in requested.items() if value}}
+        try:
+            log_debug(f"Searching knowledge base: {query} (filters: {filters})")
+            relevant_docs = self.knowledge.search(query=query, filters=filters or None)
+            cache = getattr(self.knowledge, "cache", None)
+            if isinstance(cache, RetrievalCache):
+                log_debug(f"Knowledge search cache: {cache.stats.summary()}")
+            if len(relevant_docs) == 0:
+                return "No documents found"
+            return json.dumps([doc.to_dict() for doc in relevant_docs])
+        except Exception as e:
+            logger.error(f"Error searching knowledge base: {e}")
+            return f"Error searching knowledge base: {e}"
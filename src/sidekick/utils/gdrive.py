@@ -3,22 +3,49 @@
 import csv
 import io
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 from pathlib import Path
 from typing import Any, Literal, cast
 from urllib.parse import parse_qs, urlparse
 
 import google.auth.transport.requests
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseDownload
+from googleapiclient.http import HttpRequest, MediaIoBaseDownload, build_http
 from html_to_markdown import convert_to_markdown
 from loguru import logger
 from pydantic import BaseModel, Field, field_validator
 
+# Credentials and API services are shared by all exporters of the process. httplib2 connections
+# are not thread-safe, so every thread sends its requests through its own authorized connection.
+_auth_lock = threading.RLock()
+_credentials_cache: dict[tuple[str, tuple[str, ...]], Credentials] = {}
+_service_cache: dict[tuple[str, tuple[str, ...], str, str], Any] = {}
+_thread_state = threading.local()
+
+
+def _thread_http(credentials: Credentials) -> AuthorizedHttp:
+    """Get the calling thread's authorized HTTP connection for the credentials."""
+    connections = getattr(_thread_state, "connections", None)
+    if connections is None:
+        connections = _thread_state.connections = {}
+    http = connections.get(id(credentials))
+    if http is None:
+        http = connections[id(credentials)] = AuthorizedHttp(credentials, http=build_http())
+    return http
+
+
+def _thread_request(credentials: Credentials, http: Any, *args: Any, **kwargs: Any) -> HttpRequest:
+    """Build an API request that is sent through the calling thread's connection."""
+    return HttpRequest(_thread_http(credentials), *args, **kwargs)
+
 
 class DocumentType(Enum):
     """Google Drive document types."""
@@ -47,6 +74,18 @@ class ExportFormat(BaseModel):
     description: str | None = None
 
 
+class ExportedDocument(BaseModel):
+    """A document handled by an export run, recorded so later runs can skip it while it is unchanged."""
+
+    document_id: str
+    name: str = "untitled"
+    modified_time: str | None = None
+    version: str | None = None
+    files: list[Path] = Field(default_factory=list)
+    links: list[str] | None = Field(default=None, description="Linked document IDs (None if links were not extracted)")
+    unchanged: bool = Field(default=False, description="Whether the previous export was reused")
+
+
 class GoogleDriveExporterConfig(BaseModel):
     """Configuration for GoogleDriveExporter."""
 
@@ -73,6 +112,7 @@ class GoogleDriveExporterConfig(BaseModel):
     ] = "html"
     link_depth: int = Field(default=0, ge=0, le=5)
     follow_links: bool = Field(default=False)
+    max_workers: int = Field(default=4, ge=1, le=32, description="Documents exported concurrently")
     scopes: list[str] = Field(
         default_factory=lambda: [
             "https://www.googleapis.com/auth/drive",
@@ -149,36 +189,95 @@ class GoogleDriveExporter:
     # Combined formats for backward compatibility
     EXPORT_FORMATS: dict[str, ExportFormat] = DOCUMENT_EXPORT_FORMATS
 
-    def __init__(self, config: GoogleDriveExporterConfig | None = None, download_callback=None):
+    def __init__(
+        self,
+        config: GoogleDriveExporterConfig | None = None,
+        download_callback=None,
+        previous: dict[str, ExportedDocument] | None = None,
+    ):
         """Initialize the exporter with configuration.
 
         Args:
             config: Configuration object. If None, uses defaults.
             download_callback: Optional callback function called when files are downloaded.
                              Should accept (document_id, format_key, output_path, success) arguments.
+            previous: Documents exported by a previous run. Documents whose modifiedTime and version
+                      did not change since are not exported again.
         """
         self.config = config or GoogleDriveExporterConfig()
         self._service = None
         self._processed_docs: set[str] = set()
+        # Link levels followed below each processed document
+        self._followed_depth: dict[str, int] = {}
         self.download_callback = download_callback
+        self.previous = previous or {}
+        # IDs of documents changed since the previous run (None: unknown, compare each document's metadata)
+        self.changed_ids: set[str] | None = None
+        self.documents: dict[str, ExportedDocument] = {}
+        self.errors: list[str] = []
 
     @property
     def service(self):
         """Get or create the Google Drive service instance."""
         if self._service is None:
-            creds = self._authenticate()
-            self._service = build("drive", "v3", credentials=creds)
+            self._service = self._build_service("drive", "v3")
         return self._service
 
+    def _credentials_key(self) -> tuple[str, tuple[str, ...]]:
+        return str(self.config.token_path.resolve()), tuple(self.config.scopes)
+
+    def _build_service(self, name: str, version: str) -> Any:
+        """Get the process-wide API service, building it on first use.
+
+        Args:
+            name: API name (drive, docs, sheets, slides).
+            version: API version.
+
+        Returns:
+            Service whose requests are safe to execute from several threads.
+        """
+        creds = self._authenticate()
+        key = (*self._credentials_key(), name, version)
+        with _auth_lock:
+            service = _service_cache.get(key)
+            if service is None:
+                service = build(name, version, http=_thread_http(creds), requestBuilder=partial(_thread_request, creds))
+                _service_cache[key] = service
+        return service
+
     def _authenticate(self) -> Credentials:
         """Authenticate with Google Drive API.
 
+        Credentials are loaded (or obtained through the OAuth flow) once per
+        process and token file, and shared by all exporters and threads.
+
         Returns:
             Authenticated credentials.
         """
-        creds = None
+        key = self._credentials_key()
+        with _auth_lock:
+            cached = _credentials_cache.get(key)
+            if cached is not None and cached.valid:
+                return cached
+
+            creds = self._load_credentials(cached)
+            if creds is not cached:
+                # Services hold on to the credentials they were built with
+                for service_key in [k for k in _service_cache if k[:2] == key]:
+                    del _service_cache[service_key]
+            _credentials_cache[key] = creds
+            return creds
+
+    def _load_credentials(self, creds: Credentials | None = None) -> Credentials:
+        """Load, refresh or obtain credentials.
+
+        Args:
+            creds: Cached credentials to refresh, if any.
 
-        if self.config.token_path.exists():
+        Returns:
+            Valid credentials.
+        """
+        if creds is None and self.config.token_path.exists():
             logger.debug(f"Loading credentials from {self.config.token_path}")
             creds = Credentials.from_authorized_user_file(str(self.config.token_path), self.config.scopes)
 
@@ -398,7 +497,7 @@ class GoogleDriveExporter:
                     self.service.files()
                     .get(
                         fileId=document_id,
-                        fields="name,mimeType,modifiedTime,owners,createdTime",
+                        fields="name,mimeType,modifiedTime,version,owners,createdTime",
                         supportsAllDrives=True,
                     )
                     .execute()
@@ -414,7 +513,7 @@ class GoogleDriveExporter:
                 logger.debug("Trying Method 2: files().get() API...")
                 metadata = (
                     self.service.files()
-                    .get(fileId=document_id, fields="name,mimeType,modifiedTime,owners,createdTime")
+                    .get(fileId=document_id, fields="name,mimeType,modifiedTime,version,owners,createdTime")
                     .execute()
                 )
                 logger.debug(f"✅ Method 2 Success: {metadata.get('name')}")
@@ -433,8 +532,7 @@ class GoogleDriveExporter:
                     logger.debug("Trying Method 4: Build separate docs service...")
                     # Create Docs service if we don't have one
                     if not hasattr(self, "_docs_service"):
-                        creds = self._authenticate()
-                        self._docs_service = build("docs", "v1", credentials=creds)
+                        self._docs_service = self._build_service("docs", "v1")
 
                     # Get document via Docs API
                     doc = self._docs_service.documents().get(documentId=document_id).execute()
@@ -458,8 +556,7 @@ class GoogleDriveExporter:
                     logger.debug("Trying Method 4: Build separate sheets service...")
                     # Create Sheets service if we don't have one
                     if not hasattr(self, "_sheets_service"):
-                        creds = self._authenticate()
-                        self._sheets_service = build("sheets", "v4", credentials=creds)
+                        self._sheets_service = self._build_service("sheets", "v4")
 
                     # Get spreadsheet metadata
                     sheet = self._sheets_service.spreadsheets().get(spreadsheetId=document_id).execute()
@@ -482,8 +579,7 @@ class GoogleDriveExporter:
                     logger.debug("Trying Method 4: Build separate slides service...")
                     # Create Slides service if we don't have one
                     if not hasattr(self, "_slides_service"):
-                        creds = self._authenticate()
-                        self._slides_service = build("slides", "v1", credentials=creds)
+                        self._slides_service = self._build_service("slides", "v1")
 
                     # Get presentation metadata
                     presentation = self._slides_service.presentations().get(presentationId=document_id).execute()
@@ -665,14 +761,8 @@ class GoogleDriveExporter:
             logger.debug(f"Found {len(all_matches)} potential Google Drive links")
 
             # Remove duplicates while preserving order
-            seen = set()
-            unique_ids = []
-            for doc_id in all_matches:
-                if doc_id not in seen and doc_id not in self._processed_docs:
-                    seen.add(doc_id)
-                    unique_ids.append(doc_id)
-                    logger.debug(f"Added document ID to process: {doc_id}")
-
+            unique_ids = list(dict.fromkeys(all_matches))
+            logger.debug(f"Found {len(unique_ids)} unique linked document IDs")
             return unique_ids
 
         except Exception as e:
@@ -693,8 +783,7 @@ class GoogleDriveExporter:
         try:
             # Build sheets service if we don't have one
             if not hasattr(self, "_sheets_service"):
-                creds = self._authenticate()
-                self._sheets_service = build("sheets", "v4", credentials=creds)
+                self._sheets_service = self._build_service("sheets", "v4")
 
             # Get spreadsheet metadata
             spreadsheet = self._sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
@@ -757,28 +846,90 @@ class GoogleDriveExporter:
             logger.error(f"Failed to export sheets as CSV: {e}")
             return False
 
-    def export_document(
-        self, document_id: str, output_name: str | None = None, current_depth: int = 0
-    ) -> dict[str, Path]:
-        """Export a Google Drive document.
+    def get_start_page_token(self) -> str:
+        """Get the Changes API page token marking the current state of the Drive.
+
+        Returns:
+            Page token to pass to list_changed_ids on the next run.
+        """
+        response = self.service.changes().getStartPageToken(supportsAllDrives=True).execute()
+        return cast(str, response["startPageToken"])
+
+    def list_changed_ids(self, page_token: str) -> tuple[set[str], str]:
+        """List the files changed since a Changes API page token.
 
         Args:
-            document_id: Google Drive document ID or URL.
-            output_name: Optional custom output name (without extension).
-            current_depth: Current recursion depth for link following.
+            page_token: Page token from get_start_page_token or a previous call.
 
         Returns:
-            Dictionary mapping format names to output paths.
+            IDs of the changed files and the page token to continue from on the next run.
         """
-        # Store original for type detection
-        original_url_or_id = document_id
-        document_id = self.extract_document_id(document_id)
+        changed: set[str] = set()
+        while True:
+            response = (
+                self.service.changes()
+                .list(
+                    pageToken=page_token,
+                    fields="nextPageToken,newStartPageToken,changes(fileId)",
+                    pageSize=1000,
+                    includeItemsFromAllDrives=True,
+                    supportsAllDrives=True,
+                )
+                .execute()
+            )
+            changed.update(change["fileId"] for change in response.get("changes", []) if "fileId" in change)
+            if "newStartPageToken" in response:
+                return changed, cast(str, response["newStartPageToken"])
+            page_token = response["nextPageToken"]
+
+    def _root_link_depth(self, current_depth: int = 0) -> int:
+        """Number of link levels to follow below a document, from the configured link depth."""
+        return max(self.config.link_depth - current_depth, 0) if self.config.follow_links else 0
+
+    def _can_reuse(self, previous: ExportedDocument, remaining_depth: int) -> bool:
+        """Whether the files of a previous export are still complete enough to skip the export."""
+        if not previous.files or not all(path.exists() for path in previous.files):
+            return False
+        # Links must be known if this run follows them
+        return previous.links is not None or remaining_depth == 0
 
-        if document_id in self._processed_docs:
-            logger.info(f"Document {document_id} already processed, skipping")
-            return {}
+    def _is_unchanged(self, previous: ExportedDocument, metadata: dict[str, Any]) -> bool:
+        """Whether document metadata shows no change since the previous export."""
+        if previous.modified_time is None or metadata.get("modifiedTime") != previous.modified_time:
+            return False
+        version = metadata.get("version")
+        return previous.version is None or version is None or str(version) == previous.version
+
+    def _reuse(self, previous: ExportedDocument, remaining_depth: int) -> tuple[dict[str, Path], list[str]]:
+        """Keep the files of an unchanged document and return its recorded links."""
+        logger.info(f"Document '{previous.name}' ({previous.document_id}) unchanged, skipping export")
+        self.documents[previous.document_id] = previous.model_copy(update={"unchanged": True})
+        links = (previous.links or []) if remaining_depth > 0 else []
+        return {path.suffix.lstrip("."): path for path in previous.files}, links
+
+    def _export(
+        self, original_url_or_id: str, remaining_depth: int, output_name: str | None = None
+    ) -> tuple[dict[str, Path], list[str]]:
+        """Export a single document without following its links.
 
-        self._processed_docs.add(document_id)
+        Safe to call from several threads for different documents.
+
+        Args:
+            original_url_or_id: Google Drive document ID or URL.
+            remaining_depth: Number of link levels still to follow below this document.
+            output_name: Optional custom output name (without extension).
+
+        Returns:
+            Dictionary mapping format names to output paths, and the IDs of linked documents to follow.
+        """
+        document_id = self.extract_document_id(original_url_or_id)
+
+        # Documents the Changes API reports as unchanged are skipped without a metadata request
+        previous = self.previous.get(document_id)
+        if previous is not None and not self._can_reuse(previous, remaining_depth):
+            previous = None
+        if previous is not None and self.changed_ids is not None and document_id not in self.changed_ids:
+            return self._reuse(previous, remaining_depth)
 
         # First try to detect document type from URL
         doc_type = self.detect_document_type(original_url_or_id)
@@ -798,6 +949,9 @@ class GoogleDriveExporter:
             else:
                 logger.debug(f"Detected document type from URL: {doc_type.value}")
 
+            if previous is not None and self._is_unchanged(previous, metadata):
+                return self._reuse(previous, remaining_depth)
+
         except Exception as e:
             logger.warning(f"Could not get metadata for {document_id}, using 'untitled': {e}")
             # If we still don't know the type, default to DOCUMENT
@@ -841,7 +995,7 @@ class GoogleDriveExporter:
 
         # If following links, we need HTML format for link extraction
         # Add it if not already present and we're configured to follow links
-        if self.config.follow_links and current_depth < self.config.link_depth and "html" not in formats_to_export:
+        if remaining_depth > 0 and "html" not in formats_to_export:
             formats_to_export.append("html")
             logger.debug("Added HTML format for link extraction")
 
@@ -880,23 +1034,116 @@ class GoogleDriveExporter:
             logger.info("-" * 50)
             self.export_all_sheets_as_csv(document_id, self.config.target_directory, safe_title)
 
-        # Process linked documents if requested
-        if self.config.follow_links and current_depth < self.config.link_depth and "html" in exported_files:
-            logger.info(f"Searching for linked documents (depth {current_depth + 1}/{self.config.link_depth})")
+        # Collect linked documents if requested
+        linked_ids = None
+        if remaining_depth > 0 and "html" in exported_files:
+            logger.info(f"Searching for linked documents of '{doc_title}' ({remaining_depth} levels left)")
             linked_ids = self._extract_links_from_html(exported_files["html"])
 
-            if linked_ids:
-                logger.info(f"Found {len(linked_ids)} linked documents")
-                for linked_id in linked_ids:
+        if exported_files:
+            version = metadata.get("version") if metadata else None
+            self.documents[document_id] = ExportedDocument(
+                document_id=document_id,
+                name=doc_title,
+                modified_time=metadata.get("modifiedTime") if metadata else None,
+                version=None if version is None else str(version),
+                files=list(exported_files.values()),
+                links=linked_ids,
+            )
+
+        return exported_files, linked_ids or []
+
+    def export_documents(
+        self, documents: list[tuple[str, int]], output_name: str | None = None
+    ) -> dict[str, dict[str, Path]]:
+        """Export documents and the documents they link to, concurrently.
+
+        Documents are exported level by level (the given documents, then the
+        documents they link to, ...) by a pool of config.max_workers threads.
+        A document reached through several link paths is exported once, and
+        its links are followed as deep as the deepest of those paths allows.
+
+        Args:
+            documents: Document IDs or URLs, each with the number of link levels to follow below it.
+            output_name: Optional custom output name (without extension) for a single document.
+
+        Returns:
+            Dictionary mapping document IDs to their exported file paths.
+        """
+        results: dict[str, dict[str, Path]] = {}
+        level = documents
+        depth = 0
+
+        with ThreadPoolExecutor(max_workers=self.config.max_workers, thread_name_prefix="gdrive-export") as executor:
+            while level:
+                # Each document is exported once per level, with the most link levels it was reached with
+                pending: dict[str, tuple[str, int]] = {}
+                for url_or_id, remaining_depth in level:
+                    document_id = self.extract_document_id(url_or_id)
+                    if self._followed_depth.get(document_id, -1) >= remaining_depth:
+                        logger.debug(f"Document {document_id} already processed, skipping")
+                        continue
+                    if document_id not in pending or remaining_depth > pending[document_id][1]:
+                        pending[document_id] = (url_or_id, remaining_depth)
+
+                if depth > 0 and pending:
+                    logger.info(f"Exporting {len(pending)} linked documents (depth {depth})")
+
+                futures = {}
+                next_level: list[tuple[str, int]] = []
+                for document_id, (url_or_id, remaining_depth) in pending.items():
+                    exported = self.documents.get(document_id)
+                    self._processed_docs.add(document_id)
+                    self._followed_depth[document_id] = remaining_depth
+                    if exported is not None and exported.links is not None:
+                        # Already exported this run through a shallower path, only its links are followed deeper
+                        next_level.extend((link, remaining_depth - 1) for link in exported.links)
+                        continue
+                    name = output_name if len(documents) == 1 and depth == 0 else None
+                    futures[document_id] = executor.submit(self._export, url_or_id, remaining_depth, name)
+
+                for document_id, future in futures.items():
                     try:
-                        self.export_document(linked_id, current_depth=current_depth + 1)
+                        exported_files, linked_ids = future.result()
                     except Exception as e:
-                        logger.error(f"Failed to export linked document {linked_id}: {e}")
+                        logger.error(f"Failed to export {document_id}: {e}")
+                        self.errors.append(f"Failed to export {document_id}: {e}")
+                        continue
+                    if exported_files:
+                        results[document_id] = exported_files
+                    remaining_depth = pending[document_id][1]
+                    next_level.extend((linked_id, remaining_depth - 1) for linked_id in linked_ids)
+
+                level = next_level
+                depth += 1
+
+        return results
+
+    def export_document(
+        self, document_id: str, output_name: str | None = None, current_depth: int = 0
+    ) -> dict[str, Path]:
+        """Export a Google Drive document.
+
+        Linked documents are exported concurrently if link following is configured.
+
+        Args:
+            document_id: Google Drive document ID or URL.
+            output_name: Optional custom output name (without extension).
+            current_depth: Current depth for link following.
+
+        Returns:
+            Dictionary mapping format names to output paths.
+        """
+        extracted_id = self.extract_document_id(document_id)
+        if extracted_id in self._processed_docs:
+            logger.info(f"Document {extracted_id} already processed, skipping")
+            return {}
 
-        return exported_files
+        results = self.export_documents([(document_id, self._root_link_depth(current_depth))], output_name)
+        return results.get(extracted_id, {})
 
     def export_multiple(self, document_ids: list[str]) -> dict[str, dict[str, Path]]:
-        """Export multiple documents.
+        """Export multiple documents concurrently.
 
         Args:
             document_ids: List of document IDs or URLs.
@@ -904,18 +1151,11 @@ class GoogleDriveExporter:
         Returns:
             Dictionary mapping document IDs to their exported file paths.
         """
-        results = {}
-
-        for doc_id in document_ids:
-            try:
-                extracted_id = self.extract_document_id(doc_id)
-                exported = self.export_document(doc_id)
-                if exported:
-                    results[extracted_id] = exported
-            except Exception as e:
-                logger.error(f"Failed to export {doc_id}: {e}")
-
-        return results
+        try:
+            return self.export_documents([(doc_id, self._root_link_depth()) for doc_id in document_ids])
+        except Exception as e:
+            logger.error(f"Failed to export documents: {e}")
+            return {}
 
     def mirror_documents(self, config_path: Path) -> dict[str, dict[str, Path]]:
         """Mirror documents from a configuration file.
@@ -934,34 +1174,16 @@ class GoogleDriveExporter:
             return {}
 
         logger.info(f"Starting mirror of {len(documents)} documents")
-
-        results = {}
-
-        # Process each document with its specific depth setting
         for doc_config in documents:
-            try:
-                logger.info(f"Mirroring '{doc_config.comment or doc_config.document_id}' (depth={doc_config.depth})")
-
-                # Temporarily override link depth for this specific document
-                original_follow_links = self.config.follow_links
-                original_link_depth = self.config.link_depth
+            logger.info(f"Mirroring '{doc_config.comment or doc_config.document_id}' (depth={doc_config.depth})")
 
-                # Set follow_links based on whether depth > 0
-                self.config.follow_links = doc_config.depth > 0
-                self.config.link_depth = doc_config.depth
-
-                try:
-                    exported = self.export_document(doc_config.document_id)
-                    if exported:
-                        results[doc_config.document_id] = exported
-                finally:
-                    # Restore original settings
-                    self.config.follow_links = original_follow_links
-                    self.config.link_depth = original_link_depth
-
-            except Exception as e:
-                logger.error(f"Failed to mirror document {doc_config.document_id}: {e}")
-                continue
+        # Each document follows links up to its own depth setting
+        try:
+            exported = self.export_documents([(doc.document_id, doc.depth) for doc in documents])
+        except Exception as e:
+            logger.error(f"Failed to mirror documents: {e}")
+            return {}
 
+        results = {doc.document_id: exported[doc.document_id] for doc in documents if doc.document_id in exported}
         logger.info(f"Mirror completed: {len(results)}/{len(documents)} documents exported")
         return results
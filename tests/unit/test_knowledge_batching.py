@@ -0,0 +1,110 @@
+"""
+Unit tests for the batched embedding stage.
+
+This module tests batching, retries and throughput accounting with stub embedders.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+from agno.document.base import Document
+from agno.embedder.base import Embedder
+
+from sidekick.knowledge.batching import BatchEmbedder, ChunkBudget, EmbeddingBatchConfig, is_rate_limit_error
+
+
+class RateLimitError(Exception):
+    """Stub error carrying an HTTP status code."""
+
+    code = 429
+
+
+@dataclass
+class FlakyEmbedder(Embedder):
+    """Stub embedder that is rate limited a fixed number of times."""
+
+    dimensions: int = 2
+    failures: int = 0
+    texts: list[str] = field(default_factory=list)
+
+    def get_embedding_and_usage(self, text: str) -> tuple[list[float], dict | None]:
+        if self.failures > 0:
+            self.failures -= 1
+            raise RateLimitError("quota exceeded")
+        self.texts.append(text)
+        return [float(len(text)), 0.0], None
+
+
+class TestBatchEmbedder:
+    """Test cases for BatchEmbedder."""
+
+    @pytest.mark.asyncio
+    async def test_embeds_all_documents_in_batches(self):
+        """Test that every document is embedded and batches are counted."""
+        embedder = FlakyEmbedder()
+        documents = [Document(content="x" * i) for i in range(1, 8)]
+        batcher = BatchEmbedder(embedder, EmbeddingBatchConfig(batch_size=3, max_concurrency=2))
+
+        await batcher.embed_documents(documents)
+
+        assert [doc.embedding for doc in documents] == [[float(i), 0.0] for i in range(1, 8)]
+        assert batcher.stats.chunks == 7
+        assert batcher.stats.requests == 3
+        assert batcher.stats.tokens > 0
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_batches(self):
+        """Test that rate-limited requests are retried with backoff."""
+        embedder = FlakyEmbedder(failures=2)
+        config = EmbeddingBatchConfig(batch_size=10, initial_backoff=0.001, requests_per_minute=6000)
+        batcher = BatchEmbedder(embedder, config)
+        documents = [Document(content="hello")]
+
+        await batcher.embed_documents(documents)
+
+        assert documents[0].embedding == [5.0, 0.0]
+        assert batcher.stats.retries == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        """Test that the error is raised once retries are exhausted."""
+        embedder = FlakyEmbedder(failures=5)
+        batcher = BatchEmbedder(embedder, EmbeddingBatchConfig(max_retries=1, initial_backoff=0.001))
+
+        with pytest.raises(RateLimitError):
+            await batcher.embed_documents([Document(content="hello")])
+
+    def test_rate_limit_detection(self):
+        """Test detection of 429 errors."""
+        assert is_rate_limit_error(RateLimitError())
+        assert is_rate_limit_error(Exception("429 RESOURCE_EXHAUSTED"))
+        assert not is_rate_limit_error(ValueError("bad input"))
+
+
+class TestChunkBudget:
+    """Test cases for ChunkBudget."""
+
+    @pytest.mark.asyncio
+    async def test_blocks_until_chunks_are_released(self):
+        """Test that reservations beyond the limit wait for a release."""
+        budget = ChunkBudget(limit=10)
+        await budget.acquire(8)
+
+        assert not budget.fits(5)
+        waiter = asyncio.ensure_future(budget.acquire(5))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await budget.release(8)
+        await asyncio.wait_for(waiter, timeout=1)
+        assert budget.in_flight == 5
+
+    @pytest.mark.asyncio
+    async def test_oversized_reservation_is_admitted_when_empty(self):
+        """Test that a single oversized file cannot block forever."""
+        budget = ChunkBudget(limit=4)
+
+        await asyncio.wait_for(budget.acquire(100), timeout=1)
+
+        assert budget.in_flight == 100
@@ -0,0 +1,52 @@
+"""
+Unit tests for the offline knowledge benchmark.
+
+This module tests the deterministic corpus, embedder and benchmark run.
+"""
+
+import pytest
+
+from sidekick.knowledge.bench import generate_corpus, percentile, run_benchmark
+from sidekick.knowledge.embedders import HashingEmbedder
+
+
+class TestBenchHelpers:
+    """Test cases for the benchmark building blocks."""
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles."""
+        values = [float(i) for i in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([3.0], 95) == 3.0
+        assert percentile([], 50) == 0.0
+
+    def test_corpus_and_embedder_are_deterministic(self, tmp_path):
+        """Test that the same seed gives the same corpus and vectors."""
+        first = generate_corpus(tmp_path / "a", num_documents=3)
+        second = generate_corpus(tmp_path / "b", num_documents=3)
+
+        assert first == second
+        assert (tmp_path / "a" / "component-0001.md").read_text() == (tmp_path / "b" / "component-0001.md").read_text()
+        embedder = HashingEmbedder()
+        assert embedder.get_embedding(first[0].query) == embedder.get_embedding(first[0].query)
+        assert len(embedder.get_embedding("text")) == embedder.dimensions
+
+
+class TestRunBenchmark:
+    """Test cases for run_benchmark."""
+
+    @pytest.mark.asyncio
+    async def test_small_corpus(self, tmp_path):
+        """Test a benchmark run over a generated corpus."""
+        queries = generate_corpus(tmp_path / "corpus", num_documents=10)
+
+        result = await run_benchmark(tmp_path / "corpus", queries, tmp_path / "lancedb", k=3, parse_workers=1)
+
+        assert result.documents == 10
+        assert result.queries == 10
+        assert result.chunks >= 10
+        assert result.corpus_mb > 0
+        assert result.latency_p50_ms <= result.latency_p95_ms <= result.latency_p99_ms
+        assert result.recall_at_k >= 0.8
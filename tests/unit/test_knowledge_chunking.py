@@ -0,0 +1,86 @@
+"""
+Unit tests for knowledge chunking strategies.
+
+This module tests the fast fixed size chunker and the token-aware chunker.
+"""
+
+import random
+
+from agno.document.base import Document
+
+from sidekick.knowledge.chunking import FastFixedSizeChunking, FixedSizeChunking, TokenChunking, approximate_tokens
+
+
+def _as_tuples(documents: list[Document]) -> list[tuple]:
+    return [(doc.id, doc.name, doc.meta_data, doc.content) for doc in documents]
+
+
+class TestFastFixedSizeChunking:
+    """Test cases for FastFixedSizeChunking."""
+
+    def test_matches_fixed_size_chunking(self):
+        """Test that chunks are identical to FixedSizeChunking for varied text."""
+        rng = random.Random(42)
+        # Words stay shorter than chunk_size - overlap, otherwise the reference implementation never terminates
+        words = ["a", "lorem", "ipsum\n\n", "dolor\t", "sit\r\n", "consectetur"]
+        for _ in range(50):
+            text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 200)))
+            document = Document(content=text, name="doc", meta_data={"page": 1})
+            chunk_size = rng.randint(30, 120)
+            overlap = rng.randint(0, 10)
+
+            expected = FixedSizeChunking(chunk_size=chunk_size, overlap=overlap).chunk(document)
+            actual = FastFixedSizeChunking(chunk_size=chunk_size, overlap=overlap).chunk(document)
+
+            assert _as_tuples(actual) == _as_tuples(expected)
+
+    def test_long_word_is_split_at_chunk_size(self):
+        """Test that text without whitespace is cut at the chunk size."""
+        document = Document(content="x" * 25, id="doc")
+
+        chunks = FastFixedSizeChunking(chunk_size=10).chunk(document)
+
+        assert [chunk.content for chunk in chunks] == ["x" * 10, "x" * 10, "x" * 5]
+        assert [chunk.id for chunk in chunks] == ["doc_1", "doc_2", "doc_3"]
+
+    def test_iter_chunks_is_lazy(self):
+        """Test that chunks are produced on demand."""
+        chunks = FastFixedSizeChunking(chunk_size=10).iter_chunks(Document(content="word " * 100))
+
+        first = next(chunks)
+
+        assert first.content == "word word"
+        assert first.meta_data == {"chunk": 1, "chunk_size": 9}
+
+
+class TestTokenChunking:
+    """Test cases for TokenChunking."""
+
+    def test_packs_sections_at_heading_boundaries(self):
+        """Test that small sections are packed together and split only at headings."""
+        text = "# One\n\nfirst section\n\n## Two\n\nsecond section\n\n## Three\n\n" + "word " * 30
+        document = Document(content=text, name="doc")
+
+        chunks = TokenChunking(target_tokens=20).chunk(document)
+
+        assert [chunk.content.splitlines()[0] for chunk in chunks[:2]] == ["# One", "## Three"]
+        assert "## Two" in chunks[0].content
+        # The oversized section keeps its heading with the start of its body
+        assert "word" in chunks[1].content
+        assert [chunk.id for chunk in chunks] == [f"doc_{i}" for i in range(1, len(chunks) + 1)]
+
+    def test_chunks_stay_within_budget(self):
+        """Test that oversized sections are split below the token target."""
+        text = "# Big\n\n" + "\n\n".join("paragraph " * 40 for _ in range(5)) + "\n\n" + "x" * 500
+        chunks = TokenChunking(target_tokens=50).chunk(Document(content=text))
+
+        assert all(approximate_tokens(chunk.content) <= 50 for chunk in chunks)
+        assert "".join(chunk.content for chunk in chunks).replace(" ", "").replace("\n", "") == text.replace(
+            " ", ""
+        ).replace("\n", "")
+
+    def test_headings_inside_code_fences_are_ignored(self):
+        """Test that comment lines in code blocks do not start a new section."""
+        sections = TokenChunking._split_sections("# Doc\n\n```bash\n# install\nmake\n```\n\n# Next\n")
+
+        assert sections == ["# Doc\n\n```bash\n# install\nmake\n```\n\n", "# Next\n"]
@@ -0,0 +1,139 @@
+"""
+Unit tests for duplicate chunk detection.
+
+This module tests exact and near-duplicate matching and how the knowledge
+manager stores one canonical row per group of duplicates.
+"""
+
+import json
+
+import pytest
+
+from sidekick.knowledge.dedup import DedupIndex, hamming_distance, normalize_tokens, simhash
+from sidekick.knowledge.embedders import HashingEmbedder
+from sidekick.knowledge.embeddings import CachedEmbedder
+from sidekick.knowledge.manager import KnowledgeManager
+
+PARAGRAPH = (
+    "Dynamic plugins let administrators extend Red Hat Developer Hub without rebuilding the image. "
+    "Each plugin is packaged as an OCI artifact or npm tarball and enabled in the dynamic plugins "
+    "configuration, after which the backend loads it at startup and the frontend mounts its routes."
+)
+EDITED = PARAGRAPH.replace("at startup", "on startup")
+UNRELATED = (
+    "The operator upgrade channel decides which release is installed. Subscriptions on the fast channel "
+    "receive every z-stream update, while the stable channel only moves after a release was validated."
+)
+
+
+class TestDedupIndex:
+    """Test cases for DedupIndex."""
+
+    def test_exact_and_near_duplicates(self, tmp_path):
+        """Test that formatting variants and small edits map to the canonical chunk, other text does not."""
+        index = DedupIndex(tmp_path / "dedup.json")
+
+        assert index.add("a", PARAGRAPH) is None
+        assert index.add("a", PARAGRAPH) == "a"
+        assert index.add("b", "## " + PARAGRAPH.upper().replace(" ", "\n")) == "a"
+        assert index.add("c", EDITED) == "a"
+        assert index.add("d", UNRELATED) is None
+        assert hamming_distance(simhash(normalize_tokens(PARAGRAPH)), simhash(normalize_tokens(EDITED))) <= 4
+
+    def test_forget_and_persist(self, tmp_path):
+        """Test that forgotten chunks no longer match and signatures survive a reload."""
+        index = DedupIndex.for_table(tmp_path, "docs", max_distance=0)
+        index.add("a", PARAGRAPH)
+        index.add("d", UNRELATED)
+
+        assert index.add("c", EDITED) is None
+        index.forget(["a"])
+        index.save()
+
+        reloaded = DedupIndex.for_table(tmp_path, "docs", max_distance=0)
+        assert set(reloaded.signatures) == {"c", "d"}
+        assert reloaded.add("a2", PARAGRAPH) is None
+
+
+class TestManagerDedup:
+    """Test cases for deduplication during indexing."""
+
+    @staticmethod
+    def create_manager(tmp_path) -> KnowledgeManager:
+        """Create a deduplicating manager with a plugins page in git, a mirror of it and an unrelated page."""
+        knowledge = tmp_path / "knowledge"
+        (knowledge / "git" / "mirror").mkdir(parents=True)
+        (knowledge / "git" / "plugins.md").write_text(PARAGRAPH, encoding="utf-8")
+        (knowledge / "git" / "mirror" / "plugins.md").write_text(EDITED, encoding="utf-8")
+        (knowledge / "git" / "upgrade.md").write_text(UNRELATED, encoding="utf-8")
+        return KnowledgeManager(
+            knowledge_path=knowledge,
+            vector_db_path=tmp_path / "lancedb",
+            embedder=CachedEmbedder(embedder=HashingEmbedder()),
+            parse_workers=1,
+            dedup=True,
+        )
+
+    @staticmethod
+    def rows(manager: KnowledgeManager) -> dict[str, dict]:
+        """Return the stored rows keyed by the path column, with their payload meta_data."""
+        table = manager.get_vector_db().table.to_arrow()
+        return {
+            path: json.loads(payload)["meta_data"]
+            for path, payload in zip(table.column("path").to_pylist(), table.column("payload").to_pylist(), strict=True)
+        }
+
+    @pytest.mark.asyncio
+    async def test_canonical_row_references_copies(self, tmp_path):
+        """Test that copies are not stored and the canonical row lists the files containing them."""
+        manager = self.create_manager(tmp_path)
+
+        result = await manager.reindex()
+
+        assert result.chunks_indexed == 3
+        assert result.chunks_deduplicated == 1
+        rows = self.rows(manager)
+        assert len(rows) == 2
+        canonical = next(path for path, meta_data in rows.items() if meta_data.get("references"))
+        copy = "git/mirror/plugins.md" if canonical == "git/plugins.md" else "git/plugins.md"
+        assert rows[canonical]["references"] == [{"source": "git", "path": copy}]
+
+        (manager.knowledge_path / copy).unlink()
+        result = await manager.reindex()
+
+        assert result.chunks_deleted == 0
+        assert {path: meta_data.get("references") for path, meta_data in self.rows(manager).items()} == {
+            canonical: None,
+            "git/upgrade.md": None,
+        }
+
+    @pytest.mark.asyncio
+    async def test_copies_of_other_sources_are_kept(self, tmp_path):
+        """Test that a copy in another source gets its own row, so source filters find it."""
+        manager = self.create_manager(tmp_path)
+        (manager.knowledge_path / "web").mkdir()
+        (manager.knowledge_path / "web" / "plugins.md").write_text("# " + EDITED, encoding="utf-8")
+
+        result = await manager.reindex()
+
+        assert result.chunks_deduplicated == 1
+        rows = self.rows(manager)
+        assert rows["web/plugins.md"]["source"] == "web"
+        assert "references" not in rows["web/plugins.md"]
+
+    @pytest.mark.asyncio
+    async def test_row_moves_to_remaining_copy(self, tmp_path):
+        """Test that a row whose own file changed is handed over to the file still containing the chunk."""
+        manager = self.create_manager(tmp_path)
+        await manager.reindex()
+        canonical = next(path for path, meta_data in self.rows(manager).items() if meta_data.get("references"))
+        copy = "git/mirror/plugins.md" if canonical == "git/plugins.md" else "git/plugins.md"
+
+        (manager.knowledge_path / canonical).write_text("Plugins moved to the extensions page.", encoding="utf-8")
+        result = await manager.reindex()
+
+        assert result.chunks_deleted == 0
+        rows = self.rows(manager)
+        assert rows[copy]["path"] == copy
+        assert "references" not in rows[copy]
+        assert canonical in rows
@@ -0,0 +1,66 @@
+"""
+Unit tests for the knowledge embedding backends.
+
+This module tests backend selection and batched local embedding with a stub model.
+"""
+
+import numpy as np
+import pytest
+from agno.embedder.google import GeminiEmbedder
+
+from sidekick.knowledge.batching import embed_texts
+from sidekick.knowledge.embedders import HashingEmbedder, LocalEmbedder, create_embedder
+from sidekick.settings import settings
+
+
+class StubModel:
+    """SentenceTransformer stand-in recording encode calls."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts, batch_size, convert_to_numpy, normalize_embeddings, show_progress_bar):
+        self.calls.append(list(texts))
+        return np.array([[len(text), 1.0, 0.0] for text in texts], dtype=np.float64)
+
+
+class TestCreateEmbedder:
+    """Test cases for create_embedder."""
+
+    def test_backend_from_settings(self, monkeypatch):
+        """Test that the configured backend, model and dimensions are used."""
+        monkeypatch.setattr(settings.knowledge, "embedder", "hashing")
+        monkeypatch.setattr(settings.knowledge, "embedding_dimensions", 32)
+
+        embedder = create_embedder()
+
+        assert isinstance(embedder, HashingEmbedder)
+        assert embedder.dimensions == 32
+
+    def test_gemini_default_model(self, monkeypatch):
+        """Test that callers keep their Gemini model unless one is configured."""
+        monkeypatch.setattr(settings.knowledge, "embedder", "gemini")
+        monkeypatch.setattr(settings.knowledge, "embedding_model", None)
+
+        embedder = create_embedder(gemini_model="gemini-embedding-001")
+
+        assert isinstance(embedder, GeminiEmbedder)
+        assert embedder.id == "gemini-embedding-001"
+        with pytest.raises(ValueError, match="Unknown embedder backend"):
+            create_embedder(backend="other")
+
+
+class TestLocalEmbedder:
+    """Test cases for LocalEmbedder."""
+
+    def test_batch_is_encoded_in_one_call(self):
+        """Test that embed_texts hands the whole batch to the model as float32 vectors."""
+        embedder = LocalEmbedder()
+        embedder._model = StubModel()
+
+        results = embed_texts(embedder, ["a", "bbb"])
+
+        assert embedder.dimensions == 384
+        assert embedder._model.calls == [["a", "bbb"]]
+        assert [embedding for embedding, _ in results] == [[1.0, 1.0, 0.0], [3.0, 1.0, 0.0]]
+        assert embedder.get_embedding("cc") == [2.0, 1.0, 0.0]
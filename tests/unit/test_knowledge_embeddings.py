@@ -0,0 +1,103 @@
+"""
+Unit tests for knowledge embedding helpers.
+
+This module tests the persistent chunk and query embedding caches with a stub embedder.
+"""
+
+from dataclasses import dataclass
+
+from agno.embedder.base import Embedder
+
+from sidekick.knowledge.embeddings import CachedEmbedder, EmbeddingCache, QueryEmbeddingCache, create_cached_embedder
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    """Deterministic stub embedder that counts calls."""
+
+    id: str = "stub"
+    dimensions: int = 4
+    calls: int = 0
+
+    def get_embedding(self, text: str) -> list[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> tuple[list[float], dict | None]:
+        self.calls += 1
+        return [float(len(text)), 1.0, 2.0, 3.0], {"calls": self.calls}
+
+
+class TestCachedEmbedder:
+    """Test cases for CachedEmbedder."""
+
+    def test_repeated_text_is_served_from_cache(self, tmp_path):
+        """Test that identical texts are embedded once."""
+        stub = CountingEmbedder()
+        embedder = create_cached_embedder(stub, tmp_path, QueryEmbeddingCache(tmp_path / "queries.sqlite"))
+
+        first, usage = embedder.get_embedding_and_usage("hello")
+        second, cached_usage = embedder.get_embedding_and_usage("hello")
+
+        assert first == second == [5.0, 1.0, 2.0, 3.0]
+        assert usage == {"calls": 1}
+        assert cached_usage is None
+        assert stub.calls == 1
+        assert embedder.dimensions == 4
+
+    def test_cache_persists_across_instances(self, tmp_path):
+        """Test that the cache is shared through the on-disk database."""
+        query_cache_path = tmp_path / "queries.sqlite"
+        create_cached_embedder(CountingEmbedder(), tmp_path, QueryEmbeddingCache(query_cache_path)).get_embedding(
+            "persisted"
+        )
+
+        stub = CountingEmbedder()
+        create_cached_embedder(stub, tmp_path, QueryEmbeddingCache(query_cache_path)).get_embedding("persisted")
+
+        assert stub.calls == 0
+
+    def test_cache_key_includes_model_and_dimensions(self, tmp_path):
+        """Test that different embedders do not share cache entries."""
+        cache = EmbeddingCache(tmp_path / "cache.sqlite")
+        CachedEmbedder(embedder=CountingEmbedder(), cache=cache).get_embedding("text")
+
+        other = CountingEmbedder(id="other")
+        CachedEmbedder(embedder=other, cache=cache).get_embedding("text")
+        smaller = CountingEmbedder(dimensions=2)
+        CachedEmbedder(embedder=smaller, cache=cache).get_embedding("text")
+
+        assert other.calls == 1
+        assert smaller.calls == 1
+        assert cache.misses == 3
+
+
+class TestQueryEmbeddingCache:
+    """Test cases for QueryEmbeddingCache."""
+
+    def test_queries_use_query_cache(self, tmp_path):
+        """Test that query embeddings go to the query cache and chunks to the chunk cache."""
+        cache = EmbeddingCache(tmp_path / "chunks.sqlite")
+        query_cache = QueryEmbeddingCache(tmp_path / "queries.sqlite")
+        embedder = CachedEmbedder(embedder=CountingEmbedder(), cache=cache, query_cache=query_cache)
+
+        embedder.get_embedding("query")
+        embedder.get_embedding("query")
+        embedder.get_embedding_and_usage("chunk")
+
+        assert query_cache.hits == 1
+        assert query_cache.misses == 1
+        assert cache.get("stub", 4, "query") is None
+        assert cache.get("stub", 4, "chunk") is not None
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        """Test that the cache is bounded and keeps recently used queries."""
+        cache = QueryEmbeddingCache(tmp_path / "queries.sqlite", max_entries=2)
+        cache.put("stub", 4, "a", [1.0])
+        cache.put("stub", 4, "b", [2.0])
+        assert cache.get("stub", 4, "a") == [1.0]
+
+        cache.put("stub", 4, "c", [3.0])
+
+        assert cache.get("stub", 4, "b") is None
+        assert cache.get("stub", 4, "a") == [1.0]
+        assert cache.get("stub", 4, "c") == [3.0]
@@ -0,0 +1,145 @@
+"""
+Unit tests for knowledge fingerprint tracking.
+
+This module tests change detection used by incremental reindexing.
+"""
+
+import os
+
+import pytest
+
+from sidekick.knowledge import parsing
+from sidekick.knowledge.embedders import HashingEmbedder
+from sidekick.knowledge.embeddings import CachedEmbedder
+from sidekick.knowledge.fingerprints import FingerprintStore, hash_file
+from sidekick.knowledge.manager import KnowledgeManager
+
+
+class TestFingerprintStore:
+    """Test cases for FingerprintStore."""
+
+    def test_new_files_are_added(self, tmp_path):
+        """Test that files without a fingerprint are reported as added."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("hello")
+        store = FingerprintStore(tmp_path / "store.json")
+
+        changes = store.diff([doc])
+
+        assert changes.added == [doc]
+        assert changes.to_index == [doc]
+        assert changes.has_changes
+
+    def test_unchanged_and_changed_files(self, tmp_path):
+        """Test that content changes are detected and rewrites with same content are not."""
+        same = tmp_path / "same.md"
+        edited = tmp_path / "edited.md"
+        same.write_text("same content")
+        edited.write_text("old content")
+
+        store = FingerprintStore(tmp_path / "store.json")
+        store.record(same, ["a"])
+        store.record(edited, ["b"])
+
+        # Rewrite with identical content but a different mtime
+        same.write_text("same content")
+        os.utime(same, (1, 1))
+        edited.write_text("new content!")
+
+        changes = store.diff([same, edited])
+
+        assert changes.unchanged == [same]
+        assert changes.changed == [edited]
+        assert store.fingerprints[str(same)].mtime == 1
+
+    def test_removed_files(self, tmp_path):
+        """Test that fingerprints without a file on disk are reported as removed."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("content")
+        store = FingerprintStore(tmp_path / "store.json")
+        store.record(doc, ["a", "b"])
+
+        changes = store.diff([])
+
+        assert changes.removed == [str(doc)]
+        assert store.forget(str(doc)).chunk_ids == ["a", "b"]
+        assert store.referenced_chunk_ids() == set()
+
+    def test_save_and_load(self, tmp_path):
+        """Test that fingerprints survive a save/load round trip."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("content")
+        store = FingerprintStore.for_table(tmp_path, "docs")
+        store.record(doc, ["a"])
+        store.save()
+
+        loaded = FingerprintStore.for_table(tmp_path, "docs")
+
+        assert loaded.fingerprints[str(doc)].content_hash == hash_file(doc)
+        assert loaded.referenced_chunk_ids() == {"a"}
+        assert not loaded.diff([doc]).has_changes
+
+
+class TestIncrementalReindex:
+    """Test cases for recording indexed files during incremental reindexing."""
+
+    @pytest.mark.asyncio
+    async def test_unreadable_file_is_retried(self, tmp_path, monkeypatch):
+        """Test that a non-empty file without chunks counts as failed and is indexed on the next run."""
+        knowledge = tmp_path / "knowledge"
+        knowledge.mkdir()
+        (knowledge / "good.md").write_text("Dynamic plugins extend the developer hub. " * 3, encoding="utf-8")
+        broken = knowledge / "broken.md"
+        broken.write_text("The operator upgrade channel decides which release is installed. " * 3, encoding="utf-8")
+        manager = KnowledgeManager(
+            knowledge_path=knowledge,
+            vector_db_path=tmp_path / "lancedb",
+            embedder=CachedEmbedder(embedder=HashingEmbedder()),
+            parse_workers=1,
+        )
+        parse_file = parsing.parse_file
+        monkeypatch.setattr(parsing, "parse_file", lambda path: [] if path == broken else parse_file(path))
+
+        result = await manager.reindex()
+
+        assert result.added == 2
+        assert result.failed == 1
+        assert result.files_indexed == 1
+        assert str(broken) not in manager.get_fingerprint_store().fingerprints
+
+        monkeypatch.setattr(parsing, "parse_file", parse_file)
+        result = await manager.reindex()
+
+        assert result.added == 1
+        assert result.failed == 0
+        assert result.chunks_indexed > 0
+
+    @pytest.mark.asyncio
+    async def test_file_removed_during_reindex_is_skipped(self, tmp_path, monkeypatch):
+        """Test that a file deleted after parsing (e.g. by a concurrent sync) does not abort the run."""
+        knowledge = tmp_path / "knowledge"
+        knowledge.mkdir()
+        (knowledge / "good.md").write_text("Dynamic plugins extend the developer hub. " * 3, encoding="utf-8")
+        removed = knowledge / "removed.md"
+        removed.write_text("The operator upgrade channel decides which release is installed. " * 3, encoding="utf-8")
+        manager = KnowledgeManager(
+            knowledge_path=knowledge,
+            vector_db_path=tmp_path / "lancedb",
+            embedder=CachedEmbedder(embedder=HashingEmbedder()),
+            parse_workers=1,
+        )
+        parse_file = parsing.parse_file
+
+        def parse_and_remove(path):
+            documents = parse_file(path)
+            if path == removed:
+                path.unlink()
+            return documents
+
+        monkeypatch.setattr(parsing, "parse_file", parse_and_remove)
+
+        result = await manager.reindex()
+
+        assert result.failed == 1
+        assert result.files_indexed == 1
+        assert list(manager.get_fingerprint_store().fingerprints) == [str(knowledge / "good.md")]
@@ -0,0 +1,142 @@
+"""
+Unit tests for the Google Drive knowledge source.
+
+This module tests incremental syncing against a fake Drive that serves metadata, exports and changes.
+"""
+
+import threading
+import time
+
+import pytest
+
+from sidekick.knowledge.config import GDriveSourceConfig
+from sidekick.knowledge.gdrive import GDriveSource
+from sidekick.knowledge.manifest import ManifestManager
+from sidekick.utils.gdrive import GoogleDriveExporter, GoogleDriveExporterConfig
+
+ROOT_URL = "https://docs.google.com/document/d/root/edit"
+
+
+class FakeDrive:
+    """In-memory Drive whose root document links to the child, plus six unlinked documents."""
+
+    def __init__(self):
+        self.modified = {"root": "2025-01-01T00:00:00Z", "child": "2025-01-01T00:00:00Z"}
+        self.modified.update({f"doc{i}": "2025-01-01T00:00:00Z" for i in range(6)})
+        self.changed: set[str] = set()
+        self.exports: list[str] = []
+        self.metadata_requests: list[str] = []
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def get_metadata(self, document_id, doc_type=None):
+        self.metadata_requests.append(document_id)
+        return {
+            "name": document_id,
+            "mimeType": "application/vnd.google-apps.document",
+            "modifiedTime": self.modified[document_id],
+            "version": "1",
+        }
+
+    def export(self, exporter, document_id, format_key, output_path, doc_type=None):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.02)
+        with self.lock:
+            self.running -= 1
+        self.exports.append(f"{document_id}.{format_key}")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        link = '<a href="https://docs.google.com/document/d/child/edit">child</a>' if document_id == "root" else ""
+        output_path.write_text(f"<p>{document_id} {self.modified[document_id]}</p>{link}")
+        if exporter.download_callback is not None:
+            exporter.download_callback(document_id, format_key, output_path, True)
+        return True
+
+    def list_changed_ids(self, page_token):
+        changed, self.changed = self.changed, set()
+        return changed, f"{page_token}+"
+
+
+@pytest.fixture
+def drive(monkeypatch):
+    """Replace the Drive API calls of the exporter with a FakeDrive."""
+    fake = FakeDrive()
+    monkeypatch.setattr(GoogleDriveExporter, "get_document_metadata", lambda self, *args: fake.get_metadata(*args))
+    monkeypatch.setattr(GoogleDriveExporter, "_export_single_format", lambda self, *args: fake.export(self, *args))
+    monkeypatch.setattr(GoogleDriveExporter, "get_start_page_token", lambda self: "token")
+    monkeypatch.setattr(GoogleDriveExporter, "list_changed_ids", lambda self, token: fake.list_changed_ids(token))
+    return fake
+
+
+def sync(tmp_path, use_changes_api=False):
+    """Sync a source with the root document at depth 1 and store the manifest like `knowledge sync`."""
+    documents = [{"url": ROOT_URL, "depth": 1}]
+    config = GDriveSourceConfig(name="drive", documents=documents, use_changes_api=use_changes_api)
+    manifests = ManifestManager(tmp_path)
+    previous = manifests.get_manifest("drive")
+    result = GDriveSource(config, tmp_path).sync(manifest=previous.model_dump() if previous else None)
+    manifests.sync_and_cleanup("drive", result.current_files, result.resources, result.cursor)
+    return result
+
+
+class TestGDriveIncrementalSync:
+    """Test cases for incremental Google Drive syncing."""
+
+    def test_unchanged_documents_are_not_exported(self, tmp_path, drive):
+        """Test that only documents with a new modifiedTime are exported again, following recorded links."""
+        first = sync(tmp_path)
+        assert sorted(drive.exports) == ["child.md", "root.html", "root.md"]
+        assert first.resources["root"].links == ["child"]
+
+        drive.exports.clear()
+        drive.modified["child"] = "2025-02-01T00:00:00Z"
+        second = sync(tmp_path)
+
+        assert drive.exports == ["child.md"]
+        assert second.files_downloaded == [tmp_path / "drive" / "child.md"]
+        assert sorted(path.name for path in second.files_unchanged) == ["root.html", "root.md"]
+        assert (tmp_path / "drive" / "root.md").exists()
+
+    def test_changes_api_skips_metadata_requests(self, tmp_path, drive):
+        """Test that with a page token only documents reported as changed are checked."""
+        first = sync(tmp_path, use_changes_api=True)
+        assert first.cursor == "token"
+
+        drive.exports.clear()
+        drive.metadata_requests.clear()
+        drive.modified["root"] = "2025-02-01T00:00:00Z"
+        drive.changed = {"root"}
+        second = sync(tmp_path, use_changes_api=True)
+
+        assert drive.metadata_requests == ["root"]
+        assert sorted(drive.exports) == ["root.html", "root.md"]
+        assert second.cursor == "token+"
+        assert [path.name for path in second.files_unchanged] == ["child.md"]
+
+
+class TestConcurrentExport:
+    """Test cases for exporting documents with a pool of threads."""
+
+    def test_exports_are_bounded_and_deduplicated(self, tmp_path, drive):
+        """Test that at most max_workers exports overlap and a document reached twice is exported once."""
+        exporter = GoogleDriveExporter(
+            GoogleDriveExporterConfig(target_directory=tmp_path, export_format="md", max_workers=2)
+        )
+
+        results = exporter.export_documents([(f"doc{i}", 0) for i in range(6)] + [("child", 0), ("root", 1)])
+
+        assert drive.peak == 2
+        assert sorted(drive.exports) == sorted([f"doc{i}.md" for i in range(6)] + ["child.md", "root.html", "root.md"])
+        assert set(results) == {f"doc{i}" for i in range(6)} | {"child", "root"}
+        assert exporter.errors == []
+
+    def test_deepest_link_path_wins(self, tmp_path, drive):
+        """Test that a document reached with several link budgets follows its links as deep as the largest."""
+        exporter = GoogleDriveExporter(GoogleDriveExporterConfig(target_directory=tmp_path, export_format="md"))
+
+        exporter.export_documents([("root", 0), (ROOT_URL, 1)])
+
+        assert sorted(drive.exports) == ["child.md", "root.html", "root.md"]
+        assert exporter.documents["root"].links == ["child"]
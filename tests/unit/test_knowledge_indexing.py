@@ -0,0 +1,153 @@
+"""
+Unit tests for knowledge index management.
+
+This module tests vector and full-text index creation, metadata columns and
+filter pushdown on small LanceDB tables.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+
+from agno.document.base import Document
+from agno.embedder.base import Embedder
+from agno.vectordb.lancedb import LanceDb
+from agno.vectordb.search import SearchType
+
+from sidekick.knowledge.indexing import build_prefilter, create_indexed_lancedb, ensure_indexes
+
+
+@dataclass
+class HashEmbedder(Embedder):
+    """Deterministic stub embedder deriving vectors from a text hash."""
+
+    id: str = "hash"
+    dimensions: int = 8
+
+    def get_embedding(self, text: str) -> list[float]:
+        digest = hashlib.sha256(text.encode()).digest()
+        return [byte / 255 for byte in digest[: self.dimensions]]
+
+    def get_embedding_and_usage(self, text: str) -> tuple[list[float], dict | None]:
+        return self.get_embedding(text), None
+
+
+def _create_vector_db(tmp_path, rows: int):
+    vector_db = create_indexed_lancedb(
+        uri=str(tmp_path), table_name="docs", embedder=HashEmbedder(), search_type=SearchType.hybrid
+    )
+    vector_db.create()
+    vector_db.insert([Document(name=f"doc{i}", content=f"document number {i}") for i in range(rows)])
+    return vector_db
+
+
+class TestEnsureIndexes:
+    """Test cases for ensure_indexes."""
+
+    def test_small_table_gets_only_full_text_index(self, tmp_path):
+        """Test that the vector index waits for the row threshold."""
+        vector_db = _create_vector_db(tmp_path, 20)
+
+        result = ensure_indexes(vector_db, min_rows=1000)
+
+        assert result.rows == 20
+        assert result.vector_index == "none"
+        assert result.fts_index == "created"
+        assert vector_db.fts_index_exists
+        assert not vector_db.vector_index_exists
+
+    def test_vector_index_is_built_and_reused(self, tmp_path):
+        """Test that indexes are created once and found again by a new instance."""
+        vector_db = _create_vector_db(tmp_path, 300)
+
+        created = ensure_indexes(vector_db, min_rows=100)
+        unchanged = ensure_indexes(vector_db, min_rows=100, changed=False)
+        reopened = create_indexed_lancedb(uri=str(tmp_path), table_name="docs", embedder=HashEmbedder())
+
+        assert (created.vector_index, created.fts_index) == ("created", "created")
+        assert (unchanged.vector_index, unchanged.fts_index) == ("none", "none")
+        assert vector_db.vector_index_exists
+        assert reopened.fts_index_exists
+        assert reopened.vector_index_exists
+        assert len(reopened.search("document number 7", limit=3)) == 3
+
+
+class TestBuildPrefilter:
+    """Test cases for build_prefilter."""
+
+    def test_column_filters_become_sql(self):
+        """Test translation of column filters and pass-through of metadata filters."""
+        where, remaining = build_prefilter(
+            {
+                "source": "o'neil",
+                "file_type": ["md", "pdf"],
+                "path": "*release*",
+                "version": "1.5",
+                "synced_after": "2025-01-31",
+                "chunk": 2,
+            }
+        )
+
+        assert where == (
+            "source = 'o''neil' AND file_type IN ('md', 'pdf') AND path LIKE '%release%' ESCAPE '\\' "
+            "AND array_has_any(versions, ['1.5']) AND synced_at >= '2025-01-31'"
+        )
+        assert remaining == {"chunk": 2}
+        assert build_prefilter(None) == (None, None)
+
+
+class TestMetadataColumns:
+    """Test cases for metadata columns and filter pushdown."""
+
+    def test_filtered_search_uses_metadata_columns(self, tmp_path):
+        """Test that filters on metadata columns narrow the search before ranking."""
+        vector_db = create_indexed_lancedb(uri=str(tmp_path), table_name="docs", embedder=HashEmbedder())
+        vector_db.create()
+        vector_db.table.add(
+            [
+                {
+                    "id": str(i),
+                    "vector": HashEmbedder().get_embedding(f"doc {i}"),
+                    "payload": json.dumps({"name": f"doc{i}", "meta_data": {}, "content": f"doc {i}", "usage": None}),
+                    "source": "gdrive" if i % 2 else "web",
+                    "versions": ["1.5"] if i < 4 else ["1.6"],
+                }
+                for i in range(8)
+            ]
+        )
+
+        documents = vector_db.search("doc", limit=8, filters={"source": "gdrive", "version": "1.6"})
+
+        assert sorted(doc.name for doc in documents) == ["doc5", "doc7"]
+
+    def test_wildcard_filters_match_underscores_literally(self, tmp_path):
+        """Test that "_" and "%" in wildcard filters only match themselves."""
+        vector_db = create_indexed_lancedb(uri=str(tmp_path), table_name="docs", embedder=HashEmbedder())
+        vector_db.create()
+        vector_db.table.add(
+            [
+                {
+                    "id": path,
+                    "vector": HashEmbedder().get_embedding(path),
+                    "payload": json.dumps({"name": path, "meta_data": {}, "content": path, "usage": None}),
+                    "path": path,
+                }
+                for path in ("web/release_notes.md", "web/release-notes.md", "web/100%.md", "web/100x.md")
+            ]
+        )
+
+        assert [doc.name for doc in vector_db.search("notes", filters={"path": "*release_*"})] == [
+            "web/release_notes.md"
+        ]
+        assert [doc.name for doc in vector_db.search("100", filters={"path": "web/100%*"})] == ["web/100%.md"]
+
+    def test_existing_table_is_migrated(self, tmp_path):
+        """Test that tables without metadata columns get them when opened."""
+        legacy = LanceDb(uri=str(tmp_path), table_name="docs", embedder=HashEmbedder())
+        legacy.create()
+        legacy.insert([Document(name="doc", content="legacy document")])
+
+        vector_db = create_indexed_lancedb(uri=str(tmp_path), table_name="docs", embedder=HashEmbedder())
+
+        assert {"source", "versions", "synced_at"} <= set(vector_db.table.schema.names)
+        assert [doc.name for doc in vector_db.search("legacy")] == ["doc"]
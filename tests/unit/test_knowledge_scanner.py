@@ -0,0 +1,66 @@
+"""
+Unit tests for knowledge document discovery.
+
+This module tests the cached single-pass document scanner.
+"""
+
+import os
+
+from sidekick.knowledge.scanner import DocumentScanner
+
+
+class TestDocumentScanner:
+    """Test cases for DocumentScanner."""
+
+    def test_scan_groups_by_extension_and_skips_small_files(self, tmp_path):
+        """Test that documents are grouped by extension and tiny files are skipped."""
+        docs = tmp_path / "docs"
+        (docs / "nested").mkdir(parents=True)
+        (docs / "a.md").write_text("x" * 100)
+        (docs / "nested" / "b.pdf").write_bytes(b"x" * 100)
+        (docs / "nested" / "c.csv").write_text("x" * 100)
+        (docs / "empty.md").write_text("")
+        (docs / "notes.txt").write_text("x" * 100)
+
+        found = DocumentScanner(docs).scan()
+
+        assert found[".md"] == [docs / "a.md"]
+        assert found[".pdf"] == [docs / "nested" / "b.pdf"]
+        assert found[".csv"] == [docs / "nested" / "c.csv"]
+
+    def test_cached_listing_is_reused_until_directory_changes(self, tmp_path):
+        """Test that unchanged directories are served from the cache."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("x" * 100)
+        cache_path = tmp_path / "scan.json"
+
+        assert DocumentScanner(docs, cache_path=cache_path).scan()[".md"] == [docs / "a.md"]
+        assert cache_path.exists()
+
+        # Shrinking a file does not change the directory mtime, so the cached size is used
+        mtime = os.stat(docs).st_mtime
+        (docs / "a.md").write_text("x" * 10)
+        os.utime(docs, (mtime, mtime))
+        assert DocumentScanner(docs, cache_path=cache_path).scan()[".md"] == [docs / "a.md"]
+
+        # Adding a file changes the directory mtime and forces a new listing
+        (docs / "b.md").write_text("x" * 100)
+        os.utime(docs, (mtime + 10, mtime + 10))
+        assert DocumentScanner(docs, cache_path=cache_path).scan()[".md"] == [docs / "b.md"]
+
+    def test_small_file_is_found_once_it_grows(self, tmp_path):
+        """Test that a file skipped as too small is picked up after growing, without a directory change."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("x" * 10)
+        cache_path = tmp_path / "scan.json"
+
+        assert DocumentScanner(docs, cache_path=cache_path).scan()[".md"] == []
+
+        mtime = os.stat(docs).st_mtime
+        (docs / "a.md").write_text("x" * 100)
+        os.utime(docs, (mtime, mtime))
+
+        assert DocumentScanner(docs, cache_path=cache_path).scan()[".md"] == [docs / "a.md"]
+        assert DocumentScanner(docs, cache_path=cache_path).scan()[".md"] == [docs / "a.md"]
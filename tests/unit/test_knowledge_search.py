@@ -0,0 +1,195 @@
+"""
+Unit tests for the search-only knowledge base.
+
+This module tests lazy document sources, the search result cache and the filtered search tool.
+"""
+
+import time
+
+import pytest
+from agno.document.base import Document
+from agno.knowledge import AgentKnowledge
+from agno.vectordb.search import SearchType
+from loguru import logger
+
+from sidekick.agents.search_agent import SearchAgent
+from sidekick.knowledge.embedders import HashingEmbedder
+from sidekick.knowledge.indexing import create_indexed_lancedb
+from sidekick.knowledge.search import RetrievalCache, SearchKnowledgeBase
+from sidekick.tools.knowledge import FilteredKnowledgeTools
+
+
+class StaticKnowledge(AgentKnowledge):
+    """Knowledge base yielding a fixed list of documents."""
+
+    @property
+    def document_lists(self):
+        yield [Document(content="hello")]
+
+    @property
+    async def async_document_lists(self):
+        yield [Document(content="hello")]
+
+
+class TestSearchKnowledgeBase:
+    """Test cases for SearchKnowledgeBase."""
+
+    def test_sources_are_built_on_first_document_access(self):
+        """Test that the source factory runs once, and only when documents are requested."""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return StaticKnowledge()
+
+        knowledge = SearchKnowledgeBase(source_factory=factory, num_documents=3)
+        assert calls == []
+        assert knowledge.num_documents == 3
+
+        assert [doc.content for docs in knowledge.document_lists for doc in docs] == ["hello"]
+        assert [doc.content for docs in knowledge.document_lists for doc in docs] == ["hello"]
+        assert calls == [1]
+
+    @pytest.mark.asyncio
+    async def test_async_document_lists(self):
+        """Test that async loading iterates the underlying sources."""
+        knowledge = SearchKnowledgeBase(source_factory=StaticKnowledge)
+
+        documents = [doc async for docs in knowledge.async_document_lists for doc in docs]
+
+        assert [doc.content for doc in documents] == ["hello"]
+
+    def test_without_factory_has_no_documents(self):
+        """Test that a knowledge base without sources yields nothing."""
+        assert list(SearchKnowledgeBase().document_lists) == []
+
+    def test_write_through_other_connection_invalidates_cache(self, tmp_path):
+        """Test that rows added through another connection (e.g. a reindex process) cause a cache miss."""
+
+        def open_vector_db():
+            return create_indexed_lancedb(
+                uri=str(tmp_path), table_name="docs", embedder=HashingEmbedder(), search_type=SearchType.vector
+            )
+
+        writer = open_vector_db()
+        writer.create()
+        writer.insert([Document(name="a", content="install the operator")])
+        knowledge = SearchKnowledgeBase(vector_db=open_vector_db(), num_documents=5)
+
+        assert len(knowledge.search("install the operator")) == 1
+        assert len(knowledge.search("install the operator")) == 1
+        assert (knowledge.cache.stats.hits, knowledge.cache.stats.misses) == (1, 1)
+
+        writer.insert([Document(name="b", content="install the operator with helm")])
+
+        assert len(knowledge.search("install the operator")) == 2
+        assert knowledge.cache.stats.misses == 2
+
+
+class TestCacheReporting:
+    """Test cases for reporting the search cache counters."""
+
+    @pytest.mark.asyncio
+    async def test_counters_are_reported_after_miss_and_hit(self, tmp_path):
+        """Test that the search tool updates the counters and the search session logs them."""
+        vector_db = create_indexed_lancedb(
+            uri=str(tmp_path), table_name="docs", embedder=HashingEmbedder(), search_type=SearchType.vector
+        )
+        vector_db.create()
+        vector_db.insert([Document(name="a", content="install the operator")])
+        knowledge = SearchKnowledgeBase(vector_db=vector_db, num_documents=5)
+        tools = FilteredKnowledgeTools(knowledge=knowledge)
+        stats = knowledge.cache.stats
+
+        tools.search(None, "install the operator")
+        assert (stats.hits, stats.misses, stats.saved_seconds) == (0, 1, 0.0)
+
+        tools.search(None, "Install the operator")
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.saved_seconds > 0
+
+        agent = SearchAgent(knowledge_path=tmp_path, storage_path=tmp_path / "search.db")
+        agent._knowledge = knowledge
+        messages: list[str] = []
+        handler = logger.add(messages.append, level="INFO", format="{message}")
+        try:
+            await agent.cleanup()
+        finally:
+            logger.remove(handler)
+
+        assert any(
+            message.startswith("Knowledge search cache: 1 hits, 1 misses (50% hit rate)") for message in messages
+        )
+
+
+class TestRetrievalCache:
+    """Test cases for RetrievalCache."""
+
+    def test_hit_for_normalized_query(self):
+        """Test that queries differing in case and whitespace share an entry."""
+        cache = RetrievalCache()
+        cache.put(RetrievalCache.make_key("Install  RHDH", "hybrid", 5, None), 1, [Document(content="a")], 0.5)
+
+        cached = cache.get(RetrievalCache.make_key("install rhdh ", "hybrid", 5, None), 1)
+
+        assert [doc.content for doc in cached] == ["a"]
+        assert cache.stats.hits == 1
+        assert cache.stats.saved_seconds == 0.5
+        assert cache.get(RetrievalCache.make_key("install rhdh", "hybrid", 10, None), 1) is None
+        assert cache.stats.misses == 1
+
+    def test_table_version_change_invalidates(self):
+        """Test that results cached for an older table version are not returned."""
+        cache = RetrievalCache()
+        key = RetrievalCache.make_key("query", "vector", 5, None)
+        cache.put(key, 1, [Document(content="old")], 0.1)
+
+        assert cache.get(key, 2) is None
+        assert cache.stats.entries == 0
+
+    def test_expired_and_evicted_entries(self):
+        """Test TTL expiry and least-recently-used eviction."""
+        expired = RetrievalCache(ttl_seconds=0.0001)
+        key = RetrievalCache.make_key("query", "vector", 5, None)
+        expired.put(key, 1, [Document(content="a")], 0.1)
+        time.sleep(0.01)
+        assert expired.get(key, 1) is None
+
+        cache = RetrievalCache(max_entries=2)
+        keys = [RetrievalCache.make_key(f"query {i}", "vector", 5, None) for i in range(3)]
+        cache.put(keys[0], 1, [Document(content="0")], 0.1)
+        cache.put(keys[1], 1, [Document(content="1")], 0.1)
+        cache.get(keys[0], 1)
+        cache.put(keys[2], 1, [Document(content="2")], 0.1)
+
+        assert cache.get(keys[1], 1) is None
+        assert cache.get(keys[0], 1) is not None
+        assert cache.get(keys[2], 1) is not None
+
+
+class RecordingKnowledge(AgentKnowledge):
+    """Knowledge base recording the filters of each search."""
+
+    calls: list[dict | None] = []
+
+    def search(self, query, num_documents=None, filters=None):
+        self.calls.append(filters)
+        return [Document(content="hit")]
+
+
+class TestFilteredKnowledgeTools:
+    """Test cases for FilteredKnowledgeTools."""
+
+    def test_search_filters_are_merged_with_defaults(self):
+        """Test that tool arguments override and extend the default filters."""
+        knowledge = RecordingKnowledge()
+        tools = FilteredKnowledgeTools(knowledge=knowledge, default_filters={"source": "gdrive", "file_type": "md"})
+
+        result = tools.search(None, "release plan", source="web", version="1.5")
+
+        assert "hit" in result
+        assert knowledge.calls == [{"source": "web", "file_type": "md", "version": "1.5"}]
+        function = tools.functions["search"]
+        function.process_entrypoint()
+        assert function.parameters["required"] == ["query"]
+        assert "version" in function.parameters["properties"]
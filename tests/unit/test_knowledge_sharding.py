@@ -0,0 +1,93 @@
+"""
+Unit tests for the per-source sharded knowledge base.
+
+This module tests shard layout, per-shard reindexing and fan-out search with the hashing embedder.
+"""
+
+import pytest
+
+from sidekick.knowledge.config import GitSourceConfig, KnowledgeConfig, WebSourceConfig
+from sidekick.knowledge.embedders import HashingEmbedder
+from sidekick.knowledge.embeddings import CachedEmbedder
+from sidekick.knowledge.sharding import ShardedKnowledgeManager
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text * 5, encoding="utf-8")
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Sharded manager over a core directory and two synced sources."""
+    knowledge = tmp_path / "knowledge"
+    _write(knowledge / "core.md", "Core installation guide for the developer hub. ")
+    _write(knowledge / "external" / "docs" / "plugins.md", "Dynamic plugins are configured in the app config. ")
+    _write(knowledge / "external" / "blog" / "release.md", "Release notes announce the operator upgrade. ")
+    config = KnowledgeConfig(
+        sources=[
+            GitSourceConfig(name="docs", url="https://example.com/docs.git"),
+            WebSourceConfig(name="blog", urls=["https://example.com"]),
+        ]
+    )
+    return ShardedKnowledgeManager(
+        knowledge_path=knowledge,
+        vector_db_path=tmp_path / "lancedb",
+        sources_config=config,
+        embedder=CachedEmbedder(embedder=HashingEmbedder()),
+        parse_workers=1,
+    )
+
+
+class TestShardedKnowledgeManager:
+    """Test cases for ShardedKnowledgeManager."""
+
+    @pytest.mark.asyncio
+    async def test_reindex_only_touches_selected_shard(self, manager):
+        """Test that each source has its own table and reindexing one leaves the others alone."""
+        assert {name: shard.table_name for name, shard in manager.shards.items()} == {
+            "core": "rhdh_docs",
+            "docs": "rhdh_docs_docs",
+            "blog": "rhdh_docs_blog",
+        }
+        results = await manager.reindex()
+        assert {name: result.added for name, result in results.items()} == {"core": 1, "docs": 1, "blog": 1}
+        versions = {name: shard.get_vector_db().table.version for name, shard in manager.shards.items()}
+
+        results = await manager.reindex(full=True, sources=["docs"])
+
+        assert list(results) == ["docs"]
+        assert manager.shards["core"].get_vector_db().table.version == versions["core"]
+        assert manager.shards["blog"].get_vector_db().table.version == versions["blog"]
+        with pytest.raises(ValueError, match="Unknown knowledge shard"):
+            await manager.reindex(sources=["missing"])
+
+    @pytest.mark.asyncio
+    async def test_fan_out_search_merges_by_score(self, manager):
+        """Test that searches cover all shards, rank by score and can be routed by source."""
+        await manager.reindex()
+        knowledge = await manager.aload_knowledge()
+
+        documents = await knowledge.async_search("dynamic plugins app config", num_documents=3)
+        routed = knowledge.search("dynamic plugins", num_documents=3, filters={"source": "blog"})
+
+        assert documents[0].name == "plugins"
+        assert {doc.name for doc in documents} == {"plugins", "core", "release"}
+        scores = [doc.reranking_score for doc in documents]
+        assert scores == sorted(scores, reverse=True)
+        assert [doc.name for doc in routed] == ["release"]
+        assert routed[0].meta_data["source"] == "blog"
+        assert routed[0].meta_data["path"] == "release.md"
+
+    @pytest.mark.parametrize(
+        ("names", "message"),
+        [(["core"], "reserved for the core"), (["a-b", "a_b"], "would share the table 'rhdh_docs_a_b'")],
+    )
+    def test_conflicting_source_names_are_rejected(self, tmp_path, names, message):
+        """Test that sources cannot replace the core shard or share a table with another source."""
+        config = KnowledgeConfig(
+            sources=[GitSourceConfig(name=name, url=f"https://example.com/{name}.git") for name in names]
+        )
+
+        with pytest.raises(ValueError, match=message):
+            ShardedKnowledgeManager(knowledge_path=tmp_path, vector_db_path=tmp_path / "lancedb", sources_config=config)
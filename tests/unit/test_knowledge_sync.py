@@ -0,0 +1,94 @@
+"""
+Unit tests for concurrent knowledge source syncing.
+
+This module tests per-type concurrency limits, status reporting and manifest cleanup with fake sources.
+"""
+
+import threading
+import time
+
+import pytest
+
+from sidekick.knowledge.base import DownloadResult, KnowledgeSource
+from sidekick.knowledge.config import GDriveSourceConfig, GitSourceConfig, WebSourceConfig
+from sidekick.knowledge.sync import SourceSyncer
+
+
+class FakeSource(KnowledgeSource):
+    """Source that writes one file per sync and records how many syncs overlap."""
+
+    lock = threading.Lock()
+    running: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    def download(self, **kwargs) -> DownloadResult:
+        return self.sync()
+
+    def sync(self, manifest=None, resume=False) -> DownloadResult:
+        source_type = self.config.type
+        with self.lock:
+            self.running[source_type] = self.running.get(source_type, 0) + 1
+            self.peak[source_type] = max(self.peak.get(source_type, 0), self.running[source_type])
+        time.sleep(0.05)
+        with self.lock:
+            self.running[source_type] -= 1
+
+        if self.config.name == "broken":
+            return DownloadResult(source_name=self.config.name, errors=["unreachable"], success=False)
+        self.ensure_output_dir()
+        file_path = self.output_dir / ("second.md" if manifest else "first.md")
+        file_path.write_text("content")
+        return DownloadResult(source_name=self.config.name, files_downloaded=[file_path])
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_source():
+    """Reset the overlap counters of FakeSource."""
+    FakeSource.running.clear()
+    FakeSource.peak.clear()
+
+
+class TestSourceSyncer:
+    """Test cases for SourceSyncer."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_limited_per_type(self, tmp_path):
+        """Test that sources of different types overlap while each type stays within its limit."""
+        sources = [
+            GitSourceConfig(name="git1", url="https://example.com/1.git"),
+            GitSourceConfig(name="git2", url="https://example.com/2.git"),
+            GitSourceConfig(name="git3", url="https://example.com/3.git"),
+            WebSourceConfig(name="web1", urls=["https://example.com"]),
+            WebSourceConfig(name="web2", urls=["https://example.org"]),
+        ]
+        updates = []
+        syncer = SourceSyncer(
+            tmp_path,
+            limits={"git": 2, "web": 1},
+            source_factory=FakeSource,
+            on_update=lambda status: updates.append((status.name, status.state)),
+        )
+
+        summary = await syncer.sync(sources)
+
+        assert FakeSource.peak == {"git": 2, "web": 1}
+        assert [status.name for status in summary.sources] == ["git1", "git2", "git3", "web1", "web2"]
+        assert all(status.state == "done" for status in summary.sources)
+        assert summary.files_downloaded == 5
+        assert ("web2", "queued") in updates
+        assert updates.index(("web2", "running")) > updates.index(("web1", "done"))
+
+    @pytest.mark.asyncio
+    async def test_failures_and_cleanup(self, tmp_path):
+        """Test that a failing source does not stop the others and stale files are removed."""
+        sources = [GitSourceConfig(name="docs", url="https://example.com/docs.git"), GDriveSourceConfig(name="broken")]
+        syncer = SourceSyncer(tmp_path, limits={}, source_factory=FakeSource)
+
+        await syncer.sync(sources)
+        summary = await syncer.sync(sources)
+
+        docs, broken = summary.sources
+        assert (docs.state, docs.files_downloaded, docs.files_removed) == ("done", 1, 1)
+        assert not (tmp_path / "docs" / "first.md").exists()
+        assert broken.state == "failed"
+        assert summary.errors == ["broken: unreachable"]
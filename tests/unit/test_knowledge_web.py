@@ -0,0 +1,305 @@
+"""
+Unit tests for the web knowledge source.
+
+This module tests URL normalization and the breadth-first crawl against a fake crawler serving a small site.
+"""
+
+import fnmatch
+from types import SimpleNamespace
+from urllib.parse import urljoin, urlparse
+
+import httpx
+import pytest
+
+from sidekick.knowledge import web
+from sidekick.knowledge.config import WebSourceConfig
+from sidekick.knowledge.manifest import ManifestManager
+from sidekick.knowledge.patterns import URLPatternSet
+from sidekick.knowledge.web import WebSource, normalize_url
+
+SITE = {
+    "https://docs.example.com/": ["/guide", "/guide#install", "https://DOCS.example.com:443/api", "/missing"],
+    "https://docs.example.com/guide": ["/", "/api", "/guide/plugins"],
+    "https://docs.example.com/api": ["https://blog.example.com/news?b=2&a=1"],
+    "https://docs.example.com/guide/plugins": ["/guide/plugins/advanced"],
+    "https://blog.example.com/news?a=1&b=2": ["/archive"],
+}
+
+
+class FakeCrawler:
+    """Crawler serving SITE, recording every batch handed to arun_many.
+
+    Pages render as their markdown; their ETag is the version of the page.
+    """
+
+    started = 0
+    batches: list[list[str]] = []
+    versions: dict[str, int] = {}
+    markdown: dict[str, str] = {}
+    requests: list[tuple[str, str | None]] = []
+    static: dict[str, str] = {}
+    interrupt_at: str | None = None
+
+    def __init__(self, **kwargs):
+        FakeCrawler.started += 1
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+    async def arun_many(self, urls, config=None, dispatcher=None):
+        if self.interrupt_at in urls:
+            raise KeyboardInterrupt
+        self.batches.append(list(urls))
+        assert dispatcher.semaphore_count == 2
+        results = []
+        for url in urls:
+            if url not in SITE:
+                results.append(SimpleNamespace(url=url, success=False, error_message="404"))
+                continue
+            hrefs = [urljoin(url, href) for href in SITE[url]]
+            links = {"internal": [{"href": href} for href in hrefs], "external": []}
+            headers = {"ETag": f'"{self.versions.get(url, 0)}"'}
+            markdown = self.markdown.get(url, f"Page {url}")
+            results.append(
+                SimpleNamespace(
+                    url=url, success=True, markdown=markdown, html="", links=links, response_headers=headers
+                )
+            )
+        return results
+
+    @classmethod
+    def handle(cls, request: httpx.Request) -> httpx.Response:
+        """Answer a plain HTTP request, honoring If-None-Match."""
+        url = str(request.url)
+        cls.requests.append((url, request.headers.get("if-none-match")))
+        etag = f'"{cls.versions.get(url, 0)}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        if url in cls.static:
+            return httpx.Response(200, headers={"ETag": etag, "Content-Type": "text/html"}, text=cls.static[url])
+        return httpx.Response(200, headers={"ETag": etag}, text=f"<p>{url} {cls.versions.get(url, 0)}</p>")
+
+
+@pytest.fixture
+def crawler(monkeypatch):
+    """Replace crawl4ai's crawler and the HTTP client with a FakeCrawler."""
+    FakeCrawler.started = 0
+    FakeCrawler.batches = []
+    FakeCrawler.versions = {}
+    FakeCrawler.markdown = {}
+    FakeCrawler.requests = []
+    FakeCrawler.static = {}
+    FakeCrawler.interrupt_at = None
+    monkeypatch.setattr(web, "AsyncWebCrawler", FakeCrawler)
+    monkeypatch.setattr(
+        WebSource, "_http_client", lambda self: httpx.AsyncClient(transport=httpx.MockTransport(FakeCrawler.handle))
+    )
+    return FakeCrawler
+
+
+def sync(tmp_path, resume=False, **kwargs):
+    """Sync a web source and store the manifest like `knowledge sync`."""
+    config = WebSourceConfig(name="docs", urls=["https://docs.example.com"], concurrency_per_host=2, **kwargs)
+    manifests = ManifestManager(tmp_path)
+    previous = manifests.get_manifest("docs")
+    result = WebSource(config, tmp_path).sync(manifest=previous.model_dump() if previous else None, resume=resume)
+    manifests.sync_and_cleanup("docs", result.current_files, result.resources, result.cursor)
+    return result
+
+
+class TestNormalizeUrl:
+    """Test cases for normalize_url."""
+
+    def test_equivalent_spellings(self):
+        """Test that case, default ports, fragments and query order do not matter."""
+        assert normalize_url("HTTPS://Docs.Example.com:443/a?b=2&a=1#top") == "https://docs.example.com/a?a=1&b=2"
+        assert normalize_url("http://example.com") == "http://example.com/"
+        assert normalize_url("http://example.com:8080/a/") == "http://example.com:8080/a/"
+
+
+class TestURLPatternSet:
+    """Test cases for URLPatternSet."""
+
+    def test_matches_like_fnmatch(self):
+        """Test that prefix and glob patterns match exactly the URLs fnmatch matches."""
+        patterns = ["https://docs.example.com/guide*", "*/api", "*.pdf", "https://blog.example.com/20[0-9][0-9]/*"]
+        urls = [
+            *SITE,
+            "https://docs.example.com/guide/a.pdf",
+            "https://blog.example.com/2024/post",
+            "https://x.org/API",
+        ]
+
+        pattern_set = URLPatternSet(patterns)
+
+        assert pattern_set.prefixes == ("https://docs.example.com/guide",)
+        for url in urls:
+            assert pattern_set.matches(url) == any(fnmatch.fnmatchcase(url, pattern) for pattern in patterns), url
+        assert not URLPatternSet().matches("https://docs.example.com/")
+
+
+class TestWebCrawl:
+    """Test cases for the breadth-first crawl."""
+
+    def test_each_page_is_fetched_once_up_to_depth(self, tmp_path, crawler):
+        """Test that pages linked from several pages are fetched once and deeper pages are not crawled."""
+        result = sync(tmp_path, depth=2)
+
+        fetched = [url for batch in crawler.batches for url in batch]
+        assert sorted(fetched) == [
+            "https://blog.example.com/news?a=1&b=2",
+            "https://docs.example.com/",
+            "https://docs.example.com/api",
+            "https://docs.example.com/guide",
+            "https://docs.example.com/guide/plugins",
+            "https://docs.example.com/missing",
+        ]
+        assert all(len({urlparse(url).netloc for url in batch}) == 1 for batch in crawler.batches)
+        assert len(result.files_downloaded) == 5
+        assert result.errors == []
+
+    def test_patterns_and_batches(self, tmp_path, crawler):
+        """Test that only matching links are followed and large levels are split into batches."""
+        result = sync(tmp_path, depth=5, patterns=["*/guide*"], batch_size=1)
+
+        assert crawler.batches == [
+            ["https://docs.example.com/"],
+            ["https://docs.example.com/guide"],
+            ["https://docs.example.com/guide/plugins"],
+            ["https://docs.example.com/guide/plugins/advanced"],
+        ]
+        assert len(result.files_downloaded) == 3
+
+    def test_exclude_patterns_prune_the_frontier(self, tmp_path, crawler):
+        """Test that links matching an exclude pattern are not crawled."""
+        sync(tmp_path, depth=5, patterns=["https://docs.example.com/*"], exclude_patterns=["*/missing", "*/api"])
+
+        fetched = sorted(url for batch in crawler.batches for url in batch)
+        assert fetched == [
+            "https://docs.example.com/",
+            "https://docs.example.com/guide",
+            "https://docs.example.com/guide/plugins",
+            "https://docs.example.com/guide/plugins/advanced",
+        ]
+
+
+class TestWebIncrementalSync:
+    """Test cases for revalidating previously crawled pages."""
+
+    def test_unchanged_pages_are_not_rendered(self, tmp_path, crawler):
+        """Test that only modified and failed pages are rendered again, following links of unchanged pages."""
+        sync(tmp_path, depth=2)
+        assert all(etag is None for _, etag in crawler.requests)
+        crawler.batches.clear()
+
+        crawler.versions["https://docs.example.com/guide/plugins"] = 1
+        crawler.markdown["https://docs.example.com/guide/plugins"] = "Plugins, updated"
+        second = sync(tmp_path, depth=2)
+
+        assert crawler.batches == [["https://docs.example.com/missing"], ["https://docs.example.com/guide/plugins"]]
+        assert ("https://docs.example.com/", '"0"') in crawler.requests
+        assert second.files_downloaded == [tmp_path / "docs" / "guide_plugins.md"]
+        assert len(second.files_unchanged) == 4
+        assert set(second.resources) == set(SITE)
+
+    def test_files_with_same_markdown_are_not_rewritten(self, tmp_path, crawler):
+        """Test that a page whose HTML changed but whose markdown did not keeps its file untouched."""
+        sync(tmp_path, depth=0)
+        index = tmp_path / "docs" / "index.md"
+        mtime = index.stat().st_mtime_ns
+
+        crawler.versions["https://docs.example.com/"] = 1
+        second = sync(tmp_path, depth=0)
+
+        assert crawler.batches[-1] == ["https://docs.example.com/"]
+        assert second.files_downloaded == []
+        assert second.files_unchanged == [index]
+        assert second.resources["https://docs.example.com/"].etag == '"1"'
+        assert index.stat().st_mtime_ns == mtime
+        assert second.success
+
+
+STATIC_PAGE = """
+<html><head><title>Guide</title><script>track()</script></head>
+<body><nav>Menu</nav><main><h1>Installing plugins</h1><p>{text}</p>
+<a href="/api#top">API</a> <a href="guide">Guide</a></main></body></html>
+"""
+SPA_SHELL = '<html><body><div id="root"></div><script src="/app.js"></script></body></html>'
+
+
+class TestStaticFetch:
+    """Test cases for converting static pages without the browser."""
+
+    def test_static_pages_skip_the_browser(self, tmp_path, crawler):
+        """Test that static HTML is converted in-process while app shells and js_patterns are rendered."""
+        crawler.static = {
+            "https://docs.example.com/": STATIC_PAGE.format(text="Plugins extend the portal. " * 20),
+            "https://docs.example.com/api": SPA_SHELL,
+            "https://docs.example.com/guide": STATIC_PAGE.format(text="Rendered by scripts. " * 20),
+        }
+
+        result = sync(tmp_path, depth=1, patterns=["*/api", "*/guide"], js_patterns=["*/guide"])
+
+        assert crawler.batches == [["https://docs.example.com/api", "https://docs.example.com/guide"]]
+        index = (tmp_path / "docs" / "index.md").read_text()
+        assert "# Installing plugins" in index
+        assert "Plugins extend the portal." in index
+        assert "Menu" not in index
+        assert "track()" not in index
+        assert result.resources["https://docs.example.com/"].links == [
+            "https://docs.example.com/api",
+            "https://docs.example.com/guide",
+        ]
+        assert len(result.files_downloaded) == 3
+
+    def test_static_site_never_starts_the_browser(self, tmp_path, crawler):
+        """Test that the browser crawler is only started when a page needs rendering."""
+        crawler.static = {"https://docs.example.com/": STATIC_PAGE.format(text="Plugins extend the portal. " * 20)}
+
+        result = sync(tmp_path, depth=0)
+
+        assert crawler.started == 0
+        assert result.files_downloaded == [tmp_path / "docs" / "index.md"]
+
+
+class TestCrawlCheckpoint:
+    """Test cases for resuming interrupted crawls."""
+
+    def test_interrupted_crawl_resumes_from_checkpoint(self, tmp_path, crawler):
+        """Test that an interrupted crawl leaves a checkpoint and resuming only crawls the remaining pages."""
+        crawler.interrupt_at = "https://docs.example.com/api"
+        with pytest.raises(KeyboardInterrupt):
+            sync(tmp_path, depth=2, batch_size=1)
+
+        checkpoint = tmp_path / "docs" / ".crawl-checkpoint.json"
+        assert checkpoint.exists()
+        assert crawler.batches == [["https://docs.example.com/"], ["https://docs.example.com/guide"]]
+
+        crawler.interrupt_at = None
+        crawler.batches.clear()
+        result = sync(tmp_path, resume=True, depth=2, batch_size=1)
+
+        assert sorted(url for batch in crawler.batches for url in batch) == [
+            "https://blog.example.com/news?a=1&b=2",
+            "https://docs.example.com/api",
+            "https://docs.example.com/guide/plugins",
+            "https://docs.example.com/missing",
+        ]
+        assert len(result.files_downloaded) == 5
+        assert not checkpoint.exists()
+
+    def test_checkpoint_is_ignored_without_resume(self, tmp_path, crawler):
+        """Test that a sync without resume starts over from the start URLs."""
+        crawler.interrupt_at = "https://docs.example.com/guide"
+        with pytest.raises(KeyboardInterrupt):
+            sync(tmp_path, depth=1)
+
+        crawler.interrupt_at = None
+        crawler.batches.clear()
+        sync(tmp_path, depth=1)
+
+        assert crawler.batches[0] == ["https://docs.example.com/"]
+        assert not (tmp_path / "docs" / ".crawl-checkpoint.json").exists()